@@ -0,0 +1,142 @@
+"""
+기술 스택 매칭기 마이크로 벤치마크
+Posts.xml 샘플에서 Question을 읽어 기존 토큰 인덱스 방식(단일/다중 인덱스 + 리스트 슬라이싱)과
+TechMatcher(토큰 단위 Aho–Corasick)의 초당 처리 게시글 수를 비교하고, 두 결과가 같은지 검증합니다.
+"""
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from apps.trends.models import TechStack
+from apps.trends.matcher import TechMatcher, TOKEN_RE, is_noise_tech, normalize_tech_name
+from apps.analytics.stackoverflow import (
+    iter_posts, load_techs_from_csv, normalize_post_text,
+)
+
+
+def legacy_tokens_match(tech_tokens: list[str], post_tokens: list[str]) -> bool:
+    """기존 방식: tech 토큰 시퀀스가 post_tokens에 연속으로 등장하는지 슬라이싱으로 확인 (비교용)"""
+    L = len(tech_tokens)
+    if L > len(post_tokens):
+        return False
+    for i in range(len(post_tokens) - L + 1):
+        if post_tokens[i:i + L] == tech_tokens:
+            return True
+    return False
+
+
+def build_legacy_index(techs: list[str]):
+    """기존 build_tech_index와 동일한 단일/다중 토큰 인덱스 (비교용)"""
+    single_index = defaultdict(list)
+    multi_index = defaultdict(list)
+    tech_tokens_map = {}
+    for tech in techs:
+        tokens = TOKEN_RE.findall(tech)
+        if not tokens:
+            continue
+        tech_tokens_map[tech] = tokens
+        if len(tokens) == 1:
+            single_index[tokens[0]].append(tech)
+        else:
+            multi_index[tokens[0]].append(tech)
+    return single_index, multi_index, tech_tokens_map
+
+
+def legacy_match(index, post_tokens: list[str]) -> set:
+    single_index, multi_index, tech_tokens_map = index
+    post_tok_set = set(post_tokens)
+    seen = set()
+    for tok in post_tok_set:
+        for tech in single_index.get(tok, []):
+            seen.add(tech)
+    for tok in post_tok_set:
+        for tech in multi_index.get(tok, []):
+            if tech in seen:
+                continue
+            # 기존 코드는 매칭될 때마다 노이즈 여부를 다시 확인했음
+            if is_noise_tech(tech):
+                continue
+            if legacy_tokens_match(tech_tokens_map[tech], post_tokens):
+                seen.add(tech)
+    return seen
+
+
+class Command(BaseCommand):
+    help = '기술 스택 매칭 방식(기존 토큰 인덱스 vs Aho–Corasick) 처리량 비교 (Posts.xml 샘플 사용)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', required=True, help='Posts.xml 샘플 경로')
+        parser.add_argument('--stacks', default=None, help='기술 스택 CSV (Name 컬럼). 생략 시 DB의 TechStack 사용')
+        parser.add_argument('--limit', type=int, default=20000, help='벤치마크할 Question 수 (기본값: 20000)')
+        parser.add_argument('--repeat', type=int, default=3, help='반복 측정 횟수, 가장 빠른 값 사용 (기본값: 3)')
+
+    def handle(self, *args, **options):
+        posts_path = Path(options['posts'])
+        if not posts_path.exists():
+            self.stdout.write(self.style.ERROR(f"❌ Posts.xml 파일을 찾을 수 없습니다: {posts_path}"))
+            return
+
+        if options['stacks']:
+            names = load_techs_from_csv(Path(options['stacks']))
+        else:
+            names = [normalize_tech_name(n) for n in TechStack.objects.filter(is_deleted=False).values_list('name', flat=True)]
+        techs = [t for t in dict.fromkeys(names) if t and not is_noise_tech(t)]
+        if not techs:
+            self.stdout.write(self.style.ERROR("❌ 기술 스택 데이터가 없습니다."))
+            return
+
+        # 파싱 비용은 제외하고 매칭만 측정하도록 게시글 토큰을 미리 준비
+        samples = []
+        for _, post_type, title, body, tags, _, _ in iter_posts(posts_path):
+            if post_type != "1":
+                continue
+            samples.append(TOKEN_RE.findall(normalize_post_text(title, body, tags)))
+            if len(samples) >= options['limit']:
+                break
+        if not samples:
+            self.stdout.write(self.style.ERROR("❌ Question 게시글이 없습니다."))
+            return
+
+        started = time.perf_counter()
+        legacy_index = build_legacy_index(techs)
+        legacy_build = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matcher = TechMatcher(((t, t) for t in techs), filter_noise=False)
+        matcher_build = time.perf_counter() - started
+
+        # 결과 동일성 검증
+        mismatches = 0
+        for tokens in samples:
+            if legacy_match(legacy_index, tokens) != matcher.match_tokens(tokens):
+                mismatches += 1
+
+        def measure(fn):
+            best = None
+            for _ in range(max(1, options['repeat'])):
+                started = time.perf_counter()
+                for tokens in samples:
+                    fn(tokens)
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            return best
+
+        legacy_sec = measure(lambda tokens: legacy_match(legacy_index, tokens))
+        matcher_sec = measure(matcher.match_tokens)
+
+        total_tokens = sum(len(t) for t in samples)
+        self.stdout.write(f"📊 기술 {len(techs):,}개 | Question {len(samples):,}개 (평균 토큰 {total_tokens / len(samples):,.0f}개)")
+        self.stdout.write(
+            f"  legacy       {len(samples) / legacy_sec:>12,.0f} posts/s ({legacy_sec:.3f}s, 인덱스 생성 {legacy_build * 1000:.1f}ms)"
+        )
+        self.stdout.write(
+            f"  aho-corasick {len(samples) / matcher_sec:>12,.0f} posts/s ({matcher_sec:.3f}s, 컴파일 {matcher_build * 1000:.1f}ms)"
+        )
+
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"❌ 매칭 결과가 다른 게시글 {mismatches:,}개"))
+        else:
+            self.stdout.write(self.style.SUCCESS("✅ 두 방식의 매칭 결과가 모두 동일합니다."))
+        self.stdout.write(self.style.SUCCESS(f"✅ Aho–Corasick 방식이 {legacy_sec / matcher_sec:.1f}배 빠릅니다."))
@@ -0,0 +1,193 @@
+"""
+StackOverflow Posts.xml 단일 패스 수집
+덤프를 한 번만 읽고 게시글마다 한 번만 매칭한 결과로 아래 세 가지를 함께 만듭니다.
+
+- Article / ArticleStack 저장 (analyze_stackoverflow --save-db와 동일)
+- 날짜별 기술 언급량 -> tech_trend.article_mention_count, article_change_rate (generate_article_trends와 동일)
+- 기술별 언급 수/조회수 CSV 리포트 (analyze_stackoverflow --out과 동일)
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone as django_timezone
+
+from apps.trends.models import TechStack, TechTrend
+from apps.trends.matcher import TechMatcher, is_noise_tech, normalize_tech_name
+from apps.trends.writers import ArticleWriter, save_article_trends
+from apps.analytics.stackoverflow import (
+    PostScanStats, in_date_range, iter_posts, iter_scan_shards, load_techs_from_csv, match_post,
+    write_tech_report,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Posts.xml을 한 번만 읽어 Article/ArticleStack 저장, 날짜별 tech_trend 게시글 지표 갱신, '
+        '기술별 CSV 리포트 생성을 함께 수행합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--posts', required=True, help='Posts.xml 파일 경로')
+        parser.add_argument('--stacks', default='', help='기술 스택 CSV (Name 컬럼). 지정 시 CSV와 DB에 모두 있는 기술만 사용')
+        parser.add_argument('--out', default='', help='기술별 언급 수/조회수 CSV 경로 (생략 시 리포트 생성 안 함)')
+        parser.add_argument('--with-top-posts', action='store_true', help='CSV에 기술별 조회수 상위 게시글(top_posts) 컬럼 추가')
+        parser.add_argument('--topn', type=int, default=10, help='기술별 상위 게시글 수 (기본값: 10)')
+        parser.add_argument('--from-date', default='', help='이 날짜부터의 게시글만 처리 (YYYY-MM-DD)')
+        parser.add_argument('--to-date', default='', help='이 날짜까지의 게시글만 처리 (YYYY-MM-DD, 기본값: 오늘)')
+        parser.add_argument('--days', type=int, default=None, help='오늘 기준 최근 N일 게시글만 처리 (--from-date/--to-date 대신 사용)')
+        parser.add_argument('--workers', type=int, default=1, help='Posts.xml을 N개 프로세스로 나누어 스캔 (기본값: 1)')
+        parser.add_argument('--progress', type=int, default=10000, help='진행 상황 출력 간격 (기본값: 10000개)')
+        parser.add_argument('--skip-articles', action='store_true', help='Article/ArticleStack 저장 생략')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Article/ArticleStack 일괄 저장 단위 (기본값: 1000개)')
+        parser.add_argument('--copy', action='store_true', help='PostgreSQL에서 COPY + 스테이징 테이블로 Article/ArticleStack 적재')
+        parser.add_argument('--skip-trends', action='store_true', help='tech_trend 게시글 지표 갱신 생략')
+        parser.add_argument(
+            '--clear-existing',
+            action='store_true',
+            help='저장 전 기존 article_mention_count, article_change_rate 데이터를 모두 0으로 초기화'
+        )
+
+    def handle(self, *args, **options):
+        posts_path = Path(options['posts']).expanduser()
+        out_opt = (options['out'] or '').strip()
+        with_top_posts = options['with_top_posts']
+        topn = options['topn']
+        workers = max(1, options['workers'])
+        progress = options['progress']
+        save_articles = not options['skip_articles']
+        save_trends = not options['skip_trends']
+
+        if not posts_path.exists():
+            self.stdout.write(self.style.ERROR(f"❌ 파일을 찾을 수 없습니다: {posts_path}"))
+            return
+
+        # 날짜 범위
+        try:
+            from_date, to_date = self.resolve_date_range(options)
+        except ValueError as e:
+            self.stdout.write(self.style.ERROR(f"❌ {e}"))
+            return
+
+        # 1. 기술 어휘 로드 (payload = 표준화된 기술명, DB ID로 변환해 저장)
+        tech_ids = {}
+        for tech_id, name in TechStack.objects.filter(is_deleted=False).order_by('id').values_list('id', 'name'):
+            tech = normalize_tech_name(name)
+            if tech and not is_noise_tech(tech):
+                tech_ids.setdefault(tech, tech_id)
+
+        if options['stacks']:
+            stacks_path = Path(options['stacks']).expanduser()
+            if not stacks_path.exists():
+                self.stdout.write(self.style.ERROR(f"❌ 기술 스택 CSV를 찾을 수 없습니다: {stacks_path}"))
+                return
+            techs = [t for t in load_techs_from_csv(stacks_path) if t in tech_ids]
+        else:
+            techs = list(tech_ids)
+
+        if not techs:
+            self.stdout.write(self.style.ERROR("❌ 매칭할 기술 스택이 없습니다. 먼저 TechStack을 등록하세요."))
+            return
+
+        self.stdout.write(f"📁 Posts.xml: {posts_path}")
+        self.stdout.write(f"📅 기간: {from_date or '전체'} ~ {to_date or '전체'}")
+        self.stdout.write(f"✅ {len(techs)}개 기술 스택 로드 완료")
+
+        stats_options = {
+            'topn': topn,
+            'with_top_posts': with_top_posts,
+            'track_daily': save_trends,
+            'keep_matches': save_articles and workers > 1,
+        }
+
+        # 2. 단일 패스 스캔 (매칭 결과를 Article 저장, 날짜별 집계, 리포트 집계가 함께 사용)
+        self.stdout.write(f"📖 Posts.xml 파싱 중... (workers={workers})")
+        # 매칭된 게시글은 버퍼에 모았다가 batch_size 건마다 일괄 저장
+        writer = ArticleWriter(batch_size=options['batch_size'], use_copy=options['copy']) if save_articles else None
+        if workers > 1:
+            stats = PostScanStats(**stats_options)
+            for shard in iter_scan_shards(posts_path, techs, workers, from_date, to_date, stats_options):
+                # 샤드 순서대로 받아 바로 저장하므로 매칭 결과 전체를 메모리에 쌓지 않음
+                if writer:
+                    for post_id, view_count, created_at, seen in shard.matches:
+                        writer.add(post_id, view_count, created_at, [tech_ids[t] for t in seen])
+                    shard.matches = []
+                stats.merge(shard)
+                self.stdout.write(f"  처리: {stats.scanned:,}개...")
+        else:
+            stats = PostScanStats(**stats_options)
+            matcher = TechMatcher(((t, t) for t in techs), filter_noise=False)
+            for post_id, post_type, title, body, tags, view_count, created_at in iter_posts(posts_path):
+                # Question만 처리 (PostTypeId == "1")
+                if post_type != "1":
+                    continue
+                if not in_date_range(created_at, from_date, to_date):
+                    continue
+
+                stats.scanned += 1
+                seen = match_post(matcher, title, body, tags)
+                stats.add(post_id, title, tags, view_count, created_at, seen)
+
+                if writer and seen:
+                    writer.add(post_id, view_count, created_at, [tech_ids[t] for t in seen])
+
+                if progress and stats.scanned % progress == 0:
+                    self.stdout.write(f"  처리: {stats.scanned:,}개...")
+
+        self.stdout.write(f"✅ {stats.scanned:,}개 Question 처리 완료")
+        if writer:
+            writer.close()
+            self.stdout.write(
+                f"💾 기술이 매칭된 게시글 {writer.saved_count:,}개 저장 완료 (새 기술 연결 {writer.linked_count:,}개)"
+            )
+
+        # 3. tech_trend 게시글 지표 저장
+        if save_trends:
+            if options['clear_existing']:
+                self.stdout.write("🗑️  기존 article_mention_count, article_change_rate 데이터 삭제 중...")
+                deleted_count = TechTrend.objects.filter(
+                    article_mention_count__gt=0
+                ).update(
+                    article_mention_count=0,
+                    article_change_rate=0.0
+                )
+                self.stdout.write(f"✅ {deleted_count:,}개 레코드의 게시글 데이터 삭제 완료")
+
+            daily_counts = {
+                day: {tech_ids[tech]: count for tech, count in counts.items()}
+                for day, counts in stats.daily_counts.items()
+            }
+            created_count, updated_count = save_article_trends(daily_counts)
+            self.stdout.write(
+                f"📊 tech_trend {len(daily_counts)}일치 저장 (생성: {created_count:,}개, 업데이트: {updated_count:,}개)"
+            )
+
+        # 4. CSV 리포트
+        if out_opt:
+            out_path = Path(out_opt).expanduser()
+            write_tech_report(out_path, techs, stats, with_top_posts)
+            self.stdout.write(f"📄 리포트 저장: {out_path}")
+
+        self.stdout.write(self.style.SUCCESS("✅ 완료!"))
+
+    def resolve_date_range(self, options):
+        """--days 또는 --from-date/--to-date로 (시작일, 종료일) 계산"""
+        if options['days']:
+            to_date = django_timezone.now().date()
+            return to_date - timedelta(days=options['days'] - 1), to_date
+
+        from_date = None
+        to_date = django_timezone.now().date()
+        if options['from_date']:
+            try:
+                from_date = datetime.fromisoformat(options['from_date']).date()
+            except ValueError:
+                raise ValueError(f"잘못된 --from-date 형식입니다: {options['from_date']} (YYYY-MM-DD)")
+        if options['to_date']:
+            try:
+                to_date = datetime.fromisoformat(options['to_date']).date()
+            except ValueError:
+                raise ValueError(f"잘못된 --to-date 형식입니다: {options['to_date']} (YYYY-MM-DD)")
+        if from_date and from_date > to_date:
+            raise ValueError(f"--from-date ({from_date})는 --to-date ({to_date}) 이전이어야 합니다")
+        return from_date, to_date
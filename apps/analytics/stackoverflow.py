@@ -0,0 +1,457 @@
+"""
+StackOverflow Posts.xml 파싱/집계 유틸리티
+analyze_stackoverflow, ingest_stackoverflow, generate_article_trends 명령이 공통으로 사용합니다.
+
+- Posts.xml 스트리밍 파싱 (iter_posts)
+- 파일을 <row 경계에 맞춘 바이트 구간(샤드)으로 나누어 프로세스 풀에서 병렬 스캔 (iter_scan_shards)
+- 샤드별 집계(PostScanStats)를 합쳐도 순차 스캔과 같은 결과가 나오도록 병합
+- 집계 결과 CSV 리포트 저장
+"""
+import csv
+import heapq
+import multiprocessing
+import re
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timezone
+from pathlib import Path
+from xml.etree.ElementTree import iterparse
+
+from django.db import connections
+
+from apps.trends.matcher import TechMatcher, TOKEN_RE, normalize_spaces, normalize_tech_name
+
+
+# <row 요소 시작 위치 (속성값 안의 '<'는 &lt;로 이스케이프되므로 요소 시작에만 등장)
+ROW_START_RE = re.compile(rb"<row[\s/>]")
+ROOT_END = b"</posts>"
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+# xml 태그 표준화
+def normalize_tags(tags: str) -> str:
+    t = tags or ""
+    if "|" in t:
+        # |tag|tag| 형태
+        return normalize_spaces(t.replace("|", " "))
+    # <tag><tag> 형태
+    return normalize_spaces(t.replace("><", "> <").replace("<", " ").replace(">", " "))
+
+
+# xml 게시글 텍스트 표준화
+def normalize_post_text(title: str, body: str, tags: str) -> str:
+    tags_clean = normalize_tags(tags)
+    text = f"{title or ''} {body or ''} {tags_clean}"
+    return normalize_spaces(text).lower()
+
+
+# tech_stacks_source.csv 로드
+def load_techs_from_csv(csv_path: Path) -> list[str]:
+    """Name 컬럼만 읽어서 기술 목록 생성"""
+    techs: list[str] = []
+    with csv_path.open("r", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        fields = reader.fieldnames or []
+        col = "Name" if "Name" in fields else ("name" if "name" in fields else None)
+        if not col:
+            raise ValueError(f"CSV must contain a 'Name' column. Found: {fields}")
+
+        for row in reader:
+            tech = normalize_tech_name(row.get(col) or "")
+            if tech:
+                techs.append(tech)
+
+    # 중복 제거 (순서 유지)
+    seen = set()
+    uniq = []
+    for t in techs:
+        if t not in seen:
+            uniq.append(t)
+            seen.add(t)
+    return uniq
+
+
+# CreationDate -> datetime(UTC)
+def parse_creation_dt(s: str) -> datetime | None:
+    if not s:
+        return None
+    try:
+        dt = datetime.fromisoformat(s)
+        if dt.tzinfo is None:
+            return dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
+    except ValueError:
+        return None
+
+
+# XML 스트리밍 파싱 (경로 또는 파일 객체)
+def iter_posts(source):
+    context = iterparse(source, events=("end",))
+    try:
+        for _, elem in context:
+            if elem.tag != "row":
+                continue
+
+            a = elem.attrib
+            post_id = a.get("Id") or ""
+            post_type = a.get("PostTypeId") or ""  # 1=Question, 2=Answer
+            title = a.get("Title") or ""
+            body = a.get("Body") or ""
+            tags = a.get("Tags") or ""
+            view_count_raw = a.get("ViewCount") or "0"
+            created_raw = a.get("CreationDate") or ""
+
+            try:
+                view_count = int(view_count_raw)
+            except ValueError:
+                view_count = 0
+
+            created_at = parse_creation_dt(created_raw)
+
+            # 메모리 방지
+            elem.clear()
+
+            yield post_id, post_type, title, body, tags, view_count, created_at
+    except Exception as e:
+        print(f"Warning: XML parsing error occurred (file may be incomplete): {e}", file=sys.stderr)
+        print("Processed data up to the error point will be used.", file=sys.stderr)
+
+
+def in_date_range(created_at: datetime | None, from_date: date | None, to_date: date | None) -> bool:
+    """날짜 필터 (작성일이 없는 게시글은 통과)"""
+    if created_at is None:
+        return True
+    created_date = created_at.date()
+    if from_date and created_date < from_date:
+        return False
+    if to_date and created_date > to_date:
+        return False
+    return True
+
+
+def match_post(matcher: TechMatcher, title: str, body: str, tags: str) -> set:
+    """게시글 제목/본문/태그에서 매칭된 payload 집합"""
+    return matcher.match_tokens(TOKEN_RE.findall(normalize_post_text(title, body, tags)))
+
+
+class PostScanStats:
+    """
+    Question 스캔 집계 결과
+    샤드별로 따로 집계한 뒤 merge()로 합치면 순차 스캔 결과와 같아집니다.
+    (합계는 순서 무관, topN은 (view_count, post_id, title) 전순서 기준 상위 N개, posts-out 행은 샤드 순서대로 이어붙임)
+
+    track_daily: 작성일별 기술 언급 게시글 수 집계 (TechTrend.article_mention_count용)
+    keep_matches: 매칭된 게시글 (post_id, view_count, created_at, 기술 목록) 보관 (Article 저장용)
+    """
+
+    def __init__(
+        self,
+        topn: int = 10,
+        with_top_posts: bool = False,
+        detail_tech: str = "",
+        keep_posts: bool = False,
+        track_daily: bool = False,
+        keep_matches: bool = False,
+    ):
+        self.topn = topn
+        self.with_top_posts = with_top_posts
+        self.detail_tech = detail_tech
+        self.keep_posts = keep_posts
+        self.track_daily = track_daily
+        self.keep_matches = keep_matches
+
+        self.scanned = 0
+        self.mention_count = defaultdict(int)      # tech -> 언급된 게시글 수
+        self.total_views = defaultdict(int)        # tech -> 조회수 누적 합
+        self.top_posts_by_tech = defaultdict(list) # tech -> heap(view_count, post_id, title)
+        self.detail_heap = []                      # heap(view_count, post_id, title)
+        self.posts_rows = []                       # posts-out rows
+        self.daily_counts: dict[date, Counter] = {}  # 작성일 -> Counter(tech -> 게시글 수)
+        self.matches = []                          # (post_id, view_count, created_at, techs)
+
+    def add(self, post_id: str, title: str, tags: str, view_count: int, created_at: datetime | None, seen: set):
+        """매칭이 끝난 Question 1건 반영 (scanned 증가는 호출하는 쪽에서 처리)"""
+        # posts-out: Question 전체를 저장
+        if self.keep_posts:
+            self.posts_rows.append({
+                "post_id": post_id,
+                "created_at": created_at.isoformat() if created_at else "",
+                "url": f"https://stackoverflow.com/questions/{post_id}",
+                "title": clean_title(title),
+                "view_count": view_count,
+                "tags": tags,
+                "_created_at_dt": created_at,
+            })
+
+        for tech in seen:
+            self.mention_count[tech] += 1
+            self.total_views[tech] += view_count
+
+        # 매칭된 tech가 없으면 이후 옵션 작업 스킵
+        if not seen:
+            return
+
+        # 작성일별 언급량 (작성일이 없는 게시글은 트렌드에서 제외)
+        if self.track_daily and created_at is not None:
+            self.daily_counts.setdefault(created_at.date(), Counter()).update(seen)
+
+        if self.keep_matches:
+            self.matches.append((post_id, view_count, created_at, tuple(seen)))
+
+        # 특정 기술(detail_tech)의 topN 유지 (조회수 기준)
+        if self.detail_tech and self.detail_tech in seen:
+            self._push(self.detail_heap, (view_count, post_id, title))
+
+        # tech별 topN 유지
+        if self.with_top_posts:
+            for tech in seen:
+                self._push(self.top_posts_by_tech[tech], (view_count, post_id, title))
+
+    def _push(self, heap: list, item: tuple):
+        heapq.heappush(heap, item)
+        if len(heap) > self.topn:
+            heapq.heappop(heap)
+
+    def merge(self, other: "PostScanStats"):
+        """다른 샤드의 집계를 합침 (other는 파일상 뒤쪽 샤드여야 posts-out/매칭 순서가 유지됨)"""
+        self.scanned += other.scanned
+        for tech, count in other.mention_count.items():
+            self.mention_count[tech] += count
+        for tech, views in other.total_views.items():
+            self.total_views[tech] += views
+        for tech, heap in other.top_posts_by_tech.items():
+            for item in heap:
+                self._push(self.top_posts_by_tech[tech], item)
+        for item in other.detail_heap:
+            self._push(self.detail_heap, item)
+        self.posts_rows.extend(other.posts_rows)
+        for day, counts in other.daily_counts.items():
+            self.daily_counts.setdefault(day, Counter()).update(counts)
+        self.matches.extend(other.matches)
+
+
+# ---- 샤드 분할 ----
+
+def _find_row_start(f, pos: int, limit: int) -> int:
+    """pos 이후 처음 등장하는 <row 위치 (없으면 limit)"""
+    overlap = 5  # "<row" + 구분 문자가 청크 경계에 걸치는 경우 대비
+    f.seek(pos)
+    offset = pos
+    tail = b""
+    while offset < limit:
+        chunk = f.read(min(READ_CHUNK_SIZE, limit - offset))
+        if not chunk:
+            break
+        buf = tail + chunk
+        m = ROW_START_RE.search(buf)
+        if m:
+            return offset - len(tail) + m.start()
+        tail = buf[-overlap:]
+        offset += len(chunk)
+    return limit
+
+
+def _find_body_end(f, size: int) -> int:
+    """루트 닫는 태그(</posts>) 위치 (잘린 파일이면 파일 끝)"""
+    tail_size = min(size, 64 * 1024)
+    f.seek(size - tail_size)
+    idx = f.read(tail_size).rfind(ROOT_END)
+    return size - tail_size + idx if idx >= 0 else size
+
+
+def split_posts_xml(posts_path: Path, shards: int) -> list[tuple[int, int]]:
+    """Posts.xml을 <row 경계에 맞춘 (시작, 끝) 바이트 구간 목록으로 분할 (파일 순서 유지)"""
+    size = posts_path.stat().st_size
+    with posts_path.open("rb") as f:
+        body_end = _find_body_end(f, size)
+        first = _find_row_start(f, 0, body_end)
+        bounds = [first]
+        for i in range(1, shards):
+            target = first + (body_end - first) * i // shards
+            bounds.append(max(bounds[-1], _find_row_start(f, target, body_end)))
+        bounds.append(body_end)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+class ShardReader:
+    """바이트 구간 [start, end)를 <posts> ... </posts>로 감싸 완전한 XML처럼 읽게 해주는 파일 객체"""
+
+    def __init__(self, path: Path, start: int, end: int):
+        self._file = path.open("rb")
+        self._file.seek(start)
+        self._remaining = end - start
+        self._prefix = b"<posts>"
+        self._suffix = ROOT_END
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._remaining + len(self._prefix) + len(self._suffix)
+        out = b""
+        if self._prefix:
+            out, self._prefix = self._prefix[:size], self._prefix[size:]
+        if len(out) < size and self._remaining > 0:
+            data = self._file.read(min(size - len(out), self._remaining))
+            self._remaining -= len(data)
+            if not data:
+                self._remaining = 0
+            out += data
+        if len(out) < size and self._remaining <= 0 and self._suffix:
+            need = size - len(out)
+            out, self._suffix = out + self._suffix[:need], self._suffix[need:]
+        return out
+
+    def close(self):
+        self._file.close()
+
+
+# ---- 프로세스 풀 워커 ----
+
+_worker_state: dict = {}
+
+
+def _init_scan_worker(techs: list[str], from_date: date | None, to_date: date | None, stats_options: dict):
+    # 매칭기는 워커마다 한 번만 컴파일
+    _worker_state["matcher"] = TechMatcher(((t, t) for t in techs), filter_noise=False)
+    _worker_state["dates"] = (from_date, to_date)
+    _worker_state["stats_options"] = stats_options
+
+
+def _scan_shard(shard: tuple[str, int, int]) -> PostScanStats:
+    path, start, end = shard
+    matcher = _worker_state["matcher"]
+    from_date, to_date = _worker_state["dates"]
+
+    stats = PostScanStats(**_worker_state["stats_options"])
+    reader = ShardReader(Path(path), start, end)
+    try:
+        for post_id, post_type, title, body, tags, view_count, created_at in iter_posts(reader):
+            if post_type != "1":
+                continue
+            if not in_date_range(created_at, from_date, to_date):
+                continue
+            stats.scanned += 1
+            stats.add(post_id, title, tags, view_count, created_at, match_post(matcher, title, body, tags))
+    finally:
+        reader.close()
+    return stats
+
+
+def iter_scan_shards(
+    posts_path: Path,
+    techs: list[str],
+    workers: int,
+    from_date: date | None = None,
+    to_date: date | None = None,
+    stats_options: dict | None = None,
+):
+    """
+    Posts.xml을 샤드로 나누어 프로세스 풀에서 스캔하고, 샤드별 PostScanStats를 파일 순서대로 반환
+    (호출하는 쪽에서 샤드 결과를 바로 소비/병합하므로 매칭 결과 전체를 메모리에 쌓지 않음)
+    stats_options: PostScanStats 생성 인자 (topn, with_top_posts, detail_tech, keep_posts, track_daily, keep_matches)
+    """
+    # 샤드를 워커 수보다 잘게 나누어 구간별 게시글 밀도 차이로 인한 대기 시간을 줄임
+    shards = split_posts_xml(posts_path, workers * 4)
+
+    # fork 전에 DB 연결을 닫아 자식 프로세스가 부모의 연결을 공유하지 않도록 함
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_scan_worker,
+        initargs=(techs, from_date, to_date, stats_options or {}),
+    ) as pool:
+        # map은 제출 순서대로 결과를 돌려주므로 항상 파일 순서와 같음
+        yield from pool.map(_scan_shard, [(str(posts_path), s, e) for s, e in shards])
+
+
+# ---- 리포트 저장 ----
+
+def clean_title(title: str) -> str:
+    return normalize_spaces(title).replace("\n", " ").replace("\r", " ")
+
+
+def write_posts_report(path: Path, stats: PostScanStats, order: str = ""):
+    """posts-out CSV 저장 (order: views=조회수 내림차순, date=작성일 내림차순, 빈 값=스캔 순서)"""
+    rows = stats.posts_rows
+    if order == "views":
+        rows.sort(key=lambda r: int(r.get("view_count") or 0), reverse=True)
+    elif order == "date":
+        rows.sort(
+            key=lambda r: (
+                r.get("_created_at_dt") is not None,
+                r.get("_created_at_dt") or datetime.min.replace(tzinfo=timezone.utc),
+            ),
+            reverse=True,
+        )
+
+    for r in rows:
+        r.pop("_created_at_dt", None)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as pf:
+        # 🐶 [MOD] windows 컬럼 추가
+        pw = csv.DictWriter(
+            pf,
+            fieldnames=["post_id", "created_at", "url", "title", "view_count", "tags", "windows"],
+        )
+        pw.writeheader()
+        pw.writerows(rows)
+
+
+def write_tech_report(path: Path, techs: list[str], stats: PostScanStats, with_top_posts: bool = False):
+    """기술별 언급 수/조회수 CSV 저장 (조회수 합 내림차순)"""
+    rows = []
+    for tech in techs:
+        m = stats.mention_count[tech]
+        v = stats.total_views[tech]
+        row = {
+            "tech": tech,
+            "mentions": m,
+            "total_views": v,
+            "avg_views_per_mention": (v / m) if m else 0,
+        }
+
+        if with_top_posts:
+            heap = stats.top_posts_by_tech.get(tech, [])
+            top_posts = sorted(heap, reverse=True)
+            parts = []
+            for vc, pid, t in top_posts:
+                url = f"https://stackoverflow.com/questions/{pid}"
+                parts.append(f"{vc}|{url}|{clean_title(t)}")
+            row["top_posts"] = " ; ".join(parts)
+
+        rows.append(row)
+
+    rows.sort(key=lambda r: r["total_views"], reverse=True)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fieldnames = ["tech", "mentions", "total_views", "avg_views_per_mention"]
+    if with_top_posts:
+        fieldnames.append("top_posts")
+
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def write_detail_report(path: Path, detail_tech: str, stats: PostScanStats):
+    """특정 기술의 조회수 상위 게시글 CSV 저장"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    detail_rows = []
+    for vc, pid, t in sorted(stats.detail_heap, reverse=True):
+        detail_rows.append({
+            "tech": detail_tech,
+            "post_id": pid,
+            "url": f"https://stackoverflow.com/questions/{pid}",
+            "view_count": vc,
+            "title": clean_title(t),
+        })
+
+    with path.open("w", newline="", encoding="utf-8") as df:
+        dw = csv.DictWriter(df, fieldnames=["tech", "post_id", "url", "view_count", "title"])
+        dw.writeheader()
+        dw.writerows(detail_rows)
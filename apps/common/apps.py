@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class CommonConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.common'
+    verbose_name = '공통'
+
+    def ready(self):
+        # 웹 프로세스의 /metrics에 백그라운드 작업 지표 노출
+        from apps.common.metrics import register_task_run_collector
+        register_task_run_collector()
@@ -0,0 +1,203 @@
+"""
+세대(generation) 기반 캐시 네임스페이스
+도메인(네임스페이스)마다 세대 번호를 Redis에 두고 모든 캐시 키에 포함시킵니다.
+무효화는 해당 네임스페이스의 세대 번호를 INCR 한 번 올리는 것으로 끝나며,
+이전 세대의 키는 더 이상 조회되지 않고 TTL이 지나면 자연히 사라집니다. (KEYS 패턴 스캔 불필요)
+
+사용 예:
+    key = cache_key(NS_TECHSTACK, 'list', search, name, ordering, page)
+    # -> 'techstack:g1737000000000:list:...'
+    key = cache_key((NS_TECHSTACK, NS_TRENDS), 'top5', '90days')
+    # -> 두 네임스페이스 중 하나만 무효화돼도 새 키가 됨
+
+    bump_generation(NS_TECHSTACK, NS_JOBS_STATS)
+
+캐시 스탬피드 방지 (cached_computation):
+    - single-flight: 값을 다시 계산하는 워커는 Redis 락(cache.add)을 잡은 하나뿐
+    - stale-while-revalidate: 락을 못 잡은 워커는 만료된 값(또는 무효화 직전 세대의 마지막 값)을 바로 응답
+    - 확률적 조기 갱신(XFetch): 만료 직전에는 계산 시간에 비례한 확률로 미리 재계산해 만료 시점이 몰리지 않게 함
+"""
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+from django.core.cache import cache
+
+from .metrics import CACHE_COMPUTE_SECONDS, CACHE_LOCK_WAIT_SECONDS, CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+NS_TECHSTACK = 'techstack'      # 기술 스택 목록/상세 (job_stack_count, article_stack_count 포함)
+NS_TRENDS = 'trends'            # tech_trend 기반 집계 (Top 5 언급량, 트렌드 목록)
+NS_JOBS_STATS = 'jobs-stats'    # 대시보드 기업/공고 수
+NS_JOBS_MAP = 'jobs-map'        # 채용 지도 타일 (기업 마커/클러스터)
+NS_CATEGORIES = 'categories'    # 카테고리 목록
+
+CACHE_NAMESPACES = (NS_TECHSTACK, NS_TRENDS, NS_JOBS_STATS, NS_JOBS_MAP, NS_CATEGORIES)
+
+GENERATION_KEY = 'cache:generation:{namespace}'
+
+_local = threading.local()
+
+
+def _generation_key(namespace: str) -> str:
+    if namespace not in CACHE_NAMESPACES:
+        raise ValueError(f"알 수 없는 캐시 네임스페이스입니다: {namespace}")
+    return GENERATION_KEY.format(namespace=namespace)
+
+
+def _initial_generation() -> int:
+    # 세대 키가 사라졌다가(eviction, FLUSHDB) 다시 만들어져도 이전 세대 번호와 겹치지 않도록 현재 시각(ms)에서 시작
+    return int(time.time() * 1000)
+
+
+def get_generations(namespaces) -> dict:
+    """네임스페이스별 현재 세대 번호 (GET 1회, 없으면 새로 생성, pinned_generations 블록 안이면 고정된 번호)"""
+    pinned = getattr(_local, 'generations', {})
+    generations = {namespace: pinned[namespace] for namespace in namespaces if namespace in pinned}
+    keys = {namespace: _generation_key(namespace) for namespace in namespaces if namespace not in pinned}
+    if not keys:
+        return generations
+    found = cache.get_many(list(keys.values()))
+
+    for namespace, key in keys.items():
+        generation = found.get(key)
+        if generation is None:
+            # 동시에 여러 프로세스가 만들려고 해도 add는 하나만 성공하므로 다시 읽어서 사용
+            cache.add(key, _initial_generation(), timeout=None)
+            generation = cache.get(key)
+        generations[namespace] = generation
+    return generations
+
+
+@contextmanager
+def pinned_generations(generations: dict):
+    """
+    블록 안에서 cache_key()가 지정한 세대 번호를 쓰도록 고정 (현재 스레드만)
+    캐시 워밍이 다음 세대의 키를 미리 채운 뒤 bump_generation으로 한 번에 교체할 때 사용합니다.
+    """
+    previous = getattr(_local, 'generations', {})
+    _local.generations = {**previous, **generations}
+    try:
+        yield
+    finally:
+        _local.generations = previous
+
+
+def cache_key(namespaces, *parts) -> str:
+    """
+    네임스페이스의 현재 세대 번호를 포함한 캐시 키
+    namespaces: 네임스페이스 1개(str) 또는 여러 개(tuple). 여러 개면 그중 하나만 무효화돼도 키가 바뀜
+    """
+    if isinstance(namespaces, str):
+        namespaces = (namespaces,)
+    generations = get_generations(namespaces)
+    prefix = ':'.join(f"{namespace}:g{generations[namespace]}" for namespace in namespaces)
+    return ':'.join([prefix, *(str(part) for part in parts)])
+
+
+def bump_generation(*namespaces) -> dict:
+    """네임스페이스별 세대 번호를 INCR로 올려 기존 캐시를 한 번에 무효화하고, 새 세대 번호를 반환"""
+    generations = {}
+    for namespace in namespaces:
+        key = _generation_key(namespace)
+        try:
+            generations[namespace] = cache.incr(key)
+        except ValueError:
+            # 세대 키가 아직 없으면 새로 시작 (이전 키와 겹칠 일이 없으므로 그대로 무효화 효과)
+            cache.add(key, _initial_generation(), timeout=None)
+            generations[namespace] = cache.incr(key)
+    logger.info("캐시 세대 갱신: %s", generations)
+    return generations
+
+
+def _should_refresh(entry: dict, beta: float, now: float) -> bool:
+    """만료됐거나, XFetch 확률(계산 시간 * beta * -ln(rand))로 조기 갱신할 차례인지"""
+    early = entry['delta'] * beta * -math.log(1.0 - random.random()) if beta > 0 else 0.0
+    return now + early >= entry['expires_at']
+
+
+def _wait_for_value(key: str, wait_timeout: float, poll_interval: float = 0.05):
+    """락을 잡은 다른 워커가 값을 저장할 때까지 대기 (시간 초과 시 None)"""
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry
+    return None
+
+
+def cached_computation(
+    name: str,
+    namespaces,
+    parts: tuple,
+    compute,
+    timeout: int,
+    stale_timeout: int | None = None,
+    lock_timeout: int = 30,
+    wait_timeout: float = 5.0,
+    beta: float = 1.0,
+):
+    """
+    캐시에 있으면 반환하고, 없거나 만료됐으면 워커 하나만 compute()를 실행해 저장
+
+    name: 지표 라벨 (예: 'jobs_stats')
+    namespaces, parts: cache_key()와 동일
+    timeout: 값이 유효한 시간(초). 이후 stale_timeout(기본값: timeout)까지는 만료된 값을 대신 응답할 수 있음
+    lock_timeout: 계산 중인 워커가 죽어도 락이 풀리는 시간(초)
+    wait_timeout: 응답할 값이 전혀 없을 때 다른 워커의 계산을 기다리는 최대 시간(초), 초과 시 직접 계산
+    beta: 조기 갱신 강도 (0이면 조기 갱신 안 함)
+    """
+    if isinstance(namespaces, str):
+        namespaces = (namespaces,)
+    stale_timeout = timeout if stale_timeout is None else stale_timeout
+
+    key = cache_key(namespaces, *parts)
+    # 세대와 무관한 마지막 계산 값: 무효화 직후에도 새 세대가 계산되는 동안 이전 값을 응답하기 위함
+    latest_key = ':'.join(['latest', *namespaces, *(str(part) for part in parts)])
+
+    entries = cache.get_many([key, latest_key])
+    entry = entries.get(key)
+    now = time.time()
+    if entry is not None and not _should_refresh(entry, beta, now):
+        CACHE_REQUESTS.labels(name, 'hit').inc()
+        return entry['value']
+
+    lock_key = f'lock:{key}'
+    token = uuid.uuid4().hex
+    if not cache.add(lock_key, token, timeout=lock_timeout):
+        # 다른 워커가 계산 중: 가진 값이 있으면 그대로 응답
+        if entry is not None:
+            CACHE_REQUESTS.labels(name, 'hit' if now < entry['expires_at'] else 'stale').inc()
+            return entry['value']
+        if entries.get(latest_key) is not None:
+            CACHE_REQUESTS.labels(name, 'stale').inc()
+            return entries[latest_key]['value']
+
+        started = time.monotonic()
+        waited = _wait_for_value(key, wait_timeout)
+        CACHE_LOCK_WAIT_SECONDS.labels(name).observe(time.monotonic() - started)
+        if waited is not None:
+            CACHE_REQUESTS.labels(name, 'wait').inc()
+            return waited['value']
+        token = None  # 대기 시간 초과: 락 없이 직접 계산
+
+    CACHE_REQUESTS.labels(name, 'miss' if entry is None else 'refresh').inc()
+    try:
+        started = time.monotonic()
+        value = compute()
+        delta = time.monotonic() - started
+        CACHE_COMPUTE_SECONDS.labels(name).observe(delta)
+
+        entry = {'value': value, 'expires_at': time.time() + timeout, 'delta': delta}
+        cache.set_many({key: entry, latest_key: entry}, timeout=timeout + stale_timeout)
+    finally:
+        # 내가 잡은 락일 때만 해제 (lock_timeout이 지나 다른 워커가 잡은 락은 건드리지 않음)
+        if token is not None and cache.get(lock_key) == token:
+            cache.delete(lock_key)
+    return value
@@ -0,0 +1,100 @@
+"""
+커밋 시점 일괄 재계산 대상 기록기 (DirtySet)
+시그널/writer는 영향받은 ID만 스레드 로컬 집합에 기록(mark)하고,
+트랜잭션 커밋 시점(또는 가장 바깥 deferred() 블록이 끝날 때) flush 함수가 기록된 ID 전체를 한 번에 처리합니다.
+
+사용 예:
+    job_stack_counts = DirtySet('job_stack_count', ('stack_ids', 'posting_ids'), _recount)
+    job_stack_counts.mark('stack_ids', [1, 2])   # 커밋 시점에 _recount({'stack_ids': {1, 2}, 'posting_ids': set()})
+
+    with job_stack_counts.deferred():            # 블록 안에서는 기록만 하고, 끝날 때 한 번에 처리 (데코레이터로도 사용 가능)
+        ...
+
+사용처: apps.jobs.counters (TechStack.job_stack_count), apps.trends.membership (카테고리 소속)
+"""
+import logging
+import threading
+import weakref
+from contextlib import contextmanager
+
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+
+class DirtySet:
+    """
+    name: 로그에 남길 재계산 이름
+    kinds: 기록할 대상 종류 (예: ('stack_ids', 'posting_ids'))
+    flush_func: {종류: ID 집합}을 받아 재계산하는 함수 (반환값은 flush()가 그대로 반환)
+    """
+
+    def __init__(self, name: str, kinds, flush_func):
+        self.name = name
+        self.kinds = tuple(kinds)
+        self.flush_func = flush_func
+        self._local = threading.local()
+
+    def _state(self):
+        state = self._local
+        if not hasattr(state, 'ids'):
+            state.ids = {kind: set() for kind in self.kinds}
+            state.deferred = 0        # deferred() 중첩 깊이
+            state.scheduled = None    # 커밋 시점에 실행될 flush 콜백 (weakref, 예약 중복 방지)
+        return state
+
+    def mark(self, kind: str, ids) -> None:
+        """kind 종류의 ID들을 재계산 대상으로 기록하고, 지연 블록 밖이면 커밋 시점 flush를 예약"""
+        self._state().ids[kind].update(ids)
+        self._schedule_flush()
+
+    def take(self) -> dict:
+        """기록된 대상을 꺼내고 비움"""
+        state = self._state()
+        ids, state.ids = state.ids, {kind: set() for kind in self.kinds}
+        return ids
+
+    def clear(self) -> None:
+        """기록된 대상을 처리하지 않고 비움 (전체 재구성으로 이미 반영된 경우)"""
+        self.take()
+
+    def flush(self):
+        """기록된 대상을 지금 재계산"""
+        return self.flush_func(self.take())
+
+    def _flush_on_commit(self) -> None:
+        # 커밋 이후 실행되므로 실패해도 이미 커밋된 저장을 되돌리지 않고 로그만 남김
+        self._state().scheduled = None
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("%s 재계산 실패", self.name)
+
+    def _schedule_flush(self) -> None:
+        """지연 블록 밖이면 현재 트랜잭션 커밋 시점에 한 번만 flush 예약 (트랜잭션 밖이면 즉시 실행)"""
+        state = self._state()
+        if state.deferred or not any(state.ids.values()):
+            return
+        # 예약한 콜백은 Django의 커밋 대기 목록만 참조하므로, 롤백으로 목록이 버려지면 weakref도 함께 사라져 다시 예약됨
+        if state.scheduled is not None and state.scheduled() is not None:
+            return
+
+        def callback():
+            self._flush_on_commit()
+
+        state.scheduled = weakref.ref(callback)
+        transaction.on_commit(callback)
+
+    @contextmanager
+    def deferred(self):
+        """
+        블록 안에서는 기록만 하고, 가장 바깥 블록이 끝날 때 한 번에 flush 예약
+        (중첩 가능, 예외로 끝나도 이미 커밋된 저장분을 반영하도록 예약은 수행)
+        """
+        state = self._state()
+        state.deferred += 1
+        try:
+            yield
+        finally:
+            state.deferred -= 1
+            self._schedule_flush()
@@ -0,0 +1,113 @@
+"""
+애플리케이션 지표
+
+캐시 계산 지표 (cached_computation):
+    결과별 요청 수, 락 대기 시간, 재계산 시간을 웹 프로세스의 prometheus_client 지표로 바로 노출합니다.
+
+백그라운드 작업 지표:
+    Prometheus는 웹 서버(backend:8000)의 /metrics만 수집하고 Celery 워커는 다른 서버에서 돌기 때문에,
+    작업이 끝날 때 실행 결과(소요 시간, 처리 행 수)를 Redis 캐시에 기록하고
+    웹 프로세스에 등록한 커스텀 collector가 이를 읽어 /metrics로 노출합니다.
+
+사용 예:
+    with track_task_run('calculate_daily_trends') as rows:
+        ...
+        rows['upserted'] = len(trends)
+"""
+import logging
+import time
+from contextlib import contextmanager
+
+from django.core.cache import cache
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+
+logger = logging.getLogger(__name__)
+
+TASK_RUN_KEY = 'metrics:task_run:{name}'
+TASK_RUN_NAMES_KEY = 'metrics:task_run_names'
+
+# result: hit(유효한 캐시), stale(만료된 값 제공), wait(다른 워커의 계산을 기다림), miss(값이 없어 계산), refresh(만료/조기 갱신으로 재계산)
+CACHE_REQUESTS = Counter(
+    'teama_cache_requests_total', '캐시 계산 요청 수 (결과별)', ['cache', 'result'])
+CACHE_LOCK_WAIT_SECONDS = Histogram(
+    'teama_cache_lock_wait_seconds', '다른 워커의 계산 완료를 기다린 시간(초)', ['cache'])
+CACHE_COMPUTE_SECONDS = Histogram(
+    'teama_cache_compute_seconds', '캐시 값 계산에 걸린 시간(초)', ['cache'])
+
+
+def record_task_run(name: str, duration: float, rows: dict | None = None, success: bool = True) -> None:
+    """작업 1회 실행 결과 기록 (캐시 장애가 작업 실패로 이어지지 않도록 예외는 로그만 남김)"""
+    payload = {
+        'duration': duration,
+        'rows': dict(rows or {}),
+        'finished_at': time.time(),
+        'success': success,
+    }
+    try:
+        cache.set(TASK_RUN_KEY.format(name=name), payload, timeout=None)
+        names = cache.get(TASK_RUN_NAMES_KEY) or []
+        if name not in names:
+            cache.set(TASK_RUN_NAMES_KEY, sorted({*names, name}), timeout=None)
+    except Exception:
+        logger.warning("작업 지표 기록 실패: %s", name, exc_info=True)
+
+
+@contextmanager
+def track_task_run(name: str):
+    """블록 실행 시간을 재고, 블록 안에서 채운 rows(dict)와 함께 기록"""
+    rows = {}
+    started = time.perf_counter()
+    try:
+        yield rows
+    except Exception:
+        record_task_run(name, time.perf_counter() - started, rows, success=False)
+        raise
+    record_task_run(name, time.perf_counter() - started, rows)
+
+
+class TaskRunCollector:
+    """캐시에 기록된 작업 실행 결과를 Prometheus 지표로 변환"""
+
+    def collect(self):
+        duration = GaugeMetricFamily(
+            'teama_task_last_duration_seconds', '마지막 실행 소요 시간(초)', labels=['task'])
+        finished = GaugeMetricFamily(
+            'teama_task_last_run_timestamp_seconds', '마지막 실행 종료 시각(unix time)', labels=['task'])
+        success = GaugeMetricFamily(
+            'teama_task_last_run_success', '마지막 실행 성공 여부 (1=성공, 0=실패)', labels=['task'])
+        rows = GaugeMetricFamily(
+            'teama_task_last_rows', '마지막 실행에서 처리한 행 수', labels=['task', 'kind'])
+
+        try:
+            names = cache.get(TASK_RUN_NAMES_KEY) or []
+            runs = cache.get_many([TASK_RUN_KEY.format(name=name) for name in names])
+        except Exception:
+            logger.warning("작업 지표 조회 실패", exc_info=True)
+            return
+
+        for name in names:
+            run = runs.get(TASK_RUN_KEY.format(name=name))
+            if not run:
+                continue
+            duration.add_metric([name], run['duration'])
+            finished.add_metric([name], run['finished_at'])
+            success.add_metric([name], 1 if run['success'] else 0)
+            for kind, value in sorted(run['rows'].items()):
+                rows.add_metric([name, kind], value)
+
+        yield duration
+        yield finished
+        yield success
+        yield rows
+
+
+_collector = None
+
+
+def register_task_run_collector() -> None:
+    """기본 레지스트리에 collector를 한 번만 등록"""
+    global _collector
+    if _collector is None:
+        _collector = TaskRunCollector()
+        REGISTRY.register(_collector)
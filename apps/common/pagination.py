@@ -0,0 +1,54 @@
+"""
+전체 개수(count)를 캐시하는 페이지네이션
+페이지 번호 방식은 페이지마다 COUNT(*)를 다시 실행하므로, 조인/세미조인이 붙은 큰 목록에서는
+뷰가 get_count_cache_key()로 알려준 키에 개수를 저장해 두고 다른 페이지/정렬 요청에서 재사용합니다.
+(키에 세대 번호를 포함하면 무효화도 세대 교체로 함께 처리됨)
+뷰에 get_count_queryset()이 있으면 목록 쿼리 대신 그 쿼리셋으로 개수를 셉니다. (예: 조인 없는 소속 테이블 COUNT)
+"""
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+from rest_framework.pagination import PageNumberPagination
+
+
+class CachedCountPaginator(Paginator):
+    """count_key가 있으면 COUNT(*) 결과를 캐시에서 읽고, 없으면 계산 후 저장 (count_queryset이 있으면 그 개수 사용)"""
+
+    def __init__(self, object_list, per_page, count_key=None, count_timeout=600, count_queryset=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_key = count_key
+        self.count_timeout = count_timeout
+        self.count_queryset = count_queryset
+
+    def _count(self):
+        if self.count_queryset is not None:
+            return self.count_queryset.count()
+        return super().count
+
+    @cached_property
+    def count(self):
+        if self.count_key is None:
+            return self._count()
+        count = cache.get(self.count_key)
+        if count is None:
+            count = self._count()
+            cache.set(self.count_key, count, self.count_timeout)
+        return count
+
+
+class CachedCountPagination(PageNumberPagination):
+    """뷰에 get_count_cache_key()가 있으면 전체 개수를 캐시하는 PageNumberPagination"""
+    count_timeout = 60 * 10
+
+    def django_paginator_class(self, object_list, per_page):
+        return CachedCountPaginator(
+            object_list, per_page,
+            count_key=self.count_key, count_timeout=self.count_timeout, count_queryset=self.count_queryset,
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        get_count_cache_key = getattr(view, 'get_count_cache_key', None)
+        get_count_queryset = getattr(view, 'get_count_queryset', None)
+        self.count_key = get_count_cache_key() if get_count_cache_key else None
+        self.count_queryset = get_count_queryset() if get_count_queryset else None
+        return super().paginate_queryset(queryset, request, view)
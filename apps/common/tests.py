@@ -0,0 +1,163 @@
+import json
+from unittest import skipUnless
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import TestCase
+
+from apps.common.dirty import DirtySet
+from apps.jobs.models import Corp, JobPosting, JobPostingStack, effective_max_career
+from apps.resumes.models import Resume, ResumeMatching
+from apps.trends.models import Article, ArticleStack, TechStack
+
+
+def plan_index_names(node: dict) -> set[str]:
+    """EXPLAIN (FORMAT JSON) 계획 트리에서 사용된 인덱스 이름 전체"""
+    names = {node['Index Name']} if 'Index Name' in node else set()
+    for child in node.get('Plans', []):
+        names |= plan_index_names(child)
+    return names
+
+
+@skipUnless(connection.vendor == 'postgresql', 'PostgreSQL 실행 계획(EXPLAIN) 점검')
+class SoftDeleteIndexPlanTests(TestCase):
+    """
+    soft delete(is_deleted=False) 조건이 붙는 주요 조회 쿼리가 부분 인덱스를 사용하는지 EXPLAIN으로 점검
+    조회 조건은 각 뷰/작업과 같게 유지하며, 조건이 인덱스와 달라지거나 인덱스가 삭제되면 실패합니다.
+    테스트 DB는 비어 있어 플래너가 순차 스캔을 고르므로 enable_seqscan을 끄고 EXPLAIN 합니다.
+    """
+
+    def assertUsesIndex(self, queryset, index_name):
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = json.loads(queryset.explain(format='json'))[0]['Plan']
+        used = plan_index_names(plan)
+        self.assertIn(index_name, used, f"사용된 인덱스: {', '.join(sorted(used)) or '없음'}")
+
+    def test_job_posting_keyset_list(self):
+        self.assertUsesIndex(
+            JobPosting.objects.filter(is_deleted=False).order_by('-created_at', '-id')[:21],
+            'job_posting_created_id_idx',
+        )
+
+    def test_job_posting_career_filter(self):
+        self.assertUsesIndex(
+            JobPosting.objects.filter(is_deleted=False).alias(
+                max_career_bound=effective_max_career()
+            ).filter(min_career__lte=3, max_career_bound__gte=3),
+            'job_posting_career_idx',
+        )
+
+    def test_job_stack_count_recount(self):
+        # 빈 테이블에서는 외래키 인덱스와 비용이 같아지므로, 연결 대부분이 soft delete된 운영 분포를 만들고 통계를 갱신
+        corp = Corp.objects.create(name='플랜 테스트 기업')
+        stacks = TechStack.objects.bulk_create([TechStack(name=f'plan-stack-{i}') for i in range(3)])
+        postings = JobPosting.objects.bulk_create([
+            JobPosting(corp=corp, url=f'https://example.com/{i}', posting_number=i) for i in range(500)
+        ])
+        JobPostingStack.objects.bulk_create([
+            JobPostingStack(job_posting=posting, tech_stack=stack, is_deleted=i % 10 != 0)
+            for i, posting in enumerate(postings) for stack in stacks
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {JobPostingStack._meta.db_table}")
+
+        self.assertUsesIndex(
+            JobPostingStack.objects.filter(
+                tech_stack_id__in=[stack.id for stack in stacks], is_deleted=False
+            ).values('tech_stack_id').annotate(active_count=Count('id')),
+            'job_posting_stack_active_idx',
+        )
+
+    def test_article_stack_recount(self):
+        # 공고 연결과 같은 이유로 연결 대부분이 soft delete된 분포를 만들고 통계를 갱신
+        stacks = TechStack.objects.bulk_create([TechStack(name=f'plan-stack-{i}') for i in range(3)])
+        articles = Article.objects.bulk_create([
+            Article(url=f'https://stackoverflow.com/q/{i}', source='stackoverflow') for i in range(500)
+        ])
+        ArticleStack.objects.bulk_create([
+            ArticleStack(article=article, tech_stack=stack, is_deleted=i % 10 != 0)
+            for i, article in enumerate(articles) for stack in stacks
+        ])
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {ArticleStack._meta.db_table}")
+
+        self.assertUsesIndex(
+            ArticleStack.objects.filter(
+                tech_stack_id__in=[stack.id for stack in stacks], is_deleted=False
+            ).values('tech_stack_id').annotate(active_count=Count('id')),
+            'article_stack_active_idx',
+        )
+
+    def test_tech_stack_list_by_job_count(self):
+        self.assertUsesIndex(
+            TechStack.objects.filter(is_deleted=False).order_by('-job_stack_count')[:10],
+            'tech_stack_active_count_idx',
+        )
+
+    def test_job_map_bbox(self):
+        self.assertUsesIndex(
+            Corp.objects.filter(
+                is_deleted=False,
+                latitude__gte=37.4, latitude__lt=37.7,
+                longitude__gte=126.8, longitude__lt=127.2,
+            ),
+            'corp_active_location_idx',
+        )
+
+    def test_resume_list(self):
+        self.assertUsesIndex(
+            Resume.objects.filter(user_id=1, is_deleted=False).order_by('-created_at'),
+            'resume_active_user_idx',
+        )
+
+    def test_resume_matching_list(self):
+        self.assertUsesIndex(
+            ResumeMatching.objects.filter(resume_id=1, is_deleted=False).order_by('-id'),
+            'resume_matching_active_idx',
+        )
+
+
+class DirtySetTests(TestCase):
+    """트랜잭션당 flush 1회 예약, 롤백 후 재예약, 지연 블록 동작"""
+
+    def setUp(self):
+        self.flushed = []
+        self.dirty = DirtySet('test', ('ids',), lambda dirty: self.flushed.append(dirty['ids']))
+
+    def test_marks_in_one_transaction_flush_once(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.dirty.mark('ids', [1])
+            self.dirty.mark('ids', [2])
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.flushed, [{1, 2}])
+
+    def test_rolled_back_schedule_is_scheduled_again(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            try:
+                with transaction.atomic():
+                    self.dirty.mark('ids', [1])
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            self.dirty.mark('ids', [2])
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.flushed, [{1, 2}])
+
+    def test_deferred_block_schedules_at_end(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with self.dirty.deferred():
+                with self.dirty.deferred():
+                    self.dirty.mark('ids', [1])
+                self.dirty.mark('ids', [2])
+                self.assertEqual(self.flushed, [])
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(self.flushed, [{1, 2}])
+
+    def test_clear_drops_recorded_ids(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.dirty.deferred():
+                self.dirty.mark('ids', [1])
+                self.dirty.clear()
+        self.assertEqual(self.flushed, [])
@@ -0,0 +1,79 @@
+"""
+야간 작업 후 캐시 워밍
+크롤링/트렌드 집계가 끝나면 자주 호출되는 파라미터 조합으로 대시보드 API를 미리 호출해
+다음 세대의 캐시를 채운 뒤, bump_generation으로 한 번에 교체합니다.
+교체 전까지는 사용자가 이전 세대 캐시를 그대로 받으므로 아침 첫 요청도 차가운 캐시를 만나지 않습니다.
+"""
+import logging
+import time
+
+from rest_framework.test import APIRequestFactory
+
+from .cache import bump_generation, get_generations, pinned_generations
+
+logger = logging.getLogger(__name__)
+
+# 트렌드 그래프(TechTrendListView)를 미리 채울 기술 스택 수 (job_stack_count 상위)
+WARM_TREND_STACK_COUNT = 10
+WARM_TREND_DAYS = ('7', '30', '90')
+
+
+def hot_requests() -> list[tuple]:
+    """자주 호출되는 (뷰, 쿼리 파라미터, URL kwargs) 조합 목록"""
+    from apps.jobs.views import JobStatsView
+    from apps.trends.models import TechStack
+    from apps.trends.views import CategoryListView, TechStackListView, TechTrendListView, TopTechStacksView
+
+    requests = [
+        (JobStatsView, {}, {}),
+        (TopTechStacksView, {}, {}),
+        (TechStackListView, {}, {}),
+        (CategoryListView, {}, {}),
+    ]
+    for days in WARM_TREND_DAYS:
+        requests.append((TechTrendListView, {'days': days}, {}))
+
+    top_stack_ids = TechStack.objects.filter(
+        is_deleted=False
+    ).order_by('-job_stack_count').values_list('id', flat=True)[:WARM_TREND_STACK_COUNT]
+    for tech_stack_id in top_stack_ids:
+        for days in WARM_TREND_DAYS:
+            requests.append((TechTrendListView, {'tech_stack': str(tech_stack_id), 'days': days}, {}))
+    return requests
+
+
+def warm_caches(namespaces) -> dict:
+    """
+    namespaces의 다음 세대 캐시를 채운 뒤 세대 번호를 올려 교체
+    워밍 중 일부 요청이 실패해도 무효화는 반드시 수행합니다. (최신 데이터 반영이 우선)
+    결과: {'warmed': 성공 수, 'failed': 실패 수, 'seconds': 워밍 소요 시간, 'generations': 새 세대 번호}
+    """
+    namespaces = list(namespaces)
+    current = get_generations(namespaces)
+    next_generations = {namespace: generation + 1 for namespace, generation in current.items()}
+
+    factory = APIRequestFactory()
+    warmed = failed = 0
+    started = time.perf_counter()
+    try:
+        with pinned_generations(next_generations):
+            for view, params, kwargs in hot_requests():
+                try:
+                    response = view.as_view()(factory.get('/', params), **kwargs)
+                    if response.status_code == 200:
+                        warmed += 1
+                    else:
+                        failed += 1
+                        logger.warning("캐시 워밍 응답 오류: %s %s -> %s", view.__name__, params, response.status_code)
+                except Exception:
+                    failed += 1
+                    logger.exception("캐시 워밍 실패: %s %s", view.__name__, params)
+    finally:
+        seconds = time.perf_counter() - started
+        generations = bump_generation(*namespaces)
+
+    if generations != next_generations:
+        # 워밍 도중 다른 곳에서 무효화가 일어나면 미리 채운 세대는 쓰이지 않음 (다음 요청에서 다시 계산)
+        logger.warning("캐시 워밍 중 세대가 바뀌었습니다: 예상 %s, 실제 %s", next_generations, generations)
+
+    return {'warmed': warmed, 'failed': failed, 'seconds': seconds, 'generations': generations}
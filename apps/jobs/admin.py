@@ -68,6 +68,7 @@ class CorpBookmarkAdmin(admin.ModelAdmin):
 """
 
 from django.contrib import admin
+from .counters import deferred_job_stack_counts
 from .models import Corp, JobPosting, JobPostingStack, CorpBookmark
 
 
@@ -87,22 +88,25 @@ class JobPostingAdmin(admin.ModelAdmin):
     @admin.action(description='선택한 공고를 비공개(Soft Delete) 처리')
     def mark_as_deleted(self, request, queryset):
         count = 0
-        for job in queryset:
-            # 이미 삭제된 건 건너뛰기 (선택 사항)
-            if not job.is_deleted:
-                job.is_deleted = True
-                job.save() # [중요] 여기서 save()를 해야 signals.py가 작동해서 카운트가 감소함!
-                count += 1
+        # 공고마다 카운트를 다시 세지 않고 액션이 끝날 때 영향받은 기술 스택만 한 번에 재계산
+        with deferred_job_stack_counts():
+            for job in queryset:
+                # 이미 삭제된 건 건너뛰기 (선택 사항)
+                if not job.is_deleted:
+                    job.is_deleted = True
+                    job.save() # [중요] 여기서 save()를 해야 signals.py가 재계산 대상을 기록해 카운트가 감소함!
+                    count += 1
         self.message_user(request, f"{count}개의 공고가 비공개 처리되었습니다.")
 
     @admin.action(description='선택한 공고를 다시 공개(Active) 처리')
     def mark_as_active(self, request, queryset):
         count = 0
-        for job in queryset:
-            if job.is_deleted:
-                job.is_deleted = False
-                job.save() # [중요] 여기서 save()를 해야 signals.py가 작동해서 카운트가 증가함!
-                count += 1
+        with deferred_job_stack_counts():
+            for job in queryset:
+                if job.is_deleted:
+                    job.is_deleted = False
+                    job.save() # [중요] 여기서 save()를 해야 signals.py가 재계산 대상을 기록해 카운트가 증가함!
+                    count += 1
         self.message_user(request, f"{count}개의 공고가 복구되었습니다.")
     
 @admin.register(JobPostingStack)
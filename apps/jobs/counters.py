@@ -0,0 +1,84 @@
+"""
+TechStack.job_stack_count 지연 일괄 갱신
+공고/연결이 저장될 때마다 기술 스택별 COUNT 쿼리를 돌리는 대신,
+시그널은 영향받은 기술 스택 ID만 스레드 로컬 집합(apps.common.dirty.DirtySet)에 기록하고
+트랜잭션 커밋 시점(또는 deferred_job_stack_counts 블록 종료 시점)에 GROUP BY 1회로 몰아서 재계산합니다.
+
+사용 예 (크롤링처럼 많은 공고를 저장하는 작업):
+    with deferred_job_stack_counts():
+        for page in pages:
+            writer.write(page)
+    # 블록이 끝날 때 영향받은 기술 스택 전체를 한 번에 재계산
+"""
+from django.db.models import Count
+
+from apps.common.dirty import DirtySet
+from apps.trends.models import TechStack
+from .models import JobPostingStack
+
+
+def recount_job_stack_counts(tech_stack_ids) -> int:
+    """
+    주어진 기술 스택들의 job_stack_count를 GROUP BY 1회로 다시 계산
+    값이 바뀐 스택만 bulk_update 하며, 갱신된 스택 수를 반환합니다.
+    """
+    tech_stack_ids = set(tech_stack_ids)
+    if not tech_stack_ids:
+        return 0
+
+    counts = dict(
+        JobPostingStack.objects.filter(
+            tech_stack_id__in=tech_stack_ids,
+            is_deleted=False,
+            job_posting__is_deleted=False,
+        ).values('tech_stack_id').annotate(
+            active_count=Count('id')
+        ).values_list('tech_stack_id', 'active_count')
+    )
+
+    changed = []
+    for stack in TechStack.objects.filter(id__in=tech_stack_ids).only('id', 'job_stack_count'):
+        active_count = counts.get(stack.id, 0)
+        if stack.job_stack_count != active_count:
+            stack.job_stack_count = active_count
+            changed.append(stack)
+
+    if changed:
+        TechStack.objects.bulk_update(changed, ['job_stack_count'])
+    return len(changed)
+
+
+def _flush(dirty: dict) -> int:
+    stack_ids = dirty['stack_ids']
+    if dirty['posting_ids']:
+        stack_ids |= set(
+            JobPostingStack.objects.filter(job_posting_id__in=dirty['posting_ids']).values_list('tech_stack_id', flat=True)
+        )
+    return recount_job_stack_counts(stack_ids)
+
+
+# stack_ids: 재계산할 기술 스택 ID, posting_ids: 연결된 기술 스택을 flush 때 조회할 공고 ID
+_dirty = DirtySet('job_stack_count', ('stack_ids', 'posting_ids'), _flush)
+
+
+def flush_job_stack_counts() -> int:
+    """기록된 기술 스택들의 카운트를 지금 재계산하고, 갱신된 스택 수를 반환"""
+    return _dirty.flush()
+
+
+def mark_stacks_dirty(tech_stack_ids) -> None:
+    """기술 스택들의 job_stack_count를 재계산 대상으로 기록"""
+    _dirty.mark('stack_ids', tech_stack_ids)
+
+
+def mark_postings_dirty(job_posting_ids) -> None:
+    """공고들에 연결된 기술 스택 전체를 재계산 대상으로 기록 (연결 조회는 flush 때 한 번에)"""
+    _dirty.mark('posting_ids', job_posting_ids)
+
+
+def deferred_job_stack_counts():
+    """
+    블록 안에서는 시그널이 재계산 대상만 기록하고, 가장 바깥 블록이 끝날 때 한 번에 재계산
+    (중첩 가능, 예외로 끝나도 이미 커밋된 저장분을 반영하도록 재계산은 수행)
+    """
+    return _dirty.deferred()
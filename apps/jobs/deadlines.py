@@ -0,0 +1,62 @@
+"""
+기술 스택별 마감 임박 공고 사전 계산
+JobPostingByTechView가 요청마다 job_posting_stack 조인 + DISTINCT + 마감일 정렬을 하지 않도록
+크롤링이 끝난 뒤 기술 스택별 상위 DEADLINE_POSTING_LIMIT개 공고의 순위를 tech_stack_deadline에 저장합니다.
+
+조회는 (tech_stack_id, rank) 유니크 인덱스 범위 스캔 + 공고/기업 조인 1회로 끝납니다.
+저장 이후 삭제(soft delete)된 공고나 기술 연결이 끊긴 공고는 조회 시 제외되고, 다음 갱신 때 순위에서 빠집니다.
+"""
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Window
+from django.db.models.functions import RowNumber
+
+from .models import JobPosting, JobPostingStack, TechStackDeadline
+
+# 기술 스택별로 저장할 마감 임박 공고 수
+DEADLINE_POSTING_LIMIT = 100
+
+
+def refresh_tech_stack_deadlines(batch_size: int = 5000) -> int:
+    """
+    전체 기술 스택의 마감 임박 공고 순위를 다시 계산해 교체하고, 저장한 행 수를 반환
+    순서: 마감일 오름차순(마감일 없는 공고는 맨 뒤), 같으면 최신 공고 우선
+    트랜잭션 안에서 교체하므로 갱신 중에도 조회는 이전 순위를 그대로 봅니다.
+    """
+    ranked = JobPostingStack.objects.filter(
+        is_deleted=False,
+        job_posting__is_deleted=False,
+    ).annotate(
+        rank=Window(
+            RowNumber(),
+            partition_by=[F('tech_stack_id')],
+            order_by=[F('job_posting__expiry_date').asc(nulls_last=True), F('job_posting_id').desc()],
+        )
+    ).filter(
+        rank__lte=DEADLINE_POSTING_LIMIT
+    ).values_list('tech_stack_id', 'rank', 'job_posting_id')
+
+    rows = [
+        TechStackDeadline(tech_stack_id=tech_stack_id, rank=rank, job_posting_id=job_posting_id)
+        for tech_stack_id, rank, job_posting_id in ranked.iterator(chunk_size=batch_size)
+    ]
+    with transaction.atomic():
+        TechStackDeadline.objects.all().delete()
+        TechStackDeadline.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def upcoming_job_postings(tech_stack_id):
+    """
+    기술 스택의 마감 임박 공고 (기업 정보 포함, 순위 순)
+    순위는 크롤링 후에만 갱신되므로, 그 사이 연결이 끊긴(삭제된) 공고는 (job_posting, tech_stack) 유니크 인덱스로 확인해 제외
+    """
+    active_link = JobPostingStack.objects.filter(
+        job_posting_id=OuterRef('pk'),
+        tech_stack_id=tech_stack_id,
+        is_deleted=False,
+    )
+    return JobPosting.objects.filter(
+        Exists(active_link),
+        deadline_ranks__tech_stack_id=tech_stack_id,
+        is_deleted=False,
+    ).select_related('corp').order_by('deadline_ranks__rank')
@@ -1,8 +1,8 @@
 # apps/jobs/filters.py
 
 import django_filters
-from django.db.models import Q  
-from .models import JobPosting
+from .models import CAREER_MAX_UNBOUNDED, JobPosting, effective_max_career
+from .search import search_job_postings
 
 class JobPostingFilter(django_filters.FilterSet):
     # 1. 기업 필터 (새로 추가됨)
@@ -32,41 +32,24 @@ class JobPostingFilter(django_filters.FilterSet):
 
     def filter_search(self, queryset, name, value):
         """
-        [개선됨] Q 객체를 사용하여 제목, 설명, 기업명을 한 번에 검색합니다.
-        (성능 및 안정성 향상)
+        제목, 설명, 기업명을 한 번에 검색합니다.
+        PostgreSQL에서는 pg_trgm 인덱스로 검색하고 관련도 순으로 정렬합니다. (search.py)
         """
-        return queryset.filter(
-            Q(title__icontains=value) | 
-            Q(description__icontains=value) | 
-            Q(corp__name__icontains=value)
-        )
+        return search_job_postings(queryset, value)
 
     def filter_by_career(self, queryset, name, value):
         """
-        [디버깅 모드] 경력 필터링 로직
+        경력 필터링: 최소 경력 <= 내 연차 <= 최대 경력
+        최대 경력이 0이거나 NULL이면 상한 없음으로 보고 CAREER_MAX_UNBOUNDED로 정규화해 비교합니다.
+        (job_posting_career_idx 인덱스와 같은 식을 사용하므로 추가 쿼리 없이 인덱스로 필터링)
         """
-        # 1. 입력값 확인
-        print(f"\n[DEBUG] 사용자 입력 연차: {value} (Type: {type(value)})")
-
         if value is None:
             return queryset
 
-        # 2. 필터링 전, 해당 공고의 실제 DB 값 확인 (ID와 경력값 출력)
-        # (너무 많이 출력되면 보기 힘들므로 상위 5개만 확인)
-        print("[DEBUG] DB 데이터 샘플 확인 (필터링 전):")
-        for job in queryset[:5]:
-            print(f" - 공고 ID: {job.id} | 기업: {job.corp.name} | Min: {job.min_career} | Max: {job.max_career}")
-
-        # 3. 실제 필터링 적용
-        # Q객체 사용: (최대 경력이 내 연차보다 크거나) OR (0이거나) OR (NULL이거나)
-        filtered_qs = queryset.filter(
-            min_career__lte=value
+        value = min(value, CAREER_MAX_UNBOUNDED)
+        return queryset.alias(
+            max_career_bound=effective_max_career()
         ).filter(
-            Q(max_career__gte=value) | Q(max_career=0) | Q(max_career__isnull=True)
+            min_career__lte=value,
+            max_career_bound__gte=value,
         )
-
-        # 4. 결과 확인
-        print(f"[DEBUG] 필터링 후 남은 공고 개수: {filtered_qs.count()}")
-        print(f"[DEBUG] 생성된 SQL 쿼리: {filtered_qs.query}\n")
-        
-        return filtered_qs
\ No newline at end of file
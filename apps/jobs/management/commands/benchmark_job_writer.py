@@ -0,0 +1,123 @@
+"""
+크롤링 저장 단계 벤치마크
+기존 공고별 update_or_create 저장 방식과 JobPostingWriter 일괄 저장 방식의 초당 처리 공고 수를 비교합니다.
+모든 작업은 트랜잭션 안에서 실행 후 롤백되므로 DB에 데이터가 남지 않습니다.
+"""
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.jobs.models import Corp, JobPosting, JobPostingStack
+from apps.jobs.writers import JobPostingWriter
+from apps.trends.models import TechStack
+
+
+class Rollback(Exception):
+    """벤치마크 후 트랜잭션 롤백용"""
+
+
+def make_postings(count: int, tech_ids: list[int], number_base: int, corp_count: int) -> list[dict]:
+    """크롤러 파싱 결과와 같은 형식의 가짜 공고 생성"""
+    postings = []
+    for i in range(count):
+        corp_no = i % corp_count
+        postings.append({
+            'posting_number': number_base - i,
+            'corp': {
+                'name': f'__bench_corp_{number_base}_{corp_no}',
+                'logo_url': None,
+                'address': '서울 강남구 테헤란로',
+                'region_city': '서울',
+                'region_district': '강남구',
+                'latitude': 37.5,
+                'longitude': 127.0,
+            },
+            'title': f'벤치마크 공고 {i}',
+            'url': f'https://www.wanted.co.kr/wd/{number_base - i}',
+            'description': '## 주요업무\n벤치마크\n\n## 자격요건\n\n## 우대사항\n',
+            'expiry_date': None,
+            'career': '경력 무관',
+            'min_career': 0,
+            'max_career': 100,
+            'tech_stack_ids': set(random.sample(tech_ids, min(len(tech_ids), 8))),
+        })
+    return postings
+
+
+def save_legacy(posting: dict):
+    """기존 run_crawling의 공고 1건 저장 경로 (비교용)"""
+    corp_data = dict(posting['corp'])
+    name = corp_data.pop('name')
+    with transaction.atomic():
+        Corp.objects.filter(name=name).first()
+        corp, _ = Corp.objects.update_or_create(name=name, defaults={**corp_data, 'is_deleted': False})
+        job_obj, _ = JobPosting.objects.update_or_create(
+            posting_number=posting['posting_number'],
+            defaults={
+                'corp': corp,
+                'title': posting['title'],
+                'url': posting['url'],
+                'description': posting['description'],
+                'expiry_date': posting['expiry_date'],
+                'career': posting['career'],
+                'min_career': posting['min_career'],
+                'max_career': posting['max_career'],
+                'is_deleted': False,
+            }
+        )
+        JobPostingStack.objects.filter(job_posting=job_obj).delete()
+        for tech_id in posting['tech_stack_ids']:
+            ts = TechStack.objects.get(id=tech_id)
+            JobPostingStack.objects.create(job_posting=job_obj, tech_stack=ts)
+
+
+class Command(BaseCommand):
+    help = '공고 저장 방식(기존 update_or_create vs 일괄 저장) 초당 처리량 비교 (결과는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--count', type=int, default=500, help='저장할 가짜 공고 수 (기본값: 500)')
+        parser.add_argument('--page-size', type=int, default=50, help='일괄 저장 묶음 크기 (기본값: 50)')
+        parser.add_argument('--corps', type=int, default=100, help='가짜 기업 수 (기본값: 100)')
+
+    def handle(self, *args, **options):
+        count = options['count']
+        page_size = options['page_size']
+        corp_count = max(1, options['corps'])
+
+        tech_ids = list(TechStack.objects.filter(is_deleted=False).values_list('id', flat=True))
+        if not tech_ids:
+            self.stdout.write(self.style.ERROR("❌ TechStack 데이터가 없습니다. 먼저 기술 스택을 등록하세요."))
+            return
+
+        results = {}
+        # 신규 저장(insert) 후 같은 공고 재수집(update)까지 두 번 측정
+        for mode, number_base in (('legacy', -10_000_000), ('bulk', -20_000_000)):
+            postings = make_postings(count, tech_ids, number_base, corp_count)
+            timings = []
+            try:
+                with transaction.atomic():
+                    for _ in range(2):
+                        started = time.perf_counter()
+                        if mode == 'legacy':
+                            for posting in postings:
+                                save_legacy(posting)
+                        else:
+                            writer = JobPostingWriter()
+                            for i in range(0, len(postings), page_size):
+                                writer.write(postings[i:i + page_size])
+                        timings.append(time.perf_counter() - started)
+                    raise Rollback
+            except Rollback:
+                pass
+            results[mode] = timings
+
+        self.stdout.write(f"📊 공고 {count:,}건 (묶음 {page_size}건, 기업 {corp_count}개, 공고당 기술 최대 8개)")
+        for mode, (insert_sec, update_sec) in results.items():
+            self.stdout.write(
+                f"  {mode:<6} 신규: {count / insert_sec:>10,.1f} rows/s ({insert_sec:.2f}s) | "
+                f"재수집: {count / update_sec:>10,.1f} rows/s ({update_sec:.2f}s)"
+            )
+        speedup = sum(results['legacy']) / sum(results['bulk'])
+        self.stdout.write(self.style.SUCCESS(f"✅ 일괄 저장 방식이 {speedup:.1f}배 빠릅니다."))
@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+
+from apps.jobs.deadlines import refresh_tech_stack_deadlines
+
+
+class Command(BaseCommand):
+    help = '기술 스택별 마감 임박 공고 순위(tech_stack_deadline)를 다시 계산합니다. (크롤링 후 자동 실행)'
+
+    def handle(self, *args, **options):
+        self.stdout.write(" 기술 스택별 마감 임박 공고 계산 시작...")
+        saved_count = refresh_tech_stack_deadlines()
+        self.stdout.write(self.style.SUCCESS(f" 총 {saved_count}건의 마감 임박 공고 순위가 저장되었습니다."))
@@ -0,0 +1,118 @@
+# Generated by Django 5.0.14 on 2026-10-17 04:21
+# 기존 크롤러는 기업/공고를 중복 체크 없이 저장했으므로, 제약조건 추가 전에 중복 행을 정리
+# - 기업: 이름이 같은 기업 중 가장 먼저 저장된(id가 가장 작은) 기업만 남기고, 공고/즐겨찾기를 그 기업으로 옮김
+# - 공고: posting_number가 같은 공고 중 id가 가장 작은 공고만 남기고, 기술 연결/이력서 매칭을 그 공고로 옮김
+# 옮길 때 unique 조합이 겹치는 행(같은 사용자의 같은 기업 즐겨찾기 등)은 이미 남길 쪽에 있으므로 삭제
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def _unique_column_sets(model, field_name):
+    """field_name을 포함하는 unique 조합 [[컬럼 attname, ...]] (unique_together + 조건 없는 UniqueConstraint)"""
+    field_sets = list(model._meta.unique_together) + [
+        constraint.fields for constraint in model._meta.constraints
+        if isinstance(constraint, models.UniqueConstraint) and constraint.fields and constraint.condition is None
+    ]
+    return [
+        [model._meta.get_field(name).attname for name in fields]
+        for fields in field_sets if field_name in fields
+    ]
+
+
+def _repoint(model, keep_of):
+    """
+    keep_of: {중복 행 id: 남길 행 id}
+    중복 행을 참조하는 다른 모델의 행을 남길 행으로 옮기고, 옮긴 관계 행 수를 반환
+    """
+    moved = 0
+    for rel in model._meta.related_objects:
+        related, column = rel.related_model, rel.field.attname
+        unique_sets = _unique_column_sets(related, rel.field.name)
+        for row in related._base_manager.filter(**{f'{column}__in': list(keep_of)}).order_by('pk'):
+            target = keep_of[getattr(row, column)]
+            conflict = any(
+                related._base_manager.filter(
+                    **{col: getattr(row, col) for col in columns if col != column}, **{column: target}
+                ).exists()
+                for columns in unique_sets
+            )
+            if conflict:
+                row.delete()
+            else:
+                related._base_manager.filter(pk=row.pk).update(**{column: target})
+                moved += 1
+    return moved
+
+
+def _duplicates(model, field_name):
+    """{중복 행 id: 같은 값을 가진 행 중 가장 작은 id} (NULL 값은 제외)"""
+    keepers = dict(
+        model._base_manager.filter(**{f'{field_name}__isnull': False})
+        .values(field_name).annotate(rows=Count('id'), keep_id=Min('id')).filter(rows__gt=1)
+        .values_list(field_name, 'keep_id')
+    )
+    if not keepers:
+        return {}
+    return {
+        row_id: keepers[value]
+        for row_id, value in model._base_manager.filter(**{f'{field_name}__in': list(keepers)})
+        .values_list('id', field_name)
+        if row_id != keepers[value]
+    }
+
+
+def merge_duplicates(apps, schema_editor):
+    Corp = apps.get_model('jobs', 'Corp')
+    JobPosting = apps.get_model('jobs', 'JobPosting')
+    JobPostingStack = apps.get_model('jobs', 'JobPostingStack')
+    TechStack = apps.get_model('trends', 'TechStack')
+
+    if schema_editor.connection.vendor == 'postgresql':
+        # 같은 트랜잭션에서 바로 ALTER TABLE 하므로 지연된 FK 검사를 남기지 않음
+        schema_editor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+
+    duplicate_corps = _duplicates(Corp, 'name')
+    if duplicate_corps:
+        _repoint(Corp, duplicate_corps)
+        Corp._base_manager.filter(id__in=list(duplicate_corps)).delete()
+
+    duplicate_postings = _duplicates(JobPosting, 'posting_number')
+    if duplicate_postings:
+        stack_ids = set(
+            JobPostingStack._base_manager.filter(job_posting_id__in=list(duplicate_postings))
+            .values_list('tech_stack_id', flat=True)
+        )
+        _repoint(JobPosting, duplicate_postings)
+        JobPosting._base_manager.filter(id__in=list(duplicate_postings)).delete()
+
+        # 중복 공고의 기술 연결이 빠졌으므로 해당 기술 스택의 채용공고 수 재계산
+        counts = dict(
+            JobPostingStack._base_manager.filter(
+                tech_stack_id__in=stack_ids, is_deleted=False, job_posting__is_deleted=False,
+            ).values('tech_stack_id').annotate(active_count=Count('id')).values_list('tech_stack_id', 'active_count')
+        )
+        for stack_id in stack_ids:
+            TechStack._base_manager.filter(id=stack_id).update(job_stack_count=counts.get(stack_id, 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_corp_region_city_corp_region_district_and_more'),
+        # 중복 공고를 참조하는 이력서 매칭도 옮기고 job_stack_count를 재계산하도록 해당 모델/필드가 있는 상태에서 실행
+        ('resumes', '0009_resumematching_answer'),
+        ('trends', '0006_techstack_article_stack_count_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='corp',
+            constraint=models.UniqueConstraint(fields=('name',), name='unique_corp_name'),
+        ),
+        migrations.AddConstraint(
+            model_name='jobposting',
+            constraint=models.UniqueConstraint(fields=('posting_number',), name='unique_job_posting_number'),
+        ),
+    ]
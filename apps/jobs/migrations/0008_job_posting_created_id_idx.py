@@ -0,0 +1,17 @@
+# Generated by Django 5.0.14 on 2026-10-17 04:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_corp_name_posting_number_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(fields=['-created_at', '-id'], name='job_posting_created_id_idx'),
+        ),
+    ]
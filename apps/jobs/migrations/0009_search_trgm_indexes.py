@@ -0,0 +1,43 @@
+# 채용 공고/기업 검색(icontains)용 pg_trgm GIN 인덱스
+# Django의 icontains는 PostgreSQL에서 UPPER(컬럼::text) LIKE UPPER('%검색어%')로 변환되므로 같은 식으로 인덱스를 만듦
+# PostgreSQL이 아니거나 pg_trgm 확장을 쓸 수 없는 DB에서는 건너뜀 (apps/jobs/search.py가 인덱스 없이 동작)
+
+from django.db import migrations
+
+TRGM_INDEXES = [
+    ('job_posting_title_trgm_idx', 'job_posting', 'title'),
+    ('job_posting_desc_trgm_idx', 'job_posting', 'description'),
+    ('corp_name_trgm_idx', 'corp', 'name'),
+]
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRGM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _, _ in TRGM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_job_posting_created_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
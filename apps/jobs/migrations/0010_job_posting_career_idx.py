@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-10-17 04:49
+
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0009_search_trgm_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(models.F('min_career'), django.db.models.functions.comparison.Coalesce(django.db.models.functions.comparison.NullIf('max_career', 0), models.Value(100)), condition=models.Q(('is_deleted', False)), name='job_posting_career_idx'),
+        ),
+    ]
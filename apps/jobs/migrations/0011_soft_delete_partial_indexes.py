@@ -0,0 +1,29 @@
+# Generated by Django 5.0.14 on 2026-10-17 04:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0010_job_posting_career_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='jobposting',
+            name='job_posting_created_id_idx',
+        ),
+        migrations.AddIndex(
+            model_name='corp',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['latitude', 'longitude'], name='corp_active_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposting',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-created_at', '-id'], name='job_posting_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobpostingstack',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['tech_stack', 'job_posting'], name='job_posting_stack_active_idx'),
+        ),
+    ]
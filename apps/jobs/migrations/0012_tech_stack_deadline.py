@@ -0,0 +1,33 @@
+# Generated by Django 5.0.14 on 2026-10-17 04:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_soft_delete_partial_indexes'),
+        ('trends', '0013_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TechStackDeadline',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='마감 임박 순위')),
+                ('job_posting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deadline_ranks', to='jobs.jobposting', verbose_name='채용 공고')),
+                ('tech_stack', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='deadline_postings', to='trends.techstack', verbose_name='기술 스택')),
+            ],
+            options={
+                'verbose_name': '기술 스택별 마감 임박 공고',
+                'verbose_name_plural': '기술 스택별 마감 임박 공고 목록',
+                'db_table': 'tech_stack_deadline',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='techstackdeadline',
+            constraint=models.UniqueConstraint(fields=('tech_stack', 'rank'), name='unique_tech_stack_deadline_rank'),
+        ),
+    ]
@@ -5,8 +5,17 @@ ERD의 corp, job_posting, job_posting_stack 테이블 기반
 
 from django.db import models
 from django.conf import settings
+from django.db.models.functions import Coalesce, NullIf
 from apps.trends.models import TechStack
 
+# 최대 경력 상한 없음(크롤러는 100, 과거 데이터는 0 또는 NULL)을 나타내는 값
+CAREER_MAX_UNBOUNDED = 100
+
+
+def effective_max_career(max_career='max_career'):
+    """max_career를 상한 없음(0/NULL)까지 CAREER_MAX_UNBOUNDED로 정규화한 식 (경력 필터와 인덱스가 같은 식을 사용)"""
+    return Coalesce(NullIf(max_career, 0), models.Value(CAREER_MAX_UNBOUNDED))
+
 
 class Corp(models.Model):
     """
@@ -63,6 +72,18 @@ class Corp(models.Model):
         db_table = 'corp'
         verbose_name = '기업'
         verbose_name_plural = '기업 목록'
+        # 크롤러 일괄 저장(ON CONFLICT) 기준 키
+        constraints = [
+            models.UniqueConstraint(fields=['name'], name='unique_corp_name')
+        ]
+        indexes = [
+            # 채용 지도 bbox 조회, 대시보드 위치 보유 기업 수 (삭제되지 않은 기업만)
+            models.Index(
+                fields=['latitude', 'longitude'],
+                name='corp_active_location_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -132,6 +153,24 @@ class JobPosting(models.Model):
         verbose_name = '채용 공고'
         verbose_name_plural = '채용 공고 목록'
         ordering = ['-created_at']
+        # 크롤러 일괄 저장(ON CONFLICT) 기준 키
+        constraints = [
+            models.UniqueConstraint(fields=['posting_number'], name='unique_job_posting_number')
+        ]
+        indexes = [
+            # 공고 목록 커서 페이지네이션: (created_at, id) 내림차순 keyset 조회 (삭제되지 않은 공고만)
+            models.Index(
+                fields=['-created_at', '-id'],
+                name='job_posting_created_id_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+            # 경력 필터: min_career <= N AND 정규화된 max_career >= N (삭제되지 않은 공고만)
+            models.Index(
+                'min_career', effective_max_career(),
+                name='job_posting_career_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.corp.name} - {self.title or '채용 공고'}"
@@ -176,10 +215,49 @@ class JobPostingStack(models.Model):
     class Meta:
         db_table = 'job_posting_stack'
         unique_together = (('job_posting', 'tech_stack'),)
+        indexes = [
+            # 기술별 공고 수 재계산(GROUP BY tech_stack_id), 기술/카테고리별 공고 조회 (삭제되지 않은 연결만)
+            models.Index(
+                fields=['tech_stack', 'job_posting'],
+                name='job_posting_stack_active_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
         verbose_name = '채용 공고-기술 연결'
         verbose_name_plural = '채용 공고-기술 연결 목록'
 
 
+class TechStackDeadline(models.Model):
+    """
+    기술 스택별 마감 임박 공고 (JobPostingByTechView용 사전 계산 테이블)
+    크롤링이 끝날 때마다 apps.jobs.deadlines.refresh_tech_stack_deadlines가 통째로 다시 채웁니다.
+    """
+    tech_stack = models.ForeignKey(
+        TechStack,
+        on_delete=models.CASCADE,
+        related_name='deadline_postings',
+        verbose_name='기술 스택'
+    )
+    rank = models.PositiveSmallIntegerField(
+        verbose_name='마감 임박 순위'
+    )
+    job_posting = models.ForeignKey(
+        JobPosting,
+        on_delete=models.CASCADE,
+        related_name='deadline_ranks',
+        verbose_name='채용 공고'
+    )
+
+    class Meta:
+        db_table = 'tech_stack_deadline'
+        verbose_name = '기술 스택별 마감 임박 공고'
+        verbose_name_plural = '기술 스택별 마감 임박 공고 목록'
+        # 기술 스택별 순위 순 조회 (인덱스 1회 범위 스캔)
+        constraints = [
+            models.UniqueConstraint(fields=['tech_stack', 'rank'], name='unique_tech_stack_deadline_rank')
+        ]
+
+
 class CorpBookmark(models.Model):
     """
     기업 즐겨찾기 모델
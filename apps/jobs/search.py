@@ -0,0 +1,68 @@
+"""
+채용 공고/기업 검색
+PostgreSQL에서는 pg_trgm GIN 인덱스(UPPER(컬럼) gin_trgm_ops)가 icontains(UPPER(컬럼) LIKE UPPER('%검색어%'))를 그대로 가속하므로
+형태소 분석이 필요한 tsvector 대신 한국어/영어 모두 부분 일치로 동작하는 trigram을 사용하고,
+검색어와의 단어 유사도(word_similarity)로 관련도 순 정렬을 합니다.
+
+pg_trgm 확장이 없는 DB(SQLite 개발 환경 등)에서는 같은 icontains 조건으로 검색하고 기존 정렬을 유지합니다.
+(인덱스는 0009_search_trgm_indexes 마이그레이션에서 PostgreSQL + pg_trgm 사용 가능할 때만 생성)
+"""
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.db import connection
+from django.db.models import Q
+from django.db.models.functions import Greatest
+
+_trigram_enabled = {}
+
+
+def trigram_enabled() -> bool:
+    """현재 DB에서 pg_trgm 확장을 사용할 수 있는지 (DB 별칭마다 한 번만 확인)"""
+    alias = connection.alias
+    if alias not in _trigram_enabled:
+        enabled = False
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                enabled = cursor.fetchone() is not None
+        _trigram_enabled[alias] = enabled
+    return _trigram_enabled[alias]
+
+
+def search_job_postings(queryset, query: str):
+    """
+    제목, 직무 설명, 기업명 부분 일치 검색
+    pg_trgm 사용 가능하면 제목/기업명 유사도(search_rank) 내림차순, 같으면 최신순으로 정렬
+    """
+    query = (query or '').strip()
+    if not query:
+        return queryset
+
+    queryset = queryset.filter(
+        Q(title__icontains=query) |
+        Q(description__icontains=query) |
+        Q(corp__name__icontains=query)
+    )
+    if not trigram_enabled():
+        return queryset
+
+    return queryset.annotate(
+        search_rank=Greatest(
+            TrigramWordSimilarity(query, 'title'),
+            TrigramWordSimilarity(query, 'corp__name'),
+        )
+    ).order_by('-search_rank', '-created_at')
+
+
+def search_corps(queryset, query: str):
+    """기업명 부분 일치 검색 (pg_trgm 사용 가능하면 유사도 내림차순, 같으면 이름순)"""
+    query = (query or '').strip()
+    if not query:
+        return queryset
+
+    queryset = queryset.filter(name__icontains=query)
+    if not trigram_enabled():
+        return queryset
+
+    return queryset.annotate(
+        search_rank=TrigramWordSimilarity(query, 'name')
+    ).order_by('-search_rank', 'name')
@@ -4,9 +4,14 @@ from celery import shared_task
 from django.core.management import call_command
 from django.utils import timezone
 from datetime import timedelta
-from django.core.cache import cache
-from apps.jobs.models import TechStack, JobPosting
-from apps.trends.models import TechTrend # 모델 경로 확인 필요
+from django.db.models import Count, Q
+from apps.jobs.models import TechStack
+from apps.trends.rollups import update_trend_rollups
+from apps.trends.trend_math import trend_anomalies
+from apps.trends.writers import save_job_trends
+from apps.common.cache import bump_generation, NS_JOBS_MAP, NS_JOBS_STATS, NS_TECHSTACK, NS_TRENDS
+from apps.common.metrics import track_task_run
+from apps.common.warming import warm_caches
 @shared_task
 def schedule_crawling():
     """
@@ -20,25 +25,20 @@ def schedule_crawling():
     call_command('run_crawling', count=50)
     print("[Celery] 크롤링 작업 완료!")
 
-    # 캐시 무효화: 크롤링으로 인해 변경된 데이터 관련 캐시 삭제
-    print("[Cache] 크롤링 관련 캐시 무효화 시작...")
-
-    # 1. 대시보드 통계 캐시 삭제 (기업 수, 채용 공고 수 변경)
-    cache.delete('jobs:stats')
-
-    # 2. 기술 스택 목록 캐시 삭제 (job_stack_count 변경 가능)
-    # 모든 파라미터 조합의 캐시를 삭제하기 위해 패턴 매칭 사용
-    cache_keys = cache.keys('trends:techstack:list:*')
-    if cache_keys:
-        cache.delete_many(cache_keys)
-
-    print(f"[Cache] 캐시 무효화 완료: jobs:stats, {len(cache_keys) if cache_keys else 0}개의 기술 스택 목록 캐시")
+    # 캐시 무효화: 크롤링으로 인해 변경된 데이터 관련 캐시의 세대 번호를 올림
+    # (KEYS 패턴 스캔 없이 INCR만으로 모든 파라미터 조합의 캐시가 무효화됨)
+    # 1. 대시보드 통계 (기업 수, 채용 공고 수 변경)
+    # 2. 기술 스택 목록/상세/Top 5 (job_stack_count 변경 가능)
+    # 3. 채용 지도 타일 (공고/기업 위치 변경)
+    # 새 세대는 warm_dashboard_caches가 미리 채운 뒤 교체
+    queue_cache_warming([NS_JOBS_STATS, NS_TECHSTACK, NS_JOBS_MAP])
 
 @shared_task
 def calculate_daily_trends():
     """
     [Celery] 일별 트렌드 집계 (채용공고 기준)
     각 날짜별로 전체 기술 스택 언급량 대비 각 기술 스택의 언급량 비율(%)을 계산하여 저장
+    기술별 채용공고 수는 GROUP BY 1회로 집계하고, tech_trend에는 한 번의 bulk upsert로 저장
     집계 후 관련 캐시를 무효화하여 최신 데이터 반영
     """
     now = timezone.now()
@@ -46,62 +46,74 @@ def calculate_daily_trends():
 
     print(f"[Trend] {today} 일자 기술 트렌드 집계 시작...")
 
-    stacks = TechStack.objects.filter(is_deleted=False)
-
-    # 1. 모든 기술 스택의 채용공고 카운트 계산
-    tech_counts = {}
-    for stack in stacks:
-        current_job_count = stack.job_postings.filter(
-            is_deleted=False,
-            job_posting__is_deleted=False
-        ).count()
-        tech_counts[stack.id] = current_job_count
-
-    # 2. 해당 날짜의 전체 기술 스택 언급량 합계 계산
-    total_job_count = sum(tech_counts.values())
-
-    # 3. 각 기술 스택별로 비율 계산 및 저장
-    if total_job_count == 0:
-        # 언급량이 없으면 비율 계산 불가, 모든 기술 스택에 0.0 저장
-        for stack in stacks:
-            TechTrend.objects.update_or_create(
-                tech_stack=stack,
-                reference_date=today,
-                defaults={
-                    'job_mention_count': 0,
-                    'job_change_rate': 0.0,
-                    'is_deleted': False
-                }
-            )
-    else:
-        for stack in stacks:
-            current_job_count = tech_counts.get(stack.id, 0)
-
-            # 전체 대비 비율 계산 (%)
-            job_change_rate = (current_job_count / total_job_count) * 100
-
-            # 데이터 저장
-            TechTrend.objects.update_or_create(
-                tech_stack=stack,
-                reference_date=today,
-                defaults={
-                    'job_mention_count': current_job_count,
-                    'job_change_rate': round(job_change_rate, 2),
-                    'is_deleted': False
-                }
-            )
-
-    print(f"[Trend] 총 {stacks.count()}개 스택의 트렌드 저장 완료!")
-
-    # 캐시 무효화: 트렌드 집계로 인해 변경된 데이터 관련 캐시 삭제
-    print("[Cache] 트렌드 집계 관련 캐시 무효화 시작...")
-
-    # 1. 기술 스택 목록 캐시 삭제 (job_mention_count 업데이트됨)
-    cache_keys = cache.keys('trends:techstack:list:*')
-    if cache_keys:
-        cache.delete_many(cache_keys)
-
-    # 2. 대시보드 통계 캐시도 삭제 (job_postings_count가 변경될 수 있음)
-    cache.delete('jobs:stats')
-
-    print(f"[Cache] 캐시 무효화 완료: jobs:stats, {len(cache_keys) if cache_keys else 0}개의 기술 스택 목록 캐시")
\ No newline at end of file
+    with track_task_run('calculate_daily_trends') as rows:
+        # 1. 모든 기술 스택의 채용공고 카운트 계산 (공고가 없는 스택도 0으로 포함)
+        tech_counts = dict(
+            TechStack.objects.filter(is_deleted=False).annotate(
+                current_job_count=Count(
+                    'job_postings',
+                    filter=Q(job_postings__is_deleted=False, job_postings__job_posting__is_deleted=False),
+                )
+            ).values_list('id', 'current_job_count')
+        )
+
+        # 2. 전체 대비 비율 계산 후 tech_trend에 일괄 저장
+        saved_count = save_job_trends(today, tech_counts)
+
+        # 3. 기간별(7/30/90일) 언급량 합계 증분 갱신 (새 날짜 더하고 기간에서 빠진 날짜 빼기), 이번 주/월 집계 갱신
+        update_trend_rollups(today)
+
+        # 4. 직전 28일 대비 채용공고 수가 급증/급감한 기술 스택 (|z-score| >= 3)
+        anomalies = trend_anomalies('job', today, list(tech_counts))
+
+        rows['stacks'] = len(tech_counts)
+        rows['job_mentions'] = sum(tech_counts.values())
+        rows['upserted'] = saved_count
+        rows['anomalies'] = len(anomalies)
+
+    print(f"[Trend] 총 {saved_count}개 스택의 트렌드 저장 완료!")
+    if anomalies:
+        print(f"[Trend] 급변 기술 스택 {len(anomalies)}개 (ID, 공고 수, z-score): {anomalies[:10]}")
+
+    # 캐시 무효화: 트렌드 집계로 인해 변경된 데이터 관련 캐시의 세대 번호를 올림
+    # 1. tech_trend 기반 집계 (Top 5 언급량 등)
+    # 2. 기술 스택 목록 (job_mention_count 업데이트됨)
+    # 3. 대시보드 통계 (job_postings_count가 변경될 수 있음)
+    queue_cache_warming([NS_TRENDS, NS_TECHSTACK, NS_JOBS_STATS])
+
+
+@shared_task
+def maintain_trend_partitions():
+    """
+    [Celery Beat] tech_trend 월 파티션 관리
+    앞으로 3개월치 파티션을 미리 만들고, 보관 기간(TECH_TREND_RETENTION_MONTHS)을 설정한 경우에만 지난 파티션을 분리해 보관
+    """
+    with track_task_run('maintain_trend_partitions'):
+        call_command('manage_trend_partitions')
+
+
+def queue_cache_warming(namespaces):
+    """캐시 워밍 작업을 큐에 넣음 (브로커 장애 시에는 워밍 없이 바로 무효화)"""
+    try:
+        warm_dashboard_caches.delay(namespaces)
+        print(f"[Cache] 캐시 워밍 예약: {namespaces}")
+    except Exception as e:
+        generations = bump_generation(*namespaces)
+        print(f"[Cache] 캐시 워밍 예약 실패({e}), 바로 무효화: {generations}")
+
+
+@shared_task
+def warm_dashboard_caches(namespaces):
+    """
+    [Celery] 야간 작업 후 캐시 워밍
+    자주 호출되는 대시보드 API 조합으로 다음 세대 캐시를 미리 채운 뒤 세대 번호를 올려 교체
+    """
+    with track_task_run('warm_dashboard_caches') as rows:
+        result = warm_caches(namespaces)
+        rows['warmed'] = result['warmed']
+        rows['failed'] = result['failed']
+
+    print(
+        f"[Cache] 캐시 워밍 완료: {result['warmed']}개 요청, 실패 {result['failed']}개, "
+        f"{result['seconds']:.2f}초 -> 세대 교체 {result['generations']}"
+    )
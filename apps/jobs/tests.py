@@ -0,0 +1,210 @@
+import asyncio
+import time
+from datetime import date
+
+import httpx
+from django.db.models import IntegerField, Value
+from django.test import SimpleTestCase, TestCase
+
+from apps.jobs.deadlines import refresh_tech_stack_deadlines
+from apps.jobs.models import CAREER_MAX_UNBOUNDED, Corp, JobPosting, JobPostingStack, effective_max_career
+from apps.jobs.wanted import WantedFetcher
+from apps.trends.models import TechStack
+
+
+class WantedFetcherTests(SimpleTestCase):
+    """httpx.MockTransport로 만든 가짜 원티드 서버에 대한 WantedFetcher 재시도/동시성 테스트"""
+
+    def fetcher(self, handler, **kwargs):
+        options = {'rate': 0, 'backoff': 0, 'max_retries': 3, 'transport': httpx.MockTransport(handler)}
+        options.update(kwargs)
+        return WantedFetcher(base_url='http://wanted.test', **options)
+
+    def test_retries_5xx_until_success(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={'job': {'id': 1}})
+
+        with self.fetcher(handler) as fetcher:
+            detail = fetcher._loop.run_until_complete(fetcher.fetch_detail(1))
+
+        self.assertEqual(detail, {'job': {'id': 1}})
+        self.assertEqual(len(calls), 3)
+
+    def test_gives_up_after_max_retries(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(500)
+
+        with self.fetcher(handler, max_retries=2) as fetcher:
+            detail = fetcher._loop.run_until_complete(fetcher.fetch_detail(1))
+
+        self.assertIsNone(detail)
+        self.assertEqual(len(calls), 3)
+
+    def test_does_not_retry_client_errors(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            return httpx.Response(404)
+
+        with self.fetcher(handler) as fetcher:
+            detail = fetcher._loop.run_until_complete(fetcher.fetch_detail(1))
+
+        self.assertIsNone(detail)
+        self.assertEqual(len(calls), 1)
+
+    def test_429_waits_for_retry_after(self):
+        requested_at = []
+
+        def handler(request):
+            requested_at.append(time.monotonic())
+            if len(requested_at) == 1:
+                return httpx.Response(429, headers={'Retry-After': '1'})
+            return httpx.Response(200, json={'job': {'id': 1}})
+
+        with self.fetcher(handler) as fetcher:
+            detail = fetcher._loop.run_until_complete(fetcher.fetch_detail(1))
+
+        self.assertEqual(detail, {'job': {'id': 1}})
+        self.assertEqual(len(requested_at), 2)
+        self.assertGreaterEqual(requested_at[1] - requested_at[0], 1.0)
+
+    def test_non_json_200_is_retried(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if len(calls) == 1:
+                return httpx.Response(200, text='<html>점검 중</html>', headers={'Content-Type': 'text/html'})
+            return httpx.Response(200, json={'job': {'id': 1}})
+
+        with self.fetcher(handler) as fetcher:
+            detail = fetcher._loop.run_until_complete(fetcher.fetch_detail(1))
+
+        self.assertEqual(detail, {'job': {'id': 1}})
+        self.assertEqual(len(calls), 2)
+
+    def test_non_json_200_is_skipped_after_retries(self):
+        def handler(request):
+            return httpx.Response(200, text='<html></html>')
+
+        with self.fetcher(handler, max_retries=1) as fetcher:
+            detail = fetcher._loop.run_until_complete(fetcher.fetch_detail(1))
+
+        self.assertIsNone(detail)
+
+    def test_page_details_respect_concurrency_cap(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(request):
+            nonlocal in_flight, max_in_flight
+            if request.url.path == '/api/v4/jobs':
+                return httpx.Response(200, json={'data': [{'id': i} for i in range(1, 21)]})
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            job_id = int(request.url.path.rsplit('/', 1)[-1])
+            return httpx.Response(200, json={'job': {'id': job_id}})
+
+        with self.fetcher(handler, concurrency=3) as fetcher:
+            page = fetcher.get_page(0, 20)
+
+        self.assertEqual(max_in_flight, 3)
+        # 목록 순서 유지
+        self.assertEqual([job['id'] for job, _ in page], list(range(1, 21)))
+        self.assertEqual([detail['job']['id'] for _, detail in page], list(range(1, 21)))
+
+
+class JobPostingCareerFilterTests(TestCase):
+    """경력 필터: min_career <= N <= 정규화된 max_career (max_career 0/NULL = 상한 없음)"""
+
+    url = '/api/v1/jobs/job-postings/'
+
+    @classmethod
+    def setUpTestData(cls):
+        corp = Corp.objects.create(name='테스트 기업')
+        deleted_corp = Corp.objects.create(name='삭제된 기업', is_deleted=True)
+
+        def posting(number, min_career, max_career, **kwargs):
+            return JobPosting.objects.create(
+                corp=kwargs.pop('corp', corp), url=f'https://example.com/{number}', posting_number=number,
+                min_career=min_career, max_career=max_career, **kwargs,
+            )
+
+        cls.junior = posting(1, 0, 2)
+        cls.middle = posting(2, 3, 5)
+        cls.senior_open = posting(3, 5, 0)     # 5년 이상 (상한 없음)
+        cls.any_career = posting(4, 0, 0)      # 경력 무관
+        posting(5, 0, 10, is_deleted=True)
+        posting(6, 0, 10, corp=deleted_corp)
+
+    def result_ids(self, response):
+        self.assertEqual(response.status_code, 200)
+        return {row['id'] for row in response.json()['results']}
+
+    def test_filtered_list_query_count(self):
+        # 목록 COUNT 1회 + 기업을 join한 페이지 조회 1회
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'career_year': 3})
+        self.assertEqual(self.result_ids(response), {self.middle.id, self.any_career.id})
+
+    def test_zero_max_career_has_no_upper_bound(self):
+        response = self.client.get(self.url, {'career_year': 10})
+        self.assertEqual(self.result_ids(response), {self.senior_open.id, self.any_career.id})
+
+    def test_career_year_above_unbounded_is_clamped(self):
+        response = self.client.get(self.url, {'career_year': CAREER_MAX_UNBOUNDED + 50})
+        self.assertEqual(self.result_ids(response), {self.senior_open.id, self.any_career.id})
+
+    def test_min_career_is_inclusive(self):
+        response = self.client.get(self.url, {'career_year': 0})
+        self.assertEqual(self.result_ids(response), {self.junior.id, self.any_career.id})
+
+    def test_null_max_career_has_no_upper_bound(self):
+        bounds = JobPosting.objects.filter(pk=self.middle.pk).annotate(
+            null_bound=effective_max_career(Value(None, output_field=IntegerField())),
+            zero_bound=effective_max_career(Value(0)),
+            bound=effective_max_career(),
+        ).values_list('null_bound', 'zero_bound', 'bound').get()
+        self.assertEqual(bounds, (CAREER_MAX_UNBOUNDED, CAREER_MAX_UNBOUNDED, 5))
+
+
+class JobPostingByTechTests(TestCase):
+    """기술 스택별 마감 임박 공고: 미리 계산한 순위 순, 순위 갱신 전에 끊긴 연결/삭제된 공고는 바로 제외"""
+
+    @classmethod
+    def setUpTestData(cls):
+        corp = Corp.objects.create(name='테스트 기업')
+        cls.stack = TechStack.objects.create(name='Python')
+        cls.postings = [
+            JobPosting.objects.create(
+                corp=corp, url=f'https://example.com/{number}', posting_number=number,
+                expiry_date=date(2026, 11, number),
+            )
+            for number in (1, 2, 3)
+        ]
+        cls.links = [JobPostingStack.objects.create(job_posting=posting, tech_stack=cls.stack) for posting in cls.postings]
+        refresh_tech_stack_deadlines()
+
+    def result_ids(self):
+        response = self.client.get(f'/api/v1/jobs/by-tech/{self.stack.id}/')
+        self.assertEqual(response.status_code, 200)
+        return [row['id'] for row in response.json()]
+
+    def test_ranked_by_expiry_date(self):
+        self.assertEqual(self.result_ids(), [posting.id for posting in self.postings])
+
+    def test_unlinked_or_deleted_posting_is_excluded_before_refresh(self):
+        JobPostingStack.objects.filter(pk=self.links[0].pk).update(is_deleted=True)
+        JobPosting.objects.filter(pk=self.postings[1].pk).update(is_deleted=True)
+        self.assertEqual(self.result_ids(), [self.postings[2].id])
@@ -20,6 +20,9 @@ urlpatterns = [
 
     # 대시보드 통계 (분석된 기업 수, 수집된 공고 수)
     path('stats/', views.JobStatsView.as_view(), name='job_stats'),
+
+    # 채용 지도 (화면 영역/줌 레벨별 기업 마커 또는 클러스터)
+    path('map/', views.JobMapView.as_view(), name='job_map'),
     
     # 즐겨찾기
     path('corp-bookmarks/<int:corp_bookmark_id>/', views.CorpBookmarkDetailView.as_view(), name='corp_bookmark_detail'),
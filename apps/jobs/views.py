@@ -1,24 +1,122 @@
 # from django.shortcuts import get_object_or_404
+import base64
+import hashlib
+import math
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db.models import Count, Q
 from rest_framework import generics, status
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 from rest_framework import filters
-from django.core.cache import cache
+from apps.common.cache import cache_key, cached_computation, NS_JOBS_MAP, NS_JOBS_STATS
 from .filters import JobPostingFilter # 채용지도 필터링 임포트
+from .search import search_corps
+from .deadlines import upcoming_job_postings
 
 from .models import Corp, JobPosting, CorpBookmark
 
 
+# 채용 지도: 이 줌 레벨부터 기업 마커, 미만이면 격자 클러스터
+MAP_MARKER_ZOOM = 14
+MAP_MAX_ZOOM = 21
+# 클러스터 격자: 타일 한 변을 몇 칸으로 나눌지
+MAP_CLUSTER_CELLS = 8
+# 요청 1회에 허용하는 최대 타일 수
+MAP_MAX_TILES = 256
+MAP_CACHE_TIMEOUT = 60 * 10
+
+
 class JobPostingListPagination(PageNumberPagination):
     """채용공고 목록: page_size 쿼리 파라미터로 크기 지정 가능 (채용 지도 필터 시 전체 매칭 수집용)"""
     page_size = 20
     page_size_query_param = 'page_size'
     max_page_size = 10000
+
+
+class JobPostingCursorPagination(BasePagination):
+    """
+    채용공고 목록 keyset(커서) 페이지네이션: (created_at, id) 내림차순
+    OFFSET 없이 마지막 행의 (created_at, id) 다음부터 읽으므로 깊은 페이지도 첫 페이지와 비용이 같고,
+    전체 개수 COUNT는 with_count=true일 때만 수행합니다.
+
+    요청 예시: GET /api/v1/jobs/job-postings/?cursor=&page_size=1000  (첫 페이지)
+              GET /api/v1/jobs/job-postings/?cursor=<next_cursor>&page_size=1000
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 10000
+    cursor_query_param = 'cursor'
+    count_query_param = 'with_count'
+    ordering = ('-created_at', '-id')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.count = queryset.count() if request.query_params.get(self.count_query_param) in ('1', 'true') else None
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+        if position:
+            created_at, last_id = position
+            # (created_at, id) < (마지막 created_at, 마지막 id)
+            queryset = queryset.filter(created_at__lte=created_at).filter(
+                Q(created_at__lt=created_at) | Q(id__lt=last_id)
+            )
+
+        # 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_cursor = self.encode_cursor(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def encode_cursor(self, posting) -> str:
+        raw = f"{posting.created_at.isoformat()}|{posting.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    def decode_cursor(self, cursor):
+        if not cursor:
+            return None
+        try:
+            created_at, last_id = base64.urlsafe_b64decode(cursor.encode()).decode().split('|')
+            return datetime.fromisoformat(created_at), int(last_id)
+        except (ValueError, UnicodeDecodeError):
+            raise NotFound('잘못된 cursor 값입니다.')
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        # 전체 개수는 첫 요청에서만 필요하므로 다음 페이지 링크에서는 제외
+        url = remove_query_param(self.request.build_absolute_uri(), self.count_query_param)
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        payload = {
+            'next': self.get_next_link(),
+            'next_cursor': self.next_cursor,
+            'results': data,
+        }
+        if self.count is not None:
+            payload = {'count': self.count, **payload}
+        return Response(payload)
+
+
 from .serializers import (
     CorpSerializer, CorpDetailSerializer,
     JobPostingSerializer, JobPostingDetailSerializer,
@@ -59,8 +157,8 @@ class CorpListView(generics.ListAPIView):
         # self.get_queryset()을 호출하여 인스턴스 변수가 아닌 메서드 체이닝으로 처리하는 것이 안전함
         queryset = self.get_queryset()
         if corp_name and corp_name.strip():
-            # 부분 일치 검색 (대소문자 구분 없음)
-            queryset = queryset.filter(name__icontains=corp_name.strip())
+            # 부분 일치 검색 (대소문자 구분 없음, PostgreSQL에서는 pg_trgm 인덱스 + 유사도 순 정렬)
+            queryset = search_corps(queryset, corp_name)
         
         # 필터링된 쿼리셋으로 시리얼라이징 수행
         serializer = self.get_serializer(queryset, many=True)
@@ -77,14 +175,11 @@ class JobStatsView(APIView):
     permission_classes = [AllowAny]
 
     def get(self, request):
-        """대시보드 통계를 캐시에서 조회하거나 DB에서 가져옴"""
-        cache_key = 'jobs:stats'
-        cached_data = cache.get(cache_key)
-
-        if cached_data is not None:
-            return Response(cached_data)
+        """대시보드 통계를 캐시에서 조회하거나 DB에서 가져옴 (캐시 10분, 만료 시 워커 하나만 재계산)"""
+        stats_data = cached_computation('jobs_stats', NS_JOBS_STATS, ('stats',), self.get_stats, timeout=60 * 10)
+        return Response(stats_data)
 
-        # 캐시 미스 - DB 조회
+    def get_stats(self):
         from django.db.models import Q
         # 채용지도와 동일하게 위도/경도가 유효한 기업만 카운트
         # 위도 또는 경도가 null이거나 0이면 제외
@@ -104,10 +199,134 @@ class JobStatsView(APIView):
             'job_postings_count': job_postings_count,
         }
 
-        # 캐시 저장 (10분)
-        cache.set(cache_key, stats_data, 60 * 10)
+        return stats_data
 
-        return Response(stats_data)
+
+class JobMapView(APIView):
+    """
+    채용 지도용 경량 API: 화면 영역(bbox)과 줌 레벨에 맞춰 기업 마커 또는 격자 클러스터를 배열의 배열로 반환
+    요청 예시: GET /api/v1/jobs/map/?bbox=126.8,37.4,127.2,37.7&zoom=12&career_year=3
+    - bbox: 최소 경도,최소 위도,최대 경도,최대 위도
+    - zoom: 웹 지도 줌 레벨 (0~21, 클수록 확대). MAP_MARKER_ZOOM 이상이면 기업 마커, 미만이면 클러스터
+    - 그 외 필터는 채용 공고 목록(JobPostingFilter)과 동일
+
+    화면 영역을 줌 레벨별 고정 타일(경위도 격자)로 나누어 (필터, 타일) 단위로 캐시하므로
+    지도를 조금 움직여도 이미 본 타일은 캐시에서 바로 가져오고, 새 타일만 쿼리 1회로 계산합니다.
+    (타일 단위로 반환하므로 bbox 가장자리 바깥의 기업이 일부 포함될 수 있음)
+    """
+    permission_classes = [AllowAny]
+
+    MARKER_FIELDS = ['corp_id', 'lat', 'lng', 'job_posting_count', 'name']
+    CLUSTER_FIELDS = ['lat', 'lng', 'corp_count', 'job_posting_count']
+
+    @swagger_auto_schema(
+        operation_summary="채용 지도 마커/클러스터 조회",
+        manual_parameters=[
+            openapi.Parameter('bbox', openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True,
+                              description='화면 영역 (최소 경도,최소 위도,최대 경도,최대 위도)'),
+            openapi.Parameter('zoom', openapi.IN_QUERY, type=openapi.TYPE_INTEGER, required=True,
+                              description=f'줌 레벨 (0~{MAP_MAX_ZOOM}, {MAP_MARKER_ZOOM} 이상이면 기업 마커)'),
+        ],
+    )
+    def get(self, request):
+        try:
+            min_lng, min_lat, max_lng, max_lat = (float(v) for v in request.query_params.get('bbox', '').split(','))
+            zoom = int(request.query_params.get('zoom', ''))
+        except ValueError:
+            raise ValidationError({'bbox': 'bbox=최소 경도,최소 위도,최대 경도,최대 위도, zoom=정수 형식이어야 합니다.'})
+        if not (0 <= zoom <= MAP_MAX_ZOOM) or min_lng > max_lng or min_lat > max_lat:
+            raise ValidationError({'bbox': '잘못된 화면 영역 또는 줌 레벨입니다.'})
+
+        # 화면 영역을 덮는 타일 목록 (타일 한 변 = 360 / 2^zoom 도)
+        span = 360 / 2 ** zoom
+        x_range = range(math.floor((min_lng + 180) / span), math.floor((max_lng + 180) / span) + 1)
+        y_range = range(math.floor((min_lat + 90) / span), math.floor((max_lat + 90) / span) + 1)
+        if len(x_range) * len(y_range) > MAP_MAX_TILES:
+            raise ValidationError({'zoom': '화면 영역이 줌 레벨에 비해 너무 넓습니다. 줌 레벨을 높여주세요.'})
+        tiles = [(x, y) for x in x_range for y in y_range]
+
+        filterset = JobPostingFilter(
+            request.query_params,
+            queryset=JobPosting.objects.filter(is_deleted=False, corp__is_deleted=False),
+            request=request,
+        )
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+
+        # 캐시 키: 세대 번호 + 필터 조합 해시 + 줌 + 타일 좌표
+        filters_key = sorted(
+            (name, value.strip()) for name, value in request.query_params.items()
+            if name in filterset.filters and value.strip()
+        )
+        filters_hash = hashlib.md5(repr(filters_key).encode()).hexdigest()
+        prefix = cache_key(NS_JOBS_MAP, 'tile', filters_hash, zoom)
+        keys = {tile: f"{prefix}:{tile[0]}:{tile[1]}" for tile in tiles}
+
+        cached = cache.get_many(list(keys.values()))
+        rows_by_tile = {tile: cached[key] for tile, key in keys.items() if key in cached}
+        missing = [tile for tile in tiles if tile not in rows_by_tile]
+        if missing:
+            computed = self.build_tiles(filterset.qs, zoom, span, missing)
+            rows_by_tile.update(computed)
+            cache.set_many({keys[tile]: rows for tile, rows in computed.items()}, MAP_CACHE_TIMEOUT)
+
+        markers = zoom >= MAP_MARKER_ZOOM
+        return Response({
+            'zoom': zoom,
+            'mode': 'markers' if markers else 'clusters',
+            'fields': self.MARKER_FIELDS if markers else self.CLUSTER_FIELDS,
+            'data': [row for tile in tiles for row in rows_by_tile[tile]],
+        })
+
+    def build_tiles(self, queryset, zoom: int, span: float, tiles: list) -> dict:
+        """타일 목록을 덮는 영역을 쿼리 1회로 조회해 타일별 마커/클러스터 행으로 나눔"""
+        xs = [x for x, _ in tiles]
+        ys = [y for _, y in tiles]
+        corps = queryset.filter(
+            corp__longitude__gte=min(xs) * span - 180,
+            corp__longitude__lt=(max(xs) + 1) * span - 180,
+            corp__latitude__gte=min(ys) * span - 90,
+            corp__latitude__lt=(max(ys) + 1) * span - 90,
+        ).exclude(
+            Q(corp__latitude=0) | Q(corp__longitude=0)
+        ).values(
+            'corp_id', 'corp__name', 'corp__latitude', 'corp__longitude'
+        ).annotate(
+            job_posting_count=Count('id')
+        ).order_by('corp_id')
+
+        wanted = set(tiles)
+        markers = {tile: [] for tile in tiles}
+        # 클러스터: 타일을 MAP_CLUSTER_CELLS x MAP_CLUSTER_CELLS 격자로 나누어 칸별 (위도 합, 경도 합, 기업 수, 공고 수)
+        cells = {tile: {} for tile in tiles}
+        cell_span = span / MAP_CLUSTER_CELLS
+        for corp in corps:
+            lat, lng = float(corp['corp__latitude']), float(corp['corp__longitude'])
+            tile = (math.floor((lng + 180) / span), math.floor((lat + 90) / span))
+            if tile not in wanted:
+                continue
+            if zoom >= MAP_MARKER_ZOOM:
+                markers[tile].append(
+                    [corp['corp_id'], lat, lng, corp['job_posting_count'], corp['corp__name']]
+                )
+                continue
+            cell = (math.floor((lng + 180) / cell_span), math.floor((lat + 90) / cell_span))
+            acc = cells[tile].setdefault(cell, [0.0, 0.0, 0, 0])
+            acc[0] += lat
+            acc[1] += lng
+            acc[2] += 1
+            acc[3] += corp['job_posting_count']
+
+        if zoom >= MAP_MARKER_ZOOM:
+            return markers
+        # 클러스터 위치는 칸 안 기업 좌표의 평균
+        return {
+            tile: [
+                [round(lat_sum / corp_count, 6), round(lng_sum / corp_count, 6), corp_count, posting_count]
+                for _, (lat_sum, lng_sum, corp_count, posting_count) in sorted(tile_cells.items())
+            ]
+            for tile, tile_cells in cells.items()
+        }
 
 
 class CorpDetailView(generics.RetrieveAPIView):
@@ -154,6 +373,17 @@ class JobPostingListView(generics.ListAPIView):
     pagination_class = JobPostingListPagination
     filter_backends = [DjangoFilterBackend]
     filterset_class = JobPostingFilter
+
+    @property
+    def paginator(self):
+        """cursor 쿼리 파라미터가 있으면 keyset 페이지네이션, 없으면 기존 페이지 번호 방식"""
+        if not hasattr(self, '_paginator'):
+            if self.request is not None and JobPostingCursorPagination.cursor_query_param in self.request.query_params:
+                self._paginator = JobPostingCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_queryset(self):
         # 1. 기본 쿼리셋 (삭제 안 된 것들)
         queryset = JobPosting.objects.select_related('corp').filter(
@@ -171,7 +401,14 @@ class JobPostingListView(generics.ListAPIView):
         return queryset
     @swagger_auto_schema(
         operation_summary="채용 공고 조회 및 필터링",
-        operation_description="전체 공고 필터링(시/도, 경력 등) 또는 특정 기업의 공고를 조회합니다.",
+        operation_description="전체 공고 필터링(시/도, 경력 등) 또는 특정 기업의 공고를 조회합니다. "
+                              "cursor 파라미터를 주면 (created_at, id) 기준 커서 페이지네이션으로 조회합니다.",
+        manual_parameters=[
+            openapi.Parameter('cursor', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description='커서 페이지네이션 (첫 페이지는 빈 값, 이후 응답의 next_cursor)'),
+            openapi.Parameter('with_count', openapi.IN_QUERY, type=openapi.TYPE_BOOLEAN,
+                              description='커서 페이지네이션에서 전체 개수(count) 포함 여부 (기본값: false)'),
+        ],
         responses={
             200: JobPostingSerializer(many=True),
             404: "해당 ID의 기업을 찾을 수 없습니다."
@@ -244,21 +481,9 @@ class JobPostingByTechView(generics.ListAPIView):
     pagination_class = None  # 페이지네이션 비활성화
 
     def get_queryset(self):
-        from django.db.models import F
-        from django.db.models.functions import Coalesce
-        from datetime import date
-        
-        tech_stack_id = self.kwargs.get('tech_stack_id')
-        today = date.today()
-        
-        # 마감일이 적게 남은 순서로 정렬 (마감일이 없는 경우 맨 뒤로)
-        return JobPosting.objects.filter(
-            is_deleted=False,
-            tech_stacks__tech_stack_id=tech_stack_id,
-            tech_stacks__is_deleted=False
-        ).distinct().order_by(
-            F('expiry_date').asc(nulls_last=True)  # 마감일 오름차순 (null은 맨 뒤)
-        )[:100]  # 100개로 제한
+        # 마감일이 적게 남은 순서 (마감일이 없는 경우 맨 뒤로)
+        # 크롤링 후 미리 계산해 둔 기술 스택별 순위(tech_stack_deadline)를 기업 정보와 함께 한 번에 조회
+        return upcoming_job_postings(self.kwargs.get('tech_stack_id'))
 
 
 class CorpBookmarkListView(generics.ListCreateAPIView):
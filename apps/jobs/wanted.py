@@ -0,0 +1,216 @@
+"""
+원티드 채용공고 비동기 수집기
+run_crawling 명령어의 네트워크(fetch) 단계 전담
+
+- httpx.AsyncClient 하나로 호스트별 keep-alive 커넥션 재사용
+- asyncio.Semaphore로 동시 요청 수 제한
+- 토큰 버킷으로 초당 요청 수 제한 (기존 time.sleep(1) 대체)
+- 429/5xx/네트워크 오류 시 지수 백오프 재시도
+
+파싱/경력 정규화/저장 로직은 기존 명령어가 그대로 담당하며,
+이 모듈은 목록 페이지 1개와 그 상세 페이지 전부를 병렬로 가져와 넘겨줍니다.
+base_url 또는 transport를 주입하면 로컬 가짜 원티드 서버로 테스트할 수 있습니다.
+"""
+
+import asyncio
+import random
+import time
+
+import httpx
+
+
+WANTED_BASE_URL = "https://www.wanted.co.kr"
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://www.wanted.co.kr/wdlist/518",
+}
+
+# 목록 조회 기본 파라미터 (IT 개발 직군, 최신순)
+DEFAULT_LIST_PARAMS = {
+    "country": "kr",
+    "tag_type_ids": 518,
+    "job_sort": "job.latest_order",
+    "locations": "all",
+    "years": -1,
+}
+
+# 재시도 대상 상태 코드
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 요청 속도 제한기
+    rate: 초당 보충되는 토큰 수, capacity: 순간 최대 허용량(burst)
+    """
+
+    def __init__(self, rate: float, capacity: int | None = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1, int(rate)))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        """토큰 1개를 얻을 때까지 대기"""
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class WantedFetcher:
+    """
+    원티드 API 비동기 수집기
+
+    사용 예시:
+        with WantedFetcher(concurrency=8, rate=5) as fetcher:
+            for jobs in fetcher.iter_pages(limit=50):
+                for job, detail in jobs:
+                    ...  # 동기 코드(ORM)에서 그대로 처리
+    """
+
+    def __init__(
+        self,
+        base_url: str = WANTED_BASE_URL,
+        concurrency: int = 8,
+        rate: float = 5.0,
+        burst: int | None = None,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        timeout: float = 10.0,
+        headers: dict | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = max(1, concurrency)
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.headers = headers or DEFAULT_HEADERS
+        self.transport = transport
+
+        self._loop = None
+        self._client = None
+        self._semaphore = None
+        self._bucket = None
+
+    # ---- 수명 주기 (동기 코드에서 사용) ----
+    # AsyncClient는 생성된 이벤트 루프에 묶이므로, 루프 하나를 계속 유지해야
+    # 페이지가 바뀌어도 keep-alive 커넥션이 재사용됩니다.
+    def __enter__(self):
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._open())
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            self._loop.run_until_complete(self._close())
+        finally:
+            self._loop.close()
+            self._loop = None
+
+    async def _open(self):
+        limits = httpx.Limits(
+            max_connections=self.concurrency,
+            max_keepalive_connections=self.concurrency,
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self.timeout,
+            limits=limits,
+            transport=self.transport,
+        )
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._bucket = TokenBucket(self.rate, self.burst)
+
+    async def _close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # ---- 요청 ----
+    async def _get_json(self, path: str, params: dict | None = None) -> dict | None:
+        """
+        GET 요청 후 JSON 반환 (실패 시 None)
+        재시도 대상 오류(429/5xx, 네트워크 오류, JSON이 아닌 200 응답)는 지수 백오프(+지터) 후 max_retries번까지 다시 시도합니다.
+        """
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.acquire()
+            try:
+                async with self._semaphore:
+                    response = await self._client.get(path, params=params)
+            except httpx.TransportError:
+                response = None
+
+            if response is not None:
+                if response.status_code == 200:
+                    try:
+                        return response.json()
+                    except ValueError:
+                        # 200이지만 본문이 JSON이 아니면 (점검/차단 HTML 페이지 등) 일시적 오류로 보고 재시도
+                        pass
+                elif response.status_code not in RETRY_STATUS_CODES:
+                    return None
+
+            if attempt < self.max_retries:
+                delay = self.backoff * (2 ** attempt)
+                # 서버가 Retry-After를 주면 그 값을 우선 사용
+                if response is not None and response.headers.get("Retry-After", "").isdigit():
+                    delay = max(delay, float(response.headers["Retry-After"]))
+                await asyncio.sleep(delay + random.uniform(0, self.backoff))
+        return None
+
+    async def fetch_list(self, offset: int, limit: int) -> list[dict] | None:
+        """목록 페이지 조회 (요청 자체가 실패하면 None, 데이터가 없으면 빈 리스트)"""
+        params = {**DEFAULT_LIST_PARAMS, "limit": limit, "offset": offset}
+        data = await self._get_json("/api/v4/jobs", params=params)
+        if data is None:
+            return None
+        return data.get("data", [])
+
+    async def fetch_detail(self, wanted_job_id) -> dict | None:
+        """상세 페이지 조회"""
+        return await self._get_json(f"/api/v4/jobs/{wanted_job_id}")
+
+    async def fetch_page(self, offset: int, limit: int) -> list[tuple[dict, dict]] | None:
+        """
+        목록 페이지 1개 + 해당 페이지 상세 페이지 전체를 병렬로 조회
+        반환: 목록 순서를 유지한 [(목록 job, 상세 데이터)] (상세 조회 실패 건은 제외)
+        목록 요청이 실패했거나 더 이상 공고가 없으면 None
+        """
+        jobs = await self.fetch_list(offset, limit)
+        if not jobs:
+            return None
+
+        targets = [job for job in jobs if job.get("id")]
+        details = await asyncio.gather(*(self.fetch_detail(job["id"]) for job in targets))
+        return [(job, detail) for job, detail in zip(targets, details) if detail is not None]
+
+    # ---- 동기 인터페이스 ----
+    def get_page(self, offset: int, limit: int):
+        return self._loop.run_until_complete(self.fetch_page(offset, limit))
+
+    def iter_pages(self, limit: int = 50, start_offset: int = 0):
+        """목록 페이지 단위로 [(job, detail)]을 순서대로 반환 (목록이 끝나면 종료)"""
+        offset = start_offset
+        while True:
+            page = self.get_page(offset, limit)
+            if page is None:
+                return
+            yield page
+            offset += limit
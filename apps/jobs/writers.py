@@ -0,0 +1,140 @@
+"""
+크롤링 결과 일괄 저장
+run_crawling이 파싱한 공고를 페이지 단위로 모아 몇 개의 집합 연산 쿼리로 저장합니다.
+
+- Corp: name 기준 upsert (INSERT ... ON CONFLICT (name) DO UPDATE)
+- JobPosting: posting_number 기준 upsert
+- JobPostingStack: 기존 연결과 비교해 사라진 연결만 삭제, 새 연결만 bulk insert
+- TechStack.job_stack_count: 영향을 받은 기술 스택만 기록해 두었다가 GROUP BY 1회로 재계산 (counters.py)
+- CategoryJobPosting: 저장한 공고들의 카테고리 소속을 커밋 시점에 재계산 (apps/trends/membership.py)
+"""
+
+from django.db import transaction
+
+from apps.trends.membership import mark_job_postings_dirty
+from .counters import mark_stacks_dirty
+from .models import Corp, JobPosting, JobPostingStack
+
+
+CORP_UPDATE_FIELDS = [
+    'logo_url', 'address', 'region_city', 'region_district',
+    'latitude', 'longitude', 'is_deleted', 'updated_at',
+]
+
+JOB_POSTING_UPDATE_FIELDS = [
+    'corp', 'title', 'url', 'description', 'expiry_date', 'career',
+    'min_career', 'max_career', 'is_deleted', 'updated_at',
+]
+
+
+class JobPostingWriter:
+    """
+    파싱된 공고(dict) 묶음을 일괄 저장하는 writer
+
+    공고 dict 형식:
+        {
+            'posting_number': 원티드 공고 ID,
+            'corp': {'name', 'logo_url', 'address', 'region_city', 'region_district', 'latitude', 'longitude'},
+            'title', 'url', 'description', 'expiry_date', 'career', 'min_career', 'max_career',
+            'tech_stack_ids': {기술 스택 ID, ...},
+        }
+    """
+
+    def __init__(self):
+        self.saved_count = 0
+
+    def write(self, postings: list[dict]) -> int:
+        """공고 묶음을 저장하고 저장된 공고 수를 반환"""
+        # 같은 묶음 안의 중복은 마지막 값 우선 (기존 순차 update_or_create와 동일)
+        by_number = {}
+        for posting in postings:
+            by_number[posting['posting_number']] = posting
+        if not by_number:
+            return 0
+
+        corps_by_name = {}
+        for posting in by_number.values():
+            corps_by_name[posting['corp']['name']] = posting['corp']
+
+        with transaction.atomic():
+            corp_ids = self._upsert_corps(corps_by_name)
+            posting_ids = self._upsert_postings(by_number, corp_ids)
+            touched_stack_ids = self._sync_stack_links(by_number, posting_ids)
+            # 커밋 시점(또는 deferred_job_stack_counts 블록 종료 시점)에 한 번에 재계산
+            mark_stacks_dirty(touched_stack_ids)
+            # 카테고리 소속(category_job_posting)도 커밋 시점에 이 공고들만 다시 계산
+            mark_job_postings_dirty(posting_ids.values())
+
+        self.saved_count += len(by_number)
+        return len(by_number)
+
+    def _upsert_corps(self, corps_by_name: dict) -> dict:
+        Corp.objects.bulk_create(
+            [Corp(is_deleted=False, **corp) for corp in corps_by_name.values()],
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=CORP_UPDATE_FIELDS,
+        )
+        return dict(
+            Corp.objects.filter(name__in=corps_by_name).values_list('name', 'id')
+        )
+
+    def _upsert_postings(self, by_number: dict, corp_ids: dict) -> dict:
+        objs = []
+        for number, posting in by_number.items():
+            objs.append(JobPosting(
+                posting_number=number,
+                corp_id=corp_ids[posting['corp']['name']],
+                title=posting['title'],
+                url=posting['url'],
+                description=posting['description'],
+                expiry_date=posting['expiry_date'],
+                career=posting['career'],
+                min_career=posting['min_career'],
+                max_career=posting['max_career'],
+                is_deleted=False,
+            ))
+
+        JobPosting.objects.bulk_create(
+            objs,
+            update_conflicts=True,
+            unique_fields=['posting_number'],
+            update_fields=JOB_POSTING_UPDATE_FIELDS,
+        )
+        return dict(
+            JobPosting.objects.filter(posting_number__in=by_number).values_list('posting_number', 'id')
+        )
+
+    def _sync_stack_links(self, by_number: dict, posting_ids: dict) -> set:
+        """공고-기술 연결을 원하는 상태로 맞추고, 영향받은 기술 스택 ID를 반환"""
+        desired = set()
+        for number, posting in by_number.items():
+            job_posting_id = posting_ids[number]
+            for tech_stack_id in posting['tech_stack_ids']:
+                desired.add((job_posting_id, tech_stack_id))
+
+        existing = {}
+        deleted_link_ids = []
+        for link_id, job_posting_id, tech_stack_id, is_deleted in JobPostingStack.objects.filter(
+            job_posting_id__in=posting_ids.values()
+        ).values_list('id', 'job_posting_id', 'tech_stack_id', 'is_deleted'):
+            existing[(job_posting_id, tech_stack_id)] = link_id
+            if is_deleted and (job_posting_id, tech_stack_id) in desired:
+                deleted_link_ids.append(link_id)
+
+        stale = {link_id for key, link_id in existing.items() if key not in desired}
+        new = desired - existing.keys()
+
+        if stale:
+            JobPostingStack.objects.filter(id__in=stale).delete()
+        if deleted_link_ids:
+            # 소프트 삭제된 연결이 다시 매칭되면 복구
+            JobPostingStack.objects.filter(id__in=deleted_link_ids).update(is_deleted=False)
+        if new:
+            JobPostingStack.objects.bulk_create(
+                [JobPostingStack(job_posting_id=p, tech_stack_id=t) for p, t in new],
+                ignore_conflicts=True,
+            )
+
+        # 공고 자체가 복구(is_deleted=False)됐을 수도 있으므로 현재 연결된 스택 전체를 재계산 대상으로 삼음
+        return {t for _, t in desired} | {t for (_, t), link_id in existing.items() if link_id in stale}
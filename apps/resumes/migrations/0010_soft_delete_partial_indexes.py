@@ -0,0 +1,24 @@
+# Generated by Django 5.0.14 on 2026-10-17 04:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0011_soft_delete_partial_indexes'),
+        ('resumes', '0009_resumematching_answer'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resume',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['user', '-created_at'], name='resume_active_user_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='resumematching',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['resume', '-id'], name='resume_matching_active_idx'),
+        ),
+    ]
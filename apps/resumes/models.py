@@ -17,6 +17,14 @@ class Resume(models.Model):
         verbose_name = '이력서'
         verbose_name_plural = '이력서 목록'
         ordering = ['-created_at']
+        indexes = [
+            # 내 이력서 목록: 사용자별 최신순 (삭제되지 않은 이력서만)
+            models.Index(
+                fields=['user', '-created_at'],
+                name='resume_active_user_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.title}"
@@ -49,6 +57,14 @@ class ResumeMatching(models.Model):
         verbose_name = '이력서 매칭'
         verbose_name_plural = '이력서 매칭 목록'
         unique_together = ['job_posting', 'resume']
+        indexes = [
+            # 매칭 목록: 이력서별 최신순 (삭제되지 않은 매칭만)
+            models.Index(
+                fields=['resume', '-id'],
+                name='resume_matching_active_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
 
 class WorkExperience(models.Model):
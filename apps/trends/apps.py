@@ -5,3 +5,7 @@ class TrendsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.trends'
     verbose_name = '기술 트렌드'
+
+    # 앱이 시작될 때 캐시 무효화 시그널을 등록합니다.
+    def ready(self):
+        import apps.trends.signals
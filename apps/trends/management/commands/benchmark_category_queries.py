@@ -0,0 +1,218 @@
+"""
+카테고리별 공고/게시글 목록 쿼리 벤치마크
+기존 연결 테이블 조인 + DISTINCT 방식, EXISTS 세미조인 방식, 사전 계산된 카테고리 소속 테이블(현재 뷰)의
+COUNT(*) 및 페이지 조회 시간을 비교합니다.
+가짜 공고/게시글은 generate_series로 DB 안에서 생성하며, 모든 작업은 트랜잭션 안에서 실행 후 롤백됩니다.
+
+사용 예:
+    python manage.py benchmark_category_queries                      # 공고 10만건, 게시글 100만건
+    python manage.py benchmark_category_queries --postings 10000 --articles 100000
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+
+from apps.jobs.models import Corp, JobPosting, JobPostingStack
+from apps.trends.membership import rebuild_category_memberships
+from apps.trends.models import (
+    Article, ArticleStack, Category, CategoryArticle, CategoryJobPosting, CategoryTech, TechStack
+)
+
+
+class Rollback(Exception):
+    """벤치마크 후 트랜잭션 롤백용"""
+
+
+def legacy_querysets(category_id) -> dict:
+    """기존 뷰의 쿼리 (연결 테이블 조인 + DISTINCT, 비교용)"""
+    stacks_in_category = TechStack.objects.filter(category_relations__category_id=category_id, is_deleted=False)
+    return {
+        'jobs': JobPosting.objects.filter(
+            tech_stacks__tech_stack__in=stacks_in_category, is_deleted=False
+        ).distinct().order_by('-id'),
+        'articles': Article.objects.filter(
+            tech_stacks__tech_stack__in=stacks_in_category, is_deleted=False
+        ).distinct().order_by('-id'),
+    }
+
+
+def exists_querysets(category_id) -> dict:
+    """EXISTS 세미조인 쿼리 (비교용)"""
+    stack_ids = list(TechStack.objects.filter(
+        category_relations__category_id=category_id, is_deleted=False
+    ).values_list('id', flat=True))
+    return {
+        'jobs': JobPosting.objects.filter(
+            Exists(JobPostingStack.objects.filter(job_posting_id=OuterRef('pk'), tech_stack_id__in=stack_ids)),
+            is_deleted=False,
+        ).order_by('-id'),
+        'articles': Article.objects.filter(
+            Exists(ArticleStack.objects.filter(article_id=OuterRef('pk'), tech_stack_id__in=stack_ids)),
+            is_deleted=False,
+        ).order_by('-id'),
+    }
+
+
+def membership_querysets(category_id) -> dict:
+    """현재 뷰의 쿼리 (category_job_posting, category_article 소속 테이블, 개수는 소속 테이블만으로 계산)"""
+    return {
+        'jobs': (
+            JobPosting.objects.filter(
+                category_memberships__category_id=category_id, is_deleted=False
+            ).order_by('-category_memberships__job_posting_id'),
+            CategoryJobPosting.objects.filter(category_id=category_id),
+        ),
+        'articles': (
+            Article.objects.filter(
+                category_memberships__category_id=category_id, is_deleted=False
+            ).order_by('-category_memberships__article_id'),
+            CategoryArticle.objects.filter(category_id=category_id),
+        ),
+    }
+
+
+def seed(postings: int, articles: int, stack_count: int, links: int, category_stacks: int) -> int:
+    """가짜 기술 스택/카테고리/공고/게시글과 연결을 만들고 카테고리 ID를 반환"""
+    stacks = TechStack.objects.bulk_create([
+        TechStack(name=f'__bench_stack_{i}') for i in range(stack_count)
+    ])
+    stack_ids = [stack.id for stack in stacks]
+    category = Category.objects.create(name='__bench_category')
+    CategoryTech.objects.bulk_create([
+        CategoryTech(category=category, tech_stack_id=tech_id) for tech_id in stack_ids[:category_stacks]
+    ])
+    corp = Corp.objects.create(name='__bench_corp')
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {JobPosting._meta.db_table}
+                (url, title, corp_id, min_career, max_career, created_at, updated_at, is_deleted)
+            SELECT '__bench_posting_' || g, '벤치마크 공고 ' || g, %s, 0, 100, now(), now(), false
+            FROM generate_series(1, %s) AS g
+            """,
+            [corp.id, postings],
+        )
+        cursor.execute(
+            f"""
+            INSERT INTO {Article._meta.db_table}
+                (url, source, view_count, created_at, updated_at, is_deleted)
+            SELECT '__bench_article_' || g, 'benchmark', g %% 1000, now(), now(), false
+            FROM generate_series(1, %s) AS g
+            """,
+            [articles],
+        )
+        # 공고/게시글마다 기술 스택 최대 links개를 무작위로 연결
+        for link_table, owner_table, owner_column, prefix in (
+            (JobPostingStack._meta.db_table, JobPosting._meta.db_table, 'job_posting_id', '__bench_posting_'),
+            (ArticleStack._meta.db_table, Article._meta.db_table, 'article_id', '__bench_article_'),
+        ):
+            cursor.execute(
+                f"""
+                INSERT INTO {link_table} ({owner_column}, tech_stack_id, created_at, updated_at, is_deleted)
+                SELECT DISTINCT o.id, (%s::bigint[])[1 + floor(random() * %s)::int], now(), now(), false
+                FROM {owner_table} o CROSS JOIN generate_series(1, %s)
+                WHERE o.url LIKE %s
+                ON CONFLICT DO NOTHING
+                """,
+                [stack_ids, len(stack_ids), links, prefix + '%'],
+            )
+        for table in (JobPosting, JobPostingStack, Article, ArticleStack, TechStack, CategoryTech):
+            cursor.execute(f"ANALYZE {table._meta.db_table}")
+    return category.id
+
+
+def measure(querysets, repeat: int, page_size: int, offset: int) -> tuple[float, float, int, list]:
+    """
+    (COUNT 평균 초, 페이지 조회 평균 초, 개수, 페이지 ID 목록)
+    querysets: 목록 쿼리셋 또는 (목록 쿼리셋, 개수 쿼리셋)
+    """
+    queryset, count_queryset = querysets if isinstance(querysets, tuple) else (querysets, querysets)
+    count_sec = page_sec = 0.0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = count_queryset.count()
+        count_sec += time.perf_counter() - started
+
+        started = time.perf_counter()
+        page = list(queryset.values_list('id', flat=True)[offset:offset + page_size])
+        page_sec += time.perf_counter() - started
+    return count_sec / repeat, page_sec / repeat, count, page
+
+
+MODES = (
+    ('join+distinct', legacy_querysets),
+    ('exists', exists_querysets),
+    ('membership', membership_querysets),
+)
+
+
+class Command(BaseCommand):
+    help = '카테고리별 공고/게시글 목록 쿼리(조인+DISTINCT vs EXISTS vs 소속 테이블) 시간 비교 (결과는 롤백됨)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--postings', type=int, default=100_000, help='가짜 공고 수 (기본값: 100,000)')
+        parser.add_argument('--articles', type=int, default=1_000_000, help='가짜 게시글 수 (기본값: 1,000,000)')
+        parser.add_argument('--stacks', type=int, default=200, help='가짜 기술 스택 수 (기본값: 200)')
+        parser.add_argument('--links', type=int, default=3, help='공고/게시글당 연결할 기술 스택 최대 수 (기본값: 3)')
+        parser.add_argument('--category-stacks', type=int, default=20, help='카테고리에 속한 기술 스택 수 (기본값: 20)')
+        parser.add_argument('--page', type=int, default=1, help='조회할 페이지 번호 (기본값: 1, 페이지당 20건)')
+        parser.add_argument('--repeat', type=int, default=3, help='쿼리 반복 횟수 (기본값: 3)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write(self.style.ERROR("❌ PostgreSQL에서만 실행할 수 있습니다."))
+            return
+
+        page_size = 20
+        offset = (max(1, options['page']) - 1) * page_size
+        repeat = max(1, options['repeat'])
+        results = {}
+        try:
+            with transaction.atomic():
+                started = time.perf_counter()
+                category_id = seed(
+                    options['postings'], options['articles'], options['stacks'],
+                    options['links'], options['category_stacks'],
+                )
+                self.stdout.write(f"🌱 데이터 생성 완료 ({time.perf_counter() - started:.1f}s)")
+
+                started = time.perf_counter()
+                memberships = rebuild_category_memberships([category_id])
+                with connection.cursor() as cursor:
+                    for model in (CategoryJobPosting, CategoryArticle):
+                        cursor.execute(f"ANALYZE {model._meta.db_table}")
+                self.stdout.write(
+                    f"🧱 카테고리 소속 재구성 ({time.perf_counter() - started:.1f}s): "
+                    f"공고 {memberships['job_posting']:,}건, 게시글 {memberships['article']:,}건"
+                )
+
+                for mode, querysets in MODES:
+                    for target, queryset in querysets(category_id).items():
+                        results[(mode, target)] = measure(queryset, repeat, page_size, offset)
+                raise Rollback
+        except Rollback:
+            pass
+
+        self.stdout.write(
+            f"📊 공고 {options['postings']:,}건, 게시글 {options['articles']:,}건 "
+            f"(기술 스택 {options['stacks']}개 중 카테고리 {options['category_stacks']}개, "
+            f"항목당 연결 최대 {options['links']}개, {options['page']}페이지)"
+        )
+        mismatches = []
+        for target in ('jobs', 'articles'):
+            for mode, _ in MODES:
+                count_sec, page_sec, count, _ = results[(mode, target)]
+                self.stdout.write(
+                    f"  {target:<8} {mode:<13} COUNT: {count_sec * 1000:>9.1f}ms | "
+                    f"페이지: {page_sec * 1000:>9.1f}ms | {count:,}건"
+                )
+            if any(results[(mode, target)][2:] != results[('join+distinct', target)][2:] for mode, _ in MODES):
+                mismatches.append(target)
+
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"❌ 결과가 다른 목록: {', '.join(mismatches)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS("✅ 모든 방식의 개수와 페이지 결과가 동일합니다."))
@@ -1,145 +1,18 @@
 """
 Posts.xml에서 날짜별 기술 스택 언급량 집계 및 tech_trend 테이블의 article_mention_count, article_change_rate 업데이트
+(Article 저장과 CSV 리포트까지 한 번에 처리하려면 analytics 앱의 ingest_stackoverflow 명령 사용)
 """
-import re
 from collections import defaultdict
 from pathlib import Path
-from xml.etree.ElementTree import iterparse
-from datetime import datetime, date, timedelta, timezone
+from datetime import timedelta
 
 from django.core.management.base import BaseCommand
 from django.utils import timezone as django_timezone
-from django.db import transaction
 
-from apps.trends.models import TechStack, TechTrend
-
-
-# analyze_stackoverflow.py와 동일한 유틸리티 함수들
-TOKEN_RE = re.compile(r"[a-z0-9\+\#\.\-]+")
-
-NOISE_TECHS = {
-    "d", "q",
-    "make", "simple", "mean", "parse", "render", "echo", "stream", "buffer", "heap",
-    "box", "hub", "dash", "flux", "salt", "ent", "tower", "buddy",
-    "play", "linear", "segment", "prism", "foundation", "slick", "realm", "crystal",
-}
-KNOWN_SHORT_TECHS = {"go", "r", "d3", "qt"}
-
-
-def is_noise_tech(normalized_tech: str) -> bool:
-    if normalized_tech in KNOWN_SHORT_TECHS:
-        return False
-    if not normalized_tech or normalized_tech in NOISE_TECHS:
-        return True
-    toks = TOKEN_RE.findall(normalized_tech)
-    if not toks:
-        return True
-    if len(toks) == 1:
-        t = toks[0]
-        if t.isalpha() and len(t) <= 2:
-            return True
-    return False
-
-
-def normalize_spaces(s: str) -> str:
-    return " ".join((s or "").split())
-
-
-def normalize_tech_name(name: str) -> str:
-    return normalize_spaces(name).lower()
-
-
-def normalize_tags(tags: str) -> str:
-    t = tags or ""
-    if "|" in t:
-        return normalize_spaces(t.replace("|", " "))
-    return normalize_spaces(t.replace("><", "> <").replace("<", " ").replace(">", " "))
-
-
-def normalize_post_text(title: str, body: str, tags: str) -> str:
-    tags_clean = normalize_tags(tags)
-    text = f"{title or ''} {body or ''} {tags_clean}"
-    return normalize_spaces(text).lower()
-
-
-def parse_creation_dt(s: str) -> datetime | None:
-    """CreationDate -> datetime(UTC) (analyze_stackoverflow.py와 동일)"""
-    if not s:
-        return None
-    try:
-        # Z가 있으면 +00:00로 바꿔서 파싱
-        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-        # tz 없는 값이면 UTC로 강제
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
-    except ValueError:
-        return None
-
-
-def iter_posts_with_date(posts_xml_path: Path):
-    """Posts.xml을 파싱하여 (post_id, post_type, title, body, tags, created_at) 반환"""
-    context = iterparse(posts_xml_path, events=("end",))
-    try:
-        for _, elem in context:
-            if elem.tag != "row":
-                continue
-
-            a = elem.attrib
-            post_id = a.get("Id") or ""
-            post_type = a.get("PostTypeId") or ""
-            title = a.get("Title") or ""
-            body = a.get("Body") or ""
-            tags = a.get("Tags") or ""
-            created_raw = a.get("CreationDate") or ""
-
-            created_at = parse_creation_dt(created_raw)
-
-            elem.clear()
-            yield post_id, post_type, title, body, tags, created_at
-    except Exception as e:
-        import sys
-        print(f"Warning: XML parsing error: {e}", file=sys.stderr)
-
-
-def tokens_match(tech_tokens: list[str], post_tokens: list[str]) -> bool:
-    """tech 토큰 시퀀스가 post_tokens에 연속으로 등장하는지 확인"""
-    if not tech_tokens:
-        return False
-    L = len(tech_tokens)
-    if L > len(post_tokens):
-        return False
-    for i in range(len(post_tokens) - L + 1):
-        if post_tokens[i:i + L] == tech_tokens:
-            return True
-    return False
-
-
-def build_tech_index(tech_stacks):
-    """TechStack 쿼리셋을 인덱스로 변환"""
-    single_index = defaultdict(list)
-    multi_index = defaultdict(list)
-    tech_tokens_map = {}
-    tech_id_map = {}  # normalized_tech -> tech_stack_id
-
-    for tech_stack in tech_stacks:
-        tech_name = normalize_tech_name(tech_stack.name)
-        if is_noise_tech(tech_name):
-            continue
-
-        tokens = TOKEN_RE.findall(tech_name)
-        if not tokens:
-            continue
-
-        tech_tokens_map[tech_name] = tokens
-        tech_id_map[tech_name] = tech_stack.id
-
-        if len(tokens) == 1:
-            single_index[tokens[0]].append(tech_name)
-        else:
-            multi_index[tokens[0]].append(tech_name)
-
-    return single_index, multi_index, tech_tokens_map, tech_id_map
+from apps.trends.models import TechTrend
+from apps.trends.matcher import get_tech_matcher
+from apps.trends.writers import save_article_trends
+from apps.analytics.stackoverflow import iter_posts, match_post
 
 
 class Command(BaseCommand):
@@ -207,9 +80,8 @@ class Command(BaseCommand):
 
         # 1. TechStack 로드 및 인덱스 생성
         self.stdout.write("🔍 기술 스택 인덱스 생성 중...")
-        tech_stacks = TechStack.objects.filter(is_deleted=False)
-        single_index, multi_index, tech_tokens_map, tech_id_map = build_tech_index(tech_stacks)
-        self.stdout.write(f"✅ {len(tech_id_map)}개 기술 스택 로드 완료")
+        matcher = get_tech_matcher()
+        self.stdout.write(f"✅ {len(matcher)}개 기술 스택 로드 완료")
 
         # 2. 날짜별, 기술 스택별 언급량 집계
         trends_data = defaultdict(lambda: defaultdict(int))  # {date: {tech_id: count}}
@@ -218,7 +90,7 @@ class Command(BaseCommand):
 
         self.stdout.write("📖 Posts.xml 파싱 중...")
 
-        for post_id, post_type, title, body, tags, created_at in iter_posts_with_date(posts_path):
+        for post_id, post_type, title, body, tags, _, created_at in iter_posts(posts_path):
             scanned += 1
 
             if scanned % progress_interval == 0:
@@ -240,32 +112,9 @@ class Command(BaseCommand):
 
             processed += 1
 
-            # 게시글 텍스트 정규화 및 토큰화
-            text = normalize_post_text(title, body, tags)
-            post_tokens = TOKEN_RE.findall(text)
-            post_tok_set = set(post_tokens)
-
-            seen_in_this_post = set()
-
-            # 단일 토큰 기술 매칭
-            for tok in post_tok_set:
-                for tech_name in single_index.get(tok, []):
-                    if tech_name in seen_in_this_post:
-                        continue
-                    tech_id = tech_id_map[tech_name]
-                    trends_data[created_date][tech_id] += 1
-                    seen_in_this_post.add(tech_name)
-
-            # 다중 토큰 기술 매칭
-            for tok in post_tok_set:
-                for tech_name in multi_index.get(tok, []):
-                    if tech_name in seen_in_this_post:
-                        continue
-                    tech_tokens = tech_tokens_map[tech_name]
-                    if tokens_match(tech_tokens, post_tokens):
-                        tech_id = tech_id_map[tech_name]
-                        trends_data[created_date][tech_id] += 1
-                        seen_in_this_post.add(tech_name)
+            # 단일/다중 토큰 기술을 한 번의 선형 탐색으로 매칭 (payload = TechStack ID)
+            for tech_id in match_post(matcher, title, body, tags):
+                trends_data[created_date][tech_id] += 1
 
         self.stdout.write(f"✅ 총 {scanned:,}개 게시글 스캔, {processed:,}개 Question 처리 완료")
         
@@ -278,68 +127,9 @@ class Command(BaseCommand):
             self.stdout.write(f"   예시: {sample_date} - {sample_count}개 기술 스택")
 
         # 3. tech_trend 테이블에 저장/업데이트
-        # 각 날짜별로 전체 기술 스택 언급량 대비 각 기술 스택의 언급량 비율(%)을 계산하여 저장
+        # 각 날짜별로 전체 기술 스택 언급량 대비 각 기술 스택의 언급량 비율(%)을 계산하여 일괄 저장
         self.stdout.write("💾 tech_trend 테이블 저장 중...")
-        created_count = 0
-        updated_count = 0
-
-        sorted_dates = sorted(trends_data.keys())
-
-        with transaction.atomic():
-            for ref_date in sorted_dates:
-                tech_counts = trends_data[ref_date]
-
-                # 해당 날짜의 전체 기술 스택 언급량 합계 계산
-                total_mentions = sum(tech_counts.values())
-                
-                if total_mentions == 0:
-                    # 언급량이 없으면 비율 계산 불가, 모든 기술 스택에 0.0 저장
-                    for tech_id in tech_counts.keys():
-                        try:
-                            tech_stack = TechStack.objects.get(id=tech_id, is_deleted=False)
-                        except TechStack.DoesNotExist:
-                            continue
-                        
-                        trend, created = TechTrend.objects.update_or_create(
-                            tech_stack=tech_stack,
-                            reference_date=ref_date,
-                            defaults={
-                                'article_mention_count': 0,
-                                'article_change_rate': 0.0,
-                                'is_deleted': False,
-                            }
-                        )
-                        if created:
-                            created_count += 1
-                        else:
-                            updated_count += 1
-                    continue
-
-                # 각 기술 스택별로 비율 계산 및 저장
-                for tech_id, mention_count in tech_counts.items():
-                    try:
-                        tech_stack = TechStack.objects.get(id=tech_id, is_deleted=False)
-                    except TechStack.DoesNotExist:
-                        continue
-
-                    # 전체 대비 비율 계산 (%)
-                    article_change_rate = (mention_count / total_mentions) * 100
-
-                    # TechTrend 생성 또는 업데이트 (article 필드만 업데이트, job 필드는 유지)
-                    trend, created = TechTrend.objects.update_or_create(
-                        tech_stack=tech_stack,
-                        reference_date=ref_date,
-                        defaults={
-                            'article_mention_count': mention_count,
-                            'article_change_rate': round(article_change_rate, 2),
-                            'is_deleted': False,
-                        }
-                    )
-
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
+        created_count, updated_count = save_article_trends(trends_data)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -1,14 +1,19 @@
 """
 특정 기간 동안의 게시글 트렌드 데이터를 생성하는 명령어
 로직: 2025년 12월 데이터를 랜덤하게 섞어서 새 기간에 적용
+언급량만 소스에서 가져오고, article_change_rate는 새 기간의 날짜별 전체 대비 비율(%)로 다시 계산
 """
-import random
+from collections import defaultdict
 from datetime import date, timedelta
+
+import numpy as np
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.db import transaction
 
 from apps.trends.models import TechStack, TechTrend
+from apps.trends.rollups import refresh_trend_rollups
+from apps.trends.writers import save_trend_matrix
 
 
 class Command(BaseCommand):
@@ -82,65 +87,39 @@ class Command(BaseCommand):
         self.stdout.write(f"📅 소스 기간: {source_start} ~ {source_end}")
         self.stdout.write(f"📊 기술 스택: {len(stacks)}개")
 
-        # 1. 각 기술 스택별로 소스 기간의 데이터 수집
+        # 1. 각 기술 스택별로 소스 기간의 데이터 수집 (쿼리 1회)
         self.stdout.write(f"🔍 소스 기간({source_start} ~ {source_end})의 데이터 조회 중...")
         
-        # {stack_id: [(article_mention_count, article_change_rate), ...]}
-        source_data = {}
-        stacks_with_data = 0
-        
-        for stack in stacks:
-            trends = TechTrend.objects.filter(
-                tech_stack=stack,
-                reference_date__gte=source_start,
-                reference_date__lte=source_end,
-                is_deleted=False,
-                article_mention_count__gt=0
-            ).values_list('article_mention_count', 'article_change_rate')
-            
-            if trends:
-                source_data[stack.id] = list(trends)
-                stacks_with_data += 1
-            else:
-                # 소스 데이터가 없으면 기본값 리스트 생성
-                source_data[stack.id] = [(50, 1.0)] * 10  # 기본값 10개
+        # {stack_id: [article_mention_count, ...]}
+        source_data = defaultdict(list)
+        source_rows = TechTrend.objects.filter(
+            tech_stack__in=stacks,
+            reference_date__gte=source_start,
+            reference_date__lte=source_end,
+            is_deleted=False,
+            article_mention_count__gt=0
+        ).values_list('tech_stack_id', 'article_mention_count')
+        for stack_id, mention_count in source_rows:
+            source_data[stack_id].append(mention_count)
         
-        self.stdout.write(f"✅ 소스 데이터 로드 완료: {stacks_with_data}개 기술 스택에 데이터 있음")
+        self.stdout.write(f"✅ 소스 데이터 로드 완료: {len(source_data)}개 기술 스택에 데이터 있음")
 
-        created_count = 0
-        updated_count = 0
+        # 2. 기술 스택별로 소스 데이터에서 날짜 수만큼 랜덤 선택해 (날짜, 기술 스택) 행렬 구성
+        # 소스 데이터가 없으면 기본값 50
+        rng = np.random.default_rng()
+        counts = np.empty((total_days, len(stacks)), dtype=np.int64)
+        for col, stack in enumerate(stacks):
+            counts[:, col] = rng.choice(source_data.get(stack.id, [50]), size=total_days)
 
+        # 3. 날짜별 전체 대비 비율을 계산해 일괄 저장 (job 필드는 유지, article 필드만 업데이트)
+        dates = [start_date + timedelta(days=offset) for offset in range(total_days)]
         with transaction.atomic():
-            # 날짜별로 처리 (시작일부터 종료일까지)
-            for day_offset in range(total_days):
-                target_date = start_date + timedelta(days=day_offset)
-
-                # 각 기술 스택별로 소스 데이터에서 랜덤 선택
-                for stack in stacks:
-                    stack_source = source_data.get(stack.id, [(50, 1.0)])
-                    
-                    # 랜덤하게 하나 선택
-                    mention_count, change_rate = random.choice(stack_source)
-                    
-                    # 저장 (job 필드는 유지, article 필드만 업데이트)
-                    trend, created = TechTrend.objects.update_or_create(
-                        tech_stack=stack,
-                        reference_date=target_date,
-                        defaults={
-                            'article_mention_count': mention_count,
-                            'article_change_rate': round(change_rate, 2) if change_rate else 0.0,
-                            'is_deleted': False
-                        }
-                    )
-                    
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
+            created_count, updated_count = save_trend_matrix(
+                'article', dates, [stack.id for stack in stacks], counts
+            )
 
-                # 진행 상황 출력 (매 7일마다)
-                if day_offset % 7 == 0:
-                    self.stdout.write(f"  처리 중: {target_date}...")
+        # 기간별 언급량 합계(tech_trend_rollup) 및 해당 기간의 주/월 단위 집계 재계산
+        refresh_trend_rollups(start_date, end_date)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -4,6 +4,7 @@ Django management command to apply categorization from tech_stacks_merged_final.
 import csv
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from apps.trends.membership import deferred_category_memberships, rebuild_category_memberships
 from apps.trends.models import TechStack, Category, CategoryTech
 from apps.trends.management.commands.categorize_stacks import TECH_TO_CATEGORIES
 
@@ -19,6 +20,7 @@ class Command(BaseCommand):
         )
 
     @transaction.atomic
+    @deferred_category_memberships()  # 연결마다 카테고리 소속을 갱신하지 않고 마지막에 일괄 재구성
     def handle(self, *args, **options):
         source_csv_path = options['source_csv']
         self.stdout.write(self.style.SUCCESS(f'--- Applying categories from {source_csv_path} ---'))
@@ -90,6 +92,12 @@ class Command(BaseCommand):
                 f'  - Tech stacks without categories (not in TECH_TO_CATEGORIES): {tech_without_categories}'
             ))
 
+            memberships = rebuild_category_memberships()
+            self.stdout.write(
+                f'Rebuilt category memberships: {memberships["job_posting"]} job postings, '
+                f'{memberships["article"]} articles.'
+            )
+
         except FileNotFoundError:
             self.stdout.write(self.style.ERROR(f'Source CSV file not found: {source_csv_path}.'))
             raise
@@ -5,6 +5,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
+from apps.trends.membership import deferred_category_memberships
 from apps.trends.models import TechStack
 
 class Command(BaseCommand):
@@ -19,6 +20,7 @@ class Command(BaseCommand):
         )
 
     @transaction.atomic
+    @deferred_category_memberships()  # 삭제 상태가 바뀐 기술 스택의 카테고리 소속은 마지막에 한 번에 갱신
     def handle(self, *args, **options):
         source_csv_path = options['source_csv']
         self.stdout.write(self.style.SUCCESS(f'--- Syncing TechStacks from {source_csv_path} ---'))
@@ -0,0 +1,57 @@
+"""
+tech_trend 월 단위 파티션 관리 명령어
+앞으로 쓸 월 파티션을 미리 만들고, 보관 기간이 지난 파티션을 분리(보관) 또는 삭제합니다.
+
+사용 예:
+    python manage.py manage_trend_partitions                          # 이번 달 ~ 3개월 뒤 파티션 생성 (보관 기간 미설정 시 분리 안 함)
+    python manage.py manage_trend_partitions --retention-months 24    # + 24개월 이전 파티션 분리(별도 테이블로 보관)
+    python manage.py manage_trend_partitions --retention-months 24 --drop --dry-run
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.trends.partitions import (
+    add_months, detach_trend_partitions, ensure_trend_partitions, is_partitioned, retention_cutoff, trend_partitions
+)
+
+
+class Command(BaseCommand):
+    help = 'tech_trend 월 단위 파티션을 미리 만들고 보관 기간이 지난 파티션을 분리(보관)/삭제합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3, help='미리 만들 파티션 개월 수 (기본값: 3)')
+        parser.add_argument(
+            '--retention-months', type=int, default=getattr(settings, 'TECH_TREND_RETENTION_MONTHS', None),
+            help='보관 기간 (개월, 이번 달 기준). 이전 파티션은 분리. 기본값: TECH_TREND_RETENTION_MONTHS 설정 (0이면 분리 안 함)'
+        )
+        parser.add_argument('--drop', action='store_true', help='분리한 파티션을 보관하지 않고 삭제')
+        parser.add_argument('--dry-run', action='store_true', help='실제로 변경하지 않고 대상만 출력')
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            self.stdout.write(self.style.WARNING("⚠️ tech_trend가 파티션 테이블이 아닙니다. (PostgreSQL + 0017 마이그레이션 필요)"))
+            return
+
+        dry_run = options['dry_run']
+        this_month = timezone.now().date().replace(day=1)
+        created = ensure_trend_partitions(
+            this_month, add_months(this_month, max(options['months_ahead'], 0)), dry_run=dry_run
+        )
+        self.stdout.write(f"🧱 생성{' 예정' if dry_run else ''}: {', '.join(created) or '없음'}")
+
+        before = retention_cutoff(options['retention_months'], this_month)
+        if before is not None:
+            detached = detach_trend_partitions(
+                options['retention_months'], this_month, drop=options['drop'], dry_run=dry_run
+            )
+            action = '삭제' if options['drop'] else '분리(보관)'
+            self.stdout.write(
+                f"📦 {before} 이전 {action}{' 예정' if dry_run else ''}: {', '.join(detached) or '없음'}"
+            )
+
+        partitions = trend_partitions()
+        if partitions:
+            self.stdout.write(self.style.SUCCESS(
+                f"✅ 파티션 {len(partitions)}개: {partitions[0][1]} ~ {partitions[-1][2]} (종료일 미포함)"
+            ))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.trends.membership import rebuild_category_memberships
+
+
+class Command(BaseCommand):
+    help = '카테고리별 공고/게시글 소속(category_job_posting, category_article)을 전체 재구성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--category', type=int, action='append', help='재구성할 카테고리 ID (여러 번 지정 가능, 생략 시 전체)')
+
+    def handle(self, *args, **options):
+        self.stdout.write(" 카테고리 소속 재구성 시작...")
+        result = rebuild_category_memberships(options['category'])
+        self.stdout.write(self.style.SUCCESS(
+            f" 공고 소속 {result['job_posting']}건, 게시글 소속 {result['article']}건이 저장되었습니다."
+        ))
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.trends.rollups import rebuild_trend_rollups, refresh_period_rollups
+
+
+class Command(BaseCommand):
+    help = '기술 스택별 최근 7/30/90일 언급량 합계(tech_trend_rollup)와 주/월 단위 집계(tech_trend_weekly, tech_trend_monthly)를 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--as-of', type=str, default=None, help='기간별 합계 기준일 (YYYY-MM-DD 형식). 기본값: tech_trend의 마지막 날짜')
+        parser.add_argument('--from-date', type=str, default=None, help='주/월 단위 집계 시작 날짜 (YYYY-MM-DD 형식). 기본값: 전체 기간')
+
+    def handle(self, *args, **options):
+        as_of = self.parse_date(options['as_of'], '--as-of')
+        from_date = self.parse_date(options['from_date'], '--from-date')
+
+        self.stdout.write(" 기간별 언급량 합계 재계산 시작...")
+        saved_count = rebuild_trend_rollups(as_of)
+        self.stdout.write(self.style.SUCCESS(f" {saved_count}건이 저장되었습니다."))
+
+        self.stdout.write(" 주/월 단위 집계 재계산 시작...")
+        # --from-date가 있으면 그 날짜부터 오늘까지 걸친 주/월만, 없으면 전체 백필
+        saved_count = refresh_period_rollups(from_date, timezone.now().date() if from_date else None)
+        self.stdout.write(self.style.SUCCESS(f" {saved_count}건이 저장되었습니다."))
+
+    @staticmethod
+    def parse_date(value, option):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError(f"{option}는 YYYY-MM-DD 형식이어야 합니다.")
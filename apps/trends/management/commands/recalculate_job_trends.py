@@ -1,13 +1,21 @@
 """
 채용공고 트렌드 데이터를 새로운 로직(전체 대비 비율)으로 다시 계산하는 명령어
+날짜별 신규 공고-기술 연결 수를 한 번에 집계하고 누적합으로 날짜별 누적 공고 수를 만든 뒤,
+날짜 구간 단위로 tech_trend에 일괄 upsert합니다.
 """
 from datetime import date, timedelta
+
+import numpy as np
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
 
-from apps.trends.models import TechStack, TechTrend
-from apps.jobs.models import JobPosting
+from apps.trends.models import TechStack
+from apps.trends.rollups import refresh_trend_rollups
+from apps.trends.writers import save_trend_matrix
+from apps.jobs.models import JobPosting, JobPostingStack
 
 
 class Command(BaseCommand):
@@ -32,11 +40,18 @@ class Command(BaseCommand):
             default=None,
             help='현재 날짜 기준 최근 N일 데이터만 재계산 (기본값: None)'
         )
+        parser.add_argument(
+            '--chunk-days',
+            type=int,
+            default=30,
+            help='한 번에 upsert할 날짜 수 (기본값: 30일)'
+        )
 
     def handle(self, *args, **options):
         from_date_str = options.get('from_date')
         to_date_str = options.get('to_date')
         days = options.get('days')
+        chunk_days = max(1, options['chunk_days'])
 
         # 날짜 범위 계산
         if days:
@@ -73,94 +88,76 @@ class Command(BaseCommand):
                 self.stdout.write(f"📅 기간: ~ {end_date} (전체)")
 
         # TechStack 로드
-        stacks = TechStack.objects.filter(is_deleted=False)
-        self.stdout.write(f"✅ {stacks.count()}개 기술 스택 로드 완료")
+        stack_ids = list(TechStack.objects.filter(is_deleted=False).order_by('id').values_list('id', flat=True))
+        self.stdout.write(f"✅ {len(stack_ids)}개 기술 스택 로드 완료")
 
-        # 날짜별로 처리
-        if start_date:
-            current_date = start_date
-        else:
+        if not start_date:
             # start_date가 없으면 가장 오래된 JobPosting의 날짜부터 시작
             oldest_posting = JobPosting.objects.filter(is_deleted=False).order_by('created_at').first()
             if oldest_posting:
-                current_date = oldest_posting.created_at.date()
+                start_date = oldest_posting.created_at.date()
             else:
                 self.stdout.write(self.style.WARNING("⚠️  채용공고 데이터가 없습니다."))
                 return
 
-        updated_count = 0
-        created_count = 0
+        if start_date > end_date:
+            self.stdout.write(self.style.WARNING("⚠️  재계산할 날짜가 없습니다."))
+            return
+
+        # 1. 날짜별 누적 채용공고 수 (기술 스택 x 날짜) - 그룹 쿼리 1회 + 누적합
+        cumulative = cumulative_job_counts(stack_ids, start_date, end_date)
+        num_days = (end_date - start_date).days + 1
 
+        # 2. 날짜 구간(chunk) 단위로 TechTrend 일괄 upsert (비율은 trend_math로 구간 전체를 한 번에 계산)
+        created_count = updated_count = 0
         with transaction.atomic():
-            while current_date <= end_date:
-                # 해당 날짜까지 생성된 채용공고만 고려
-                # (즉, created_at <= current_date인 채용공고)
-                job_postings_by_date = JobPosting.objects.filter(
-                    is_deleted=False,
-                    created_at__date__lte=current_date
-                )
-
-                # 각 기술 스택별 채용공고 카운트 계산
-                tech_counts = {}
-                for stack in stacks:
-                    count = stack.job_postings.filter(
-                        is_deleted=False,
-                        job_posting__is_deleted=False,
-                        job_posting__created_at__date__lte=current_date
-                    ).count()
-                    tech_counts[stack.id] = count
-
-                # 전체 언급량 합계
-                total_job_count = sum(tech_counts.values())
-
-                # 각 기술 스택별로 비율 계산 및 저장
-                if total_job_count == 0:
-                    # 언급량이 없으면 비율 계산 불가, 모든 기술 스택에 0.0 저장
-                    for stack in stacks:
-                        trend, created = TechTrend.objects.update_or_create(
-                            tech_stack=stack,
-                            reference_date=current_date,
-                            defaults={
-                                'job_mention_count': 0,
-                                'job_change_rate': 0.0,
-                                'is_deleted': False
-                            }
-                        )
-                        if created:
-                            created_count += 1
-                        else:
-                            updated_count += 1
-                else:
-                    for stack in stacks:
-                        current_job_count = tech_counts.get(stack.id, 0)
-                        
-                        # 전체 대비 비율 계산 (%)
-                        job_change_rate = (current_job_count / total_job_count) * 100
-                        
-                        # 데이터 저장 (article 필드는 유지)
-                        trend, created = TechTrend.objects.update_or_create(
-                            tech_stack=stack,
-                            reference_date=current_date,
-                            defaults={
-                                'job_mention_count': current_job_count,
-                                'job_change_rate': round(job_change_rate, 2),
-                                'is_deleted': False
-                            }
-                        )
-                        if created:
-                            created_count += 1
-                        else:
-                            updated_count += 1
-
-                # 다음 날짜로 이동
-                current_date += timedelta(days=1)
-
-                # 진행 상황 출력 (매 30일마다)
-                if (current_date - start_date if start_date else timedelta(days=0)).days % 30 == 0:
-                    self.stdout.write(f"  처리 중: {current_date - timedelta(days=1)}...")
+            for chunk_start in range(0, num_days, chunk_days):
+                chunk_end = min(chunk_start + chunk_days, num_days)
+                dates = [start_date + timedelta(days=offset) for offset in range(chunk_start, chunk_end)]
+                # article 필드는 유지
+                created, updated = save_trend_matrix('job', dates, stack_ids, cumulative[:, chunk_start:chunk_end].T)
+                created_count += created
+                updated_count += updated
+                self.stdout.write(f"  처리 중: {dates[-1]}...")
+
+        # 기간별 언급량 합계(tech_trend_rollup) 및 해당 기간의 주/월 단위 집계 재계산
+        refresh_trend_rollups(start_date, end_date)
 
         self.stdout.write(
             self.style.SUCCESS(
                 f"✅ 완료! 생성: {created_count:,}개, 업데이트: {updated_count:,}개"
             )
         )
+
+
+def cumulative_job_counts(stack_ids: list[int], start_date: date, end_date: date) -> np.ndarray:
+    """
+    기술 스택별로 각 날짜까지(created_at <= 해당 날짜) 연결된 채용공고 수
+    반환: (len(stack_ids), 날짜 수) 정수 행렬, 열 0 = start_date
+
+    날짜별 신규 연결 수를 GROUP BY 1회로 가져온 뒤 NumPy 누적합으로 계산합니다.
+    start_date 이전에 생성된 공고는 첫 열의 기준값으로 합산됩니다.
+    """
+    num_days = (end_date - start_date).days + 1
+    counts = np.zeros((len(stack_ids), num_days), dtype=np.int64)
+    if not stack_ids:
+        return counts
+    row_of = {stack_id: i for i, stack_id in enumerate(stack_ids)}
+
+    daily_new = JobPostingStack.objects.filter(
+        tech_stack_id__in=stack_ids,
+        is_deleted=False,
+        job_posting__is_deleted=False,
+        job_posting__created_at__date__lte=end_date,
+    ).annotate(
+        day=TruncDate('job_posting__created_at')
+    ).values('tech_stack_id', 'day').annotate(
+        new_count=Count('id')
+    ).values_list('tech_stack_id', 'day', 'new_count')
+
+    for stack_id, day, new_count in daily_new:
+        # 시작일 이전 공고는 시작일 열에 모아 기준값으로 사용
+        col = max((day - start_date).days, 0)
+        counts[row_of[stack_id], col] += new_count
+
+    return np.cumsum(counts, axis=1)
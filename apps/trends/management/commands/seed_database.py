@@ -17,6 +17,7 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.db.models import Count
 from django.db.models.functions import Lower
+from apps.trends.membership import deferred_category_memberships, rebuild_category_memberships
 from apps.trends.models import TechStack, Category, CategoryTech
 
 logger = logging.getLogger(__name__)
@@ -636,6 +637,7 @@ class Command(BaseCommand):
         )
 
     @transaction.atomic
+    @deferred_category_memberships()  # 연결마다 카테고리 소속을 갱신하지 않고 마지막에 일괄 재구성
     def handle(self, *args, **options):
         self.stdout.write(self.style.SUCCESS('--- Starting Database Seeding ---'))
         source_csv_path = options['source_csv']
@@ -750,4 +752,9 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f'\nCategorization complete!'))
         self.stdout.write(f'  - {categorized_count} TechStacks were categorized.')
         self.stdout.write(f'  - {uncategorized_count} TechStacks remain uncategorized (please update MASTER_CATEGORIZATION_MAP).')
+        memberships = rebuild_category_memberships()
+        self.stdout.write(
+            f'  - Rebuilt category memberships: {memberships["job_posting"]} job postings, '
+            f'{memberships["article"]} articles.'
+        )
         self.stdout.write(self.style.SUCCESS('\n--- Database Seeding Complete! ---'))
@@ -0,0 +1,182 @@
+"""
+기술 스택 매칭기
+채용공고 크롤러(run_crawling), StackOverflow 분석(analyze_stackoverflow),
+게시글 트렌드 집계(generate_article_trends)가 공통으로 사용합니다.
+
+기술명을 토큰 시퀀스로 보고 Aho–Corasick 오토마톤(토큰 단위)으로 컴파일하여,
+본문 토큰을 한 번만 훑으면서 단일/다중 토큰 기술을 모두 찾습니다.
+노이즈 기술명 필터링은 컴파일 시점에 한 번만 수행됩니다.
+"""
+
+import re
+from collections import deque
+
+from django.db.models import Count, Max
+
+from apps.trends.models import TechStack
+
+
+# 토큰 추출용 정규식
+TOKEN_RE = re.compile(r"[a-z0-9\+\#\.\-]+")
+
+# 노이즈로 튀는 기술명 필터링 (너무 일반적인 단어)
+NOISE_TECHS = {
+    "d", "q",
+    "make", "simple", "mean", "parse", "render", "echo", "stream", "buffer", "heap",
+    "box", "hub", "dash", "flux", "salt", "ent", "tower", "buddy",
+    "play", "linear", "segment", "prism", "foundation", "slick", "realm", "crystal",
+}
+
+# 필터링 하면 안되는 기술명
+KNOWN_SHORT_TECHS = frozenset({"go", "r", "d3", "qt"})
+
+
+def normalize_spaces(s: str) -> str:
+    return " ".join((s or "").split())
+
+
+def normalize_tech_name(name: str) -> str:
+    """기술명 표준화 (공백 정리, 소문자화)"""
+    return normalize_spaces(name).lower()
+
+
+def tokenize(text: str) -> list[str]:
+    """텍스트를 매칭용 토큰 리스트로 변환 (소문자 기준)"""
+    return TOKEN_RE.findall((text or "").lower())
+
+
+def is_noise_tech(normalized_tech: str, known_short=KNOWN_SHORT_TECHS) -> bool:
+    """노이즈 기술명인지 확인"""
+    if normalized_tech in known_short:
+        return False
+    if not normalized_tech or normalized_tech in NOISE_TECHS:
+        return True
+
+    toks = TOKEN_RE.findall(normalized_tech)
+    if not toks:
+        return True
+
+    # 단일 토큰인데 "알파벳만" && "길이 <= 2" 이면 노이즈로 처리
+    if len(toks) == 1:
+        t = toks[0]
+        if t.isalpha() and len(t) <= 2:
+            return True
+    return False
+
+
+class TechMatcher:
+    """
+    토큰 단위 Aho–Corasick 오토마톤
+
+    entries: (payload, 기술명) 목록. payload는 매칭 시 그대로 반환됩니다 (TechStack ID, 기술명 등).
+    같은 토큰 시퀀스에 여러 payload가 등록되면 모두 반환합니다.
+    """
+
+    def __init__(self, entries, known_short=KNOWN_SHORT_TECHS, filter_noise: bool = True):
+        # 상태 0 = 루트
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple] = [()]
+        self.size = 0
+
+        for payload, name in entries:
+            normalized = normalize_tech_name(name)
+            if filter_noise and is_noise_tech(normalized, known_short):
+                continue
+            tokens = TOKEN_RE.findall(normalized)
+            if not tokens:
+                continue
+            self._insert(tokens, payload)
+            self.size += 1
+
+        self._build_failure_links()
+
+    def __len__(self):
+        return self.size
+
+    def _insert(self, tokens: list[str], payload):
+        state = 0
+        for tok in tokens:
+            nxt = self._goto[state].get(tok)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][tok] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + ((payload, len(tokens)),)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for tok, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and tok not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(tok, 0)
+                # 접미사 상태의 출력까지 합쳐서 탐색 중 failure 체인을 다시 따라가지 않도록 함
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, tokens: list[str]):
+        """(payload, 시작 토큰 위치, 끝 토큰 위치(exclusive))를 등장 순서대로 반환"""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, tok in enumerate(tokens):
+            while state and tok not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(tok, 0)
+            for payload, length in out[state]:
+                yield payload, i - length + 1, i + 1
+
+    def match_tokens(self, tokens: list[str]) -> set:
+        """토큰 리스트에 등장한 payload 집합 (위치 정보 없이 빠르게)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set()
+        state = 0
+        for tok in tokens:
+            while state and tok not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(tok, 0)
+            if out[state]:
+                for payload, _ in out[state]:
+                    found.add(payload)
+        return found
+
+    def match(self, text: str) -> set:
+        """텍스트에 등장한 payload 집합"""
+        return self.match_tokens(tokenize(text))
+
+
+# 컴파일된 매칭기 캐시: (어휘 버전, known_short) -> TechMatcher
+_matcher_cache: dict = {}
+
+
+def get_vocabulary_version():
+    """
+    TechStack 어휘 버전
+    기술 스택이 추가/수정/삭제되면 값이 바뀌어 매칭기를 다시 컴파일하게 됩니다.
+    """
+    agg = TechStack.objects.filter(is_deleted=False).aggregate(
+        count=Count('id'), max_id=Max('id'), last_updated=Max('updated_at')
+    )
+    return agg['count'], agg['max_id'], agg['last_updated']
+
+
+def get_tech_matcher(known_short=KNOWN_SHORT_TECHS) -> TechMatcher:
+    """
+    DB의 TechStack(삭제되지 않은 것) 어휘로 만든 매칭기 (payload = TechStack ID)
+    어휘 버전이 같으면 프로세스 안에서 컴파일 결과를 재사용합니다.
+    """
+    key = (get_vocabulary_version(), frozenset(known_short))
+    matcher = _matcher_cache.get(key)
+    if matcher is None:
+        entries = TechStack.objects.filter(is_deleted=False).values_list('id', 'name')
+        matcher = TechMatcher(entries, known_short=known_short)
+        # 이전 어휘 버전으로 만든 매칭기는 더 이상 쓰이지 않으므로 제거
+        for stale_key in [k for k in _matcher_cache if k[0] != key[0]]:
+            del _matcher_cache[stale_key]
+        _matcher_cache[key] = matcher
+    return matcher
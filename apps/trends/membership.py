@@ -0,0 +1,142 @@
+"""
+카테고리 소속(category_job_posting, category_article) 사전 계산
+카테고리 페이지/통계가 매 요청마다 CategoryTech -> TechStack -> JobPostingStack/ArticleStack을 조인하지 않도록
+카테고리별 소속 공고/게시글과 일치 기술 스택 수를 미리 펼쳐 둡니다.
+
+소속 기준: 삭제되지 않은 공고(게시글) + 삭제되지 않은 연결 + 삭제되지 않은 기술 스택이 카테고리에 속함
+posted_on: 공고는 등록일, 게시글은 원본 작성일(없으면 등록일)을 서비스 시간대(TIME_ZONE) 기준 날짜로 저장
+
+갱신 방식:
+    - 증분: 공고/게시글/연결/기술 스택/카테고리-기술 연결이 바뀌면 영향받은 범위만 기록해 두었다가
+      트랜잭션 커밋 시점에 대상 범위를 DELETE 후 INSERT ... SELECT ... GROUP BY 1회로 다시 채움
+    - 일괄: 카테고리 재분류 명령(seed_database, categorize_stacks 매핑을 쓰는 import_categories)은
+      deferred_category_memberships 블록 안에서 작업한 뒤 rebuild_category_memberships()로 전체를 재구성
+"""
+from django.conf import settings
+from django.db import connection, transaction
+
+from apps.common.cache import bump_generation, NS_CATEGORIES
+from apps.common.dirty import DirtySet
+from apps.jobs.models import JobPosting, JobPostingStack
+from .models import Article, ArticleStack, CategoryArticle, CategoryJobPosting, CategoryTech, TechStack
+
+# (소속 테이블 모델, 원본 모델, 연결 모델, 연결의 원본 컬럼, 날짜 기준 식)
+MEMBERSHIPS = {
+    'job_posting': (CategoryJobPosting, JobPosting, JobPostingStack, 'job_posting_id', 'o.created_at'),
+    'article': (CategoryArticle, Article, ArticleStack, 'article_id', 'COALESCE(o.external_created_at, o.created_at)'),
+}
+
+def _in_clause(column: str, ids: list) -> str:
+    return f"{column} IN ({', '.join(['%s'] * len(ids))})"
+
+
+def _refresh(kind: str, scope: str | None = None, ids=None) -> int:
+    """
+    소속 테이블 하나를 범위 단위로 교체하고 저장한 행 수를 반환
+    scope: None(전체) | 'category'(카테고리 ID) | 'owner'(공고/게시글 ID) | 'tech_stack'(기술 스택에 연결된 공고/게시글)
+    """
+    membership, owner, link, owner_column, date_expr = MEMBERSHIPS[kind]
+    membership_table = membership._meta.db_table
+    link_table = link._meta.db_table
+    ids = sorted(ids) if ids is not None else []
+    if scope is not None and not ids:
+        return 0
+
+    if scope is None:
+        delete_where, insert_where = '', ''
+    elif scope == 'category':
+        delete_where = 'WHERE ' + _in_clause('category_id', ids)
+        insert_where = 'AND ' + _in_clause('ct.category_id', ids)
+    elif scope == 'owner':
+        delete_where = 'WHERE ' + _in_clause(owner_column, ids)
+        insert_where = 'AND ' + _in_clause(f'l.{owner_column}', ids)
+    else:
+        linked = f"SELECT {owner_column} FROM {link_table} WHERE {_in_clause('tech_stack_id', ids)}"
+        delete_where = f'WHERE {owner_column} IN ({linked})'
+        insert_where = f'AND l.{owner_column} IN ({linked})'
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {membership_table} {delete_where}", ids)
+        cursor.execute(
+            f"""
+            INSERT INTO {membership_table} (category_id, {owner_column}, stack_match_count, posted_on)
+            SELECT ct.category_id, o.id, COUNT(*), CAST(({date_expr}) AT TIME ZONE %s AS date)
+            FROM {link_table} l
+            JOIN {owner._meta.db_table} o ON o.id = l.{owner_column}
+            JOIN {TechStack._meta.db_table} ts ON ts.id = l.tech_stack_id
+            JOIN {CategoryTech._meta.db_table} ct ON ct.tech_stack_id = l.tech_stack_id
+            WHERE l.is_deleted = false AND o.is_deleted = false AND ts.is_deleted = false {insert_where}
+            GROUP BY ct.category_id, o.id
+            """,
+            [settings.TIME_ZONE, *ids],
+        )
+        return cursor.rowcount
+
+
+def rebuild_category_memberships(category_ids=None) -> dict:
+    """
+    카테고리 소속을 통째로(category_ids가 있으면 해당 카테고리만) 다시 계산
+    전체 재구성이면 기록돼 있던 증분 대상도 함께 처리된 것으로 보고 비웁니다.
+    결과: {'job_posting': 저장 행 수, 'article': 저장 행 수}
+    """
+    scope = None if category_ids is None else 'category'
+    with transaction.atomic():
+        result = {kind: _refresh(kind, scope, category_ids) for kind in MEMBERSHIPS}
+        # 카테고리별 공고/게시글 목록 캐시는 소속이 바뀐 뒤에 무효화
+        transaction.on_commit(lambda: bump_generation(NS_CATEGORIES))
+    if category_ids is None:
+        _dirty.clear()
+    return result
+
+
+def _flush(dirty: dict) -> dict:
+    result = {kind: 0 for kind in MEMBERSHIPS}
+    with transaction.atomic():
+        for kind, owner_ids in (('job_posting', dirty['job_posting_ids']), ('article', dirty['article_ids'])):
+            result[kind] += _refresh(kind, 'category', dirty['category_ids'])
+            result[kind] += _refresh(kind, 'tech_stack', dirty['tech_stack_ids'])
+            result[kind] += _refresh(kind, 'owner', owner_ids)
+        # 카테고리별 공고/게시글 목록 캐시는 소속이 바뀐 뒤에 무효화
+        transaction.on_commit(lambda: bump_generation(NS_CATEGORIES))
+    return result
+
+
+# job_posting_ids / article_ids: 소속을 다시 계산할 공고/게시글 ID
+# tech_stack_ids: 연결된 공고/게시글 전체를 다시 계산할 기술 스택 ID, category_ids: 소속 전체를 다시 계산할 카테고리 ID
+# 커밋 후 갱신이 실패하면 로그만 남김 (다음 일괄 재구성에서 복구)
+_dirty = DirtySet(
+    'category membership', ('job_posting_ids', 'article_ids', 'tech_stack_ids', 'category_ids'), _flush
+)
+
+
+def flush_category_memberships() -> dict:
+    """기록된 범위의 카테고리 소속을 지금 다시 계산하고, 종류별 저장 행 수를 반환"""
+    return _dirty.flush()
+
+
+def mark_job_postings_dirty(job_posting_ids) -> None:
+    """공고들의 카테고리 소속을 다시 계산 대상으로 기록"""
+    _dirty.mark('job_posting_ids', job_posting_ids)
+
+
+def mark_articles_dirty(article_ids) -> None:
+    """게시글들의 카테고리 소속을 다시 계산 대상으로 기록"""
+    _dirty.mark('article_ids', article_ids)
+
+
+def mark_tech_stacks_dirty(tech_stack_ids) -> None:
+    """기술 스택에 연결된 공고/게시글 전체의 카테고리 소속을 다시 계산 대상으로 기록 (삭제/복구 등)"""
+    _dirty.mark('tech_stack_ids', tech_stack_ids)
+
+
+def mark_categories_dirty(category_ids) -> None:
+    """카테고리 소속 전체를 다시 계산 대상으로 기록 (카테고리-기술 연결 변경)"""
+    _dirty.mark('category_ids', category_ids)
+
+
+def deferred_category_memberships():
+    """
+    블록 안에서는 시그널이 갱신 대상만 기록하고, 가장 바깥 블록이 끝날 때 한 번에 갱신
+    (중첩 가능, 블록 안에서 rebuild_category_memberships()를 호출했다면 남은 대상이 없어 추가 작업 없음)
+    """
+    return _dirty.deferred()
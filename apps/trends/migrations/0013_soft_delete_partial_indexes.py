@@ -0,0 +1,17 @@
+# Generated by Django 5.0.14 on 2026-10-17 04:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trends', '0012_add_article_external_created_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='techstack',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['-job_stack_count'], name='tech_stack_active_count_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.0.14 on 2026-10-17 04:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0012_tech_stack_deadline'),
+        ('trends', '0013_soft_delete_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryJobPosting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stack_match_count', models.PositiveSmallIntegerField(default=0, verbose_name='일치 기술 스택 수')),
+                ('posted_on', models.DateField(verbose_name='공고 등록일')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='job_posting_memberships', to='trends.category', verbose_name='카테고리')),
+                ('job_posting', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='category_memberships', to='jobs.jobposting', verbose_name='채용 공고')),
+            ],
+            options={
+                'verbose_name': '카테고리-채용 공고 소속',
+                'verbose_name_plural': '카테고리-채용 공고 소속 목록',
+                'db_table': 'category_job_posting',
+            },
+        ),
+        migrations.CreateModel(
+            name='CategoryArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('stack_match_count', models.PositiveSmallIntegerField(default=0, verbose_name='일치 기술 스택 수')),
+                ('posted_on', models.DateField(verbose_name='게시글 작성일')),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='category_memberships', to='trends.article', verbose_name='게시글')),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='article_memberships', to='trends.category', verbose_name='카테고리')),
+            ],
+            options={
+                'verbose_name': '카테고리-게시글 소속',
+                'verbose_name_plural': '카테고리-게시글 소속 목록',
+                'db_table': 'category_article',
+                'indexes': [models.Index(fields=['category', 'posted_on'], name='category_article_day_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='categoryarticle',
+            constraint=models.UniqueConstraint(fields=('category', 'article'), name='unique_category_article'),
+        ),
+        migrations.AddIndex(
+            model_name='categoryjobposting',
+            index=models.Index(fields=['category', 'posted_on'], name='category_job_posting_day_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='categoryjobposting',
+            constraint=models.UniqueConstraint(fields=('category', 'job_posting'), name='unique_category_job_posting'),
+        ),
+    ]
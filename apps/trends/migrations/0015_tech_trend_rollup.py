@@ -0,0 +1,36 @@
+# Generated by Django 5.0.14 on 2026-10-17 05:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trends', '0014_category_memberships'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TechTrendRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('window_days', models.PositiveSmallIntegerField(verbose_name='집계 기간(일)')),
+                ('as_of_date', models.DateField(verbose_name='집계 기준일')),
+                ('job_mention_sum', models.BigIntegerField(default=0, verbose_name='기간 내 채용공고 언급 수 합계')),
+                ('article_mention_sum', models.BigIntegerField(default=0, verbose_name='기간 내 게시글 언급 수 합계')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일자')),
+                ('tech_stack', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='trend_rollups', to='trends.techstack', verbose_name='기술 스택')),
+            ],
+            options={
+                'verbose_name': '기술 트렌드 기간 합계',
+                'verbose_name_plural': '기술 트렌드 기간 합계 목록',
+                'db_table': 'tech_trend_rollup',
+                'indexes': [models.Index(fields=['window_days', '-job_mention_sum'], name='trend_rollup_job_sum_idx'), models.Index(fields=['window_days', '-article_mention_sum'], name='trend_rollup_article_sum_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='techtrendrollup',
+            constraint=models.UniqueConstraint(fields=('tech_stack', 'window_days'), name='unique_trend_rollup_per_window'),
+        ),
+    ]
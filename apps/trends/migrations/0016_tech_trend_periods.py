@@ -0,0 +1,62 @@
+# Generated by Django 5.0.14 on 2026-10-17 05:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trends', '0015_tech_trend_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TechTrendMonthly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateField(verbose_name='월 시작일')),
+                ('day_count', models.PositiveSmallIntegerField(default=0, verbose_name='집계된 일수')),
+                ('job_mention_count', models.BigIntegerField(default=0, verbose_name='채용공고 언급 수 합계')),
+                ('article_mention_count', models.BigIntegerField(default=0, verbose_name='게시글 언급 수 합계')),
+                ('job_change_rate', models.FloatField(default=0.0, verbose_name='전월 대비 채용공고 증가율')),
+                ('article_change_rate', models.FloatField(default=0.0, verbose_name='전월 대비 게시글 증가율')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일자')),
+                ('tech_stack', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_trends', to='trends.techstack', verbose_name='기술 스택')),
+            ],
+            options={
+                'verbose_name': '월간 기술 트렌드',
+                'verbose_name_plural': '월간 기술 트렌드 목록',
+                'db_table': 'tech_trend_monthly',
+                'ordering': ['-period_start'],
+            },
+        ),
+        migrations.CreateModel(
+            name='TechTrendWeekly',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateField(verbose_name='주 시작일(월요일)')),
+                ('day_count', models.PositiveSmallIntegerField(default=0, verbose_name='집계된 일수')),
+                ('job_mention_count', models.BigIntegerField(default=0, verbose_name='채용공고 언급 수 합계')),
+                ('article_mention_count', models.BigIntegerField(default=0, verbose_name='게시글 언급 수 합계')),
+                ('job_change_rate', models.FloatField(default=0.0, verbose_name='전주 대비 채용공고 증가율')),
+                ('article_change_rate', models.FloatField(default=0.0, verbose_name='전주 대비 게시글 증가율')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일자')),
+                ('tech_stack', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_trends', to='trends.techstack', verbose_name='기술 스택')),
+            ],
+            options={
+                'verbose_name': '주간 기술 트렌드',
+                'verbose_name_plural': '주간 기술 트렌드 목록',
+                'db_table': 'tech_trend_weekly',
+                'ordering': ['-period_start'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='techtrendmonthly',
+            constraint=models.UniqueConstraint(fields=('tech_stack', 'period_start'), name='unique_monthly_trend_per_stack'),
+        ),
+        migrations.AddConstraint(
+            model_name='techtrendweekly',
+            constraint=models.UniqueConstraint(fields=('tech_stack', 'period_start'), name='unique_weekly_trend_per_stack'),
+        ),
+    ]
@@ -0,0 +1,129 @@
+# tech_trend를 reference_date 기준 월 단위 범위 파티션 테이블로 전환 (PostgreSQL 선언적 파티셔닝)
+# - 파티션: tech_trend_YYYYMM (기존 데이터의 첫 달 ~ 이번 달 + FUTURE_MONTHS), 범위 밖 날짜는 tech_trend_default
+# - 파티션 테이블의 PK/UNIQUE에는 파티션 키가 포함돼야 하므로 DB의 PK는 (id, reference_date)
+#   (ORM은 그대로 id를 PK로 사용, id는 시퀀스로 계속 유일하게 발급)
+#   Django 5.0에는 복합 기본 키가 없으므로 실제 키는 마이그레이션 상태에 tech_trend_pkey 제약조건으로만 추가
+#   (DB에는 PRIMARY KEY로 이미 있으므로 상태 전용, PostgreSQL이 아니면 id 단독 PK라 (id, reference_date)도 항상 유일)
+# - 기존 제약조건/인덱스는 같은 이름으로 다시 만들어 이후 마이그레이션과 이름이 맞도록 유지
+# 이후 파티션 생성/보관 기간 관리는 apps/trends/partitions.py, manage_trend_partitions 명령어에서 처리
+# PostgreSQL이 아니면 건너뜀
+
+from datetime import date
+
+from django.db import migrations, models
+
+TABLE = 'tech_trend'
+FUTURE_MONTHS = 3
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _relkind(cursor) -> str:
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = %s::regclass", [TABLE])
+    return cursor.fetchone()[0]
+
+
+def _definitions(cursor):
+    """(제약조건 [(이름, 종류, 정의)], 제약조건에 속하지 않은 인덱스 정의 목록)"""
+    cursor.execute(
+        "SELECT conname, contype, pg_get_constraintdef(oid) FROM pg_constraint "
+        "WHERE conrelid = %s::regclass ORDER BY contype DESC, conname",
+        [TABLE],
+    )
+    constraints = cursor.fetchall()
+    cursor.execute(
+        "SELECT pg_get_indexdef(i.indexrelid) FROM pg_index i "
+        "WHERE i.indrelid = %s::regclass "
+        "AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid AND c.conrelid = i.indrelid)",
+        [TABLE],
+    )
+    # 파티션 테이블의 인덱스 정의는 'ON ONLY'로 나오므로 일반 테이블/파티션 모두에 만들어지도록 제거
+    indexes = [definition.replace(' ON ONLY ', ' ON ') for definition, in cursor.fetchall()]
+    return constraints, indexes
+
+
+def _restore(schema_editor, constraints, indexes, primary_key: str) -> None:
+    for name, contype, definition in constraints:
+        if contype == 'p':
+            definition = primary_key
+        schema_editor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" {definition}')
+    for definition in indexes:
+        schema_editor.execute(definition)
+
+
+def partition_tech_trend(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        if _relkind(cursor) == 'p':
+            return
+        constraints, indexes = _definitions(cursor)
+        cursor.execute(f"SELECT MIN(reference_date), MAX(reference_date) FROM {TABLE}")
+        first_date, last_date = cursor.fetchone()
+
+    this_month = date.today().replace(day=1)
+    month = (first_date or this_month).replace(day=1)
+    last_month = _add_months(max((last_date or this_month).replace(day=1), this_month), FUTURE_MONTHS)
+
+    schema_editor.execute(f"ALTER TABLE {TABLE} RENAME TO {TABLE}_unpartitioned")
+    schema_editor.execute(
+        f"CREATE TABLE {TABLE} (LIKE {TABLE}_unpartitioned INCLUDING DEFAULTS) PARTITION BY RANGE (reference_date)"
+    )
+    while month <= last_month:
+        next_month = _add_months(month, 1)
+        schema_editor.execute(
+            f"CREATE TABLE {TABLE}_{month:%Y%m} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+    schema_editor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+
+    # 인덱스 없이 먼저 옮긴 뒤 기존 테이블(identity 시퀀스, 인덱스 이름 포함)을 지우고 같은 이름으로 다시 생성
+    schema_editor.execute(f"INSERT INTO {TABLE} SELECT * FROM {TABLE}_unpartitioned")
+    schema_editor.execute(f"DROP TABLE {TABLE}_unpartitioned")
+    schema_editor.execute(f"CREATE SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+    schema_editor.execute(f"SELECT setval('{TABLE}_id_seq', COALESCE((SELECT MAX(id) FROM {TABLE}), 0) + 1, false)")
+    schema_editor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{TABLE}_id_seq')")
+    _restore(schema_editor, constraints, indexes, 'PRIMARY KEY (id, reference_date)')
+
+
+def unpartition_tech_trend(apps, schema_editor):
+    """일반 테이블로 되돌림 (보관용으로 분리(detach)된 파티션의 데이터는 포함되지 않음)"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    with schema_editor.connection.cursor() as cursor:
+        if _relkind(cursor) != 'p':
+            return
+        constraints, indexes = _definitions(cursor)
+
+    schema_editor.execute(f"ALTER TABLE {TABLE} RENAME TO {TABLE}_partitioned")
+    schema_editor.execute(f"CREATE TABLE {TABLE} (LIKE {TABLE}_partitioned)")
+    schema_editor.execute(f"INSERT INTO {TABLE} SELECT * FROM {TABLE}_partitioned")
+    schema_editor.execute(f"DROP TABLE {TABLE}_partitioned CASCADE")
+    schema_editor.execute(f"ALTER TABLE {TABLE} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), COALESCE((SELECT MAX(id) FROM {TABLE}), 0) + 1, false)"
+    )
+    _restore(schema_editor, constraints, indexes, 'PRIMARY KEY (id)')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trends', '0016_tech_trend_periods'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_tech_trend, unpartition_tech_trend),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(
+                    model_name='techtrend',
+                    constraint=models.UniqueConstraint(fields=('id', 'reference_date'), name='tech_trend_pkey'),
+                ),
+            ],
+        ),
+    ]
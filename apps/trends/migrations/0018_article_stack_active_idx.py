@@ -0,0 +1,17 @@
+# Generated by Django 5.0.14 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('trends', '0017_partition_tech_trend'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='articlestack',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['tech_stack', 'article'], name='article_stack_active_idx'),
+        ),
+    ]
@@ -87,6 +87,14 @@ class TechStack(models.Model):
         db_table = 'tech_stack'
         verbose_name = '기술 스택'
         verbose_name_plural = '기술 스택 목록'
+        indexes = [
+            # 기술 스택 목록/Top 스택: 삭제되지 않은 스택을 공고 수 내림차순으로 조회
+            models.Index(
+                fields=['-job_stack_count'],
+                name='tech_stack_active_count_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -121,6 +129,13 @@ class TechTrend(models.Model):
     """
     기술 트렌드 모델
     ERD: tech_trend 테이블
+
+    PostgreSQL에서는 reference_date 기준 월 단위 파티션 테이블입니다. (0017_partition_tech_trend)
+    파티션 테이블의 PK에는 파티션 키가 포함돼야 하므로 DB의 실제 기본 키는 (id, reference_date)이며,
+    Django 5.0에는 복합 기본 키가 없어 ORM은 id를 기본 키로 쓰고 실제 키는 tech_trend_pkey 제약조건으로 선언해 둡니다.
+    - id는 tech_trend_id_seq 시퀀스로만 발급되어 테이블 전체에서 유일하지만, DB가 id 단독 유일성을 검사하지는 않음
+    - id/reference_date 필드나 tech_trend_pkey를 바꾸는 마이그레이션은 makemigrations 결과를 그대로 쓰지 말고
+      파티션 구조에 맞게 RunSQL/SeparateDatabaseAndState로 직접 작성해야 함
     """
     tech_stack = models.ForeignKey(
         TechStack,
@@ -181,13 +196,167 @@ class TechTrend(models.Model):
             models.UniqueConstraint(
                 fields=['tech_stack', 'reference_date'],
                 name='unique_daily_trend_per_stack'
-            )
+            ),
+            # DB의 실제 기본 키 PRIMARY KEY (id, reference_date) (0017 마이그레이션에서 상태에만 추가)
+            models.UniqueConstraint(
+                fields=['id', 'reference_date'],
+                name='tech_trend_pkey'
+            ),
         ]
 
     def __str__(self):
         return f"{self.tech_stack.name} - {self.reference_date}"
 
 
+class TechTrendRollup(models.Model):
+    """
+    기술 스택별 최근 N일(7/30/90) tech_trend 언급량 합계 (사전 계산 테이블)
+    기간은 기존 집계와 같이 [as_of_date - window_days, as_of_date] (양 끝 포함)이며,
+    calculate_daily_trends가 새 날짜를 저장할 때 들어온 날짜를 더하고 빠지는 날짜를 빼는 방식으로 갱신합니다. (rollups.py)
+    """
+    tech_stack = models.ForeignKey(
+        TechStack,
+        on_delete=models.CASCADE,
+        related_name='trend_rollups',
+        verbose_name='기술 스택'
+    )
+    window_days = models.PositiveSmallIntegerField(
+        verbose_name='집계 기간(일)'
+    )
+    as_of_date = models.DateField(
+        verbose_name='집계 기준일'
+    )
+    job_mention_sum = models.BigIntegerField(
+        default=0,
+        verbose_name='기간 내 채용공고 언급 수 합계'
+    )
+    article_mention_sum = models.BigIntegerField(
+        default=0,
+        verbose_name='기간 내 게시글 언급 수 합계'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일자'
+    )
+
+    class Meta:
+        db_table = 'tech_trend_rollup'
+        verbose_name = '기술 트렌드 기간 합계'
+        verbose_name_plural = '기술 트렌드 기간 합계 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['tech_stack', 'window_days'], name='unique_trend_rollup_per_window')
+        ]
+        indexes = [
+            # 기간별 언급량 Top N: 인덱스 순서대로 N개만 읽음
+            models.Index(fields=['window_days', '-job_mention_sum'], name='trend_rollup_job_sum_idx'),
+            models.Index(fields=['window_days', '-article_mention_sum'], name='trend_rollup_article_sum_idx'),
+        ]
+
+
+class TechTrendWeekly(models.Model):
+    """
+    기술 스택별 주간 트렌드 (tech_trend 일별 값의 주 단위 합계)
+    증가율은 일 평균 언급 수 기준 전주 대비 증감률(%)이므로 진행 중인 주도 지난주와 비교할 수 있습니다. (rollups.py)
+    """
+    tech_stack = models.ForeignKey(
+        TechStack,
+        on_delete=models.CASCADE,
+        related_name='weekly_trends',
+        verbose_name='기술 스택'
+    )
+    period_start = models.DateField(
+        verbose_name='주 시작일(월요일)'
+    )
+    day_count = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='집계된 일수'
+    )
+    job_mention_count = models.BigIntegerField(
+        default=0,
+        verbose_name='채용공고 언급 수 합계'
+    )
+    article_mention_count = models.BigIntegerField(
+        default=0,
+        verbose_name='게시글 언급 수 합계'
+    )
+    job_change_rate = models.FloatField(
+        default=0.0,
+        verbose_name='전주 대비 채용공고 증가율'
+    )
+    article_change_rate = models.FloatField(
+        default=0.0,
+        verbose_name='전주 대비 게시글 증가율'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일자'
+    )
+
+    class Meta:
+        db_table = 'tech_trend_weekly'
+        verbose_name = '주간 기술 트렌드'
+        verbose_name_plural = '주간 기술 트렌드 목록'
+        ordering = ['-period_start']
+        constraints = [
+            models.UniqueConstraint(fields=['tech_stack', 'period_start'], name='unique_weekly_trend_per_stack')
+        ]
+
+    def __str__(self):
+        return f"{self.tech_stack.name} - {self.period_start}"
+
+
+class TechTrendMonthly(models.Model):
+    """
+    기술 스택별 월간 트렌드 (tech_trend 일별 값의 월 단위 합계)
+    증가율은 일 평균 언급 수 기준 전월 대비 증감률(%)입니다. (rollups.py)
+    """
+    tech_stack = models.ForeignKey(
+        TechStack,
+        on_delete=models.CASCADE,
+        related_name='monthly_trends',
+        verbose_name='기술 스택'
+    )
+    period_start = models.DateField(
+        verbose_name='월 시작일'
+    )
+    day_count = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='집계된 일수'
+    )
+    job_mention_count = models.BigIntegerField(
+        default=0,
+        verbose_name='채용공고 언급 수 합계'
+    )
+    article_mention_count = models.BigIntegerField(
+        default=0,
+        verbose_name='게시글 언급 수 합계'
+    )
+    job_change_rate = models.FloatField(
+        default=0.0,
+        verbose_name='전월 대비 채용공고 증가율'
+    )
+    article_change_rate = models.FloatField(
+        default=0.0,
+        verbose_name='전월 대비 게시글 증가율'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일자'
+    )
+
+    class Meta:
+        db_table = 'tech_trend_monthly'
+        verbose_name = '월간 기술 트렌드'
+        verbose_name_plural = '월간 기술 트렌드 목록'
+        ordering = ['-period_start']
+        constraints = [
+            models.UniqueConstraint(fields=['tech_stack', 'period_start'], name='unique_monthly_trend_per_stack')
+        ]
+
+    def __str__(self):
+        return f"{self.tech_stack.name} - {self.period_start}"
+
+
 class Article(models.Model):
     """
     게시글/기사 모델
@@ -269,6 +438,90 @@ class ArticleStack(models.Model):
         verbose_name = '게시글-기술 연결'
         verbose_name_plural = '게시글-기술 연결 목록'
         unique_together = ['article','tech_stack']
+        indexes = [
+            # 기술별 게시글 수 재계산(GROUP BY tech_stack_id), 카테고리 소속 재계산 (삭제되지 않은 연결만)
+            models.Index(
+                fields=['tech_stack', 'article'],
+                name='article_stack_active_idx',
+                condition=models.Q(is_deleted=False),
+            ),
+        ]
+
+
+class CategoryJobPosting(models.Model):
+    """
+    카테고리-채용 공고 소속 (사전 계산 테이블)
+    CategoryTech -> TechStack -> JobPostingStack 경로를 미리 펼쳐 둔 것으로, 삭제되지 않은 공고/연결/기술 스택만 담습니다.
+    링크 변경 시 apps.trends.membership이 증분 갱신하고, 카테고리 재분류 명령 후에는 일괄 재구성합니다.
+    """
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='job_posting_memberships',
+        verbose_name='카테고리'
+    )
+    job_posting = models.ForeignKey(
+        'jobs.JobPosting',
+        on_delete=models.CASCADE,
+        related_name='category_memberships',
+        verbose_name='채용 공고'
+    )
+    stack_match_count = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='일치 기술 스택 수'
+    )
+    posted_on = models.DateField(
+        verbose_name='공고 등록일'
+    )
+
+    class Meta:
+        db_table = 'category_job_posting'
+        verbose_name = '카테고리-채용 공고 소속'
+        verbose_name_plural = '카테고리-채용 공고 소속 목록'
+        # (category, job_posting): 카테고리 페이지 최신순(-id) 조회, (category, posted_on): 카테고리별 일별 통계
+        constraints = [
+            models.UniqueConstraint(fields=['category', 'job_posting'], name='unique_category_job_posting')
+        ]
+        indexes = [
+            models.Index(fields=['category', 'posted_on'], name='category_job_posting_day_idx'),
+        ]
+
+
+class CategoryArticle(models.Model):
+    """
+    카테고리-게시글 소속 (사전 계산 테이블)
+    CategoryTech -> TechStack -> ArticleStack 경로를 미리 펼쳐 둔 것으로, 삭제되지 않은 게시글/연결/기술 스택만 담습니다.
+    """
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        related_name='article_memberships',
+        verbose_name='카테고리'
+    )
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name='category_memberships',
+        verbose_name='게시글'
+    )
+    stack_match_count = models.PositiveSmallIntegerField(
+        default=0,
+        verbose_name='일치 기술 스택 수'
+    )
+    posted_on = models.DateField(
+        verbose_name='게시글 작성일'
+    )
+
+    class Meta:
+        db_table = 'category_article'
+        verbose_name = '카테고리-게시글 소속'
+        verbose_name_plural = '카테고리-게시글 소속 목록'
+        constraints = [
+            models.UniqueConstraint(fields=['category', 'article'], name='unique_category_article')
+        ]
+        indexes = [
+            models.Index(fields=['category', 'posted_on'], name='category_article_day_idx'),
+        ]
 
 
 class TechBookmark(models.Model):
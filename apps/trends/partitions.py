@@ -0,0 +1,133 @@
+"""
+tech_trend 월 단위 파티션 관리
+tech_trend는 reference_date 기준 월 단위 범위 파티션 테이블(0017_partition_tech_trend 마이그레이션)이므로
+reference_date 조건이 붙는 조회는 해당 월 파티션만 읽습니다. (partition pruning)
+
+- 파티션 이름: tech_trend_YYYYMM, 범위 [해당 월 1일, 다음 달 1일)
+- 파티션이 없는 날짜는 tech_trend_default에 저장되며, 나중에 그 월 파티션을 만들 때 옮겨짐
+- 일괄 저장(upsert_tech_trends) 전에 ensure_trend_partitions()로 저장할 월의 파티션을 먼저 만들어
+  백필 데이터가 기본 파티션이 아닌 월 파티션에 바로 들어가도록 함
+- 보관 기간(TECH_TREND_RETENTION_MONTHS, 기본값 0 = 분리 안 함)을 설정한 경우에만
+  지난 파티션을 분리(detach)해 별도 테이블로 보관하거나 삭제 (manage_trend_partitions 명령어)
+  주/월 단위 집계(tech_trend_weekly, tech_trend_monthly)는 분리된 기간의 값도 그대로 유지됨
+
+PostgreSQL이 아니거나 파티션 전환 전인 DB에서는 모든 함수가 아무 작업도 하지 않습니다.
+"""
+import re
+from datetime import date
+
+from django.db import connection, transaction
+
+TABLE = 'tech_trend'
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+_BOUND_PATTERN = re.compile(r"FROM \('(\d{4}-\d{2}-\d{2})'\) TO \('(\d{4}-\d{2}-\d{2})'\)")
+
+
+def add_months(month: date, months: int) -> date:
+    """month가 속한 달의 1일에서 months개월 이동한 날짜"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f'{TABLE}_{month:%Y%m}'
+
+
+def is_partitioned() -> bool:
+    """현재 DB의 tech_trend가 파티션 테이블인지"""
+    if connection.vendor != 'postgresql':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [TABLE])
+        row = cursor.fetchone()
+    return row is not None and row[0] == 'p'
+
+
+def trend_partitions() -> list[tuple[str, date, date]]:
+    """연결된 월 파티션 목록 [(이름, 시작일, 종료일(미포함))] (기본 파티션 제외, 시작일 순)"""
+    if not is_partitioned():
+        return []
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = %s::regclass",
+            [TABLE],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, bound in rows:
+        match = _BOUND_PATTERN.search(bound)
+        if match:
+            partitions.append((name, date.fromisoformat(match.group(1)), date.fromisoformat(match.group(2))))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def ensure_trend_partitions(start_date, end_date, dry_run: bool = False) -> list[str]:
+    """
+    [start_date, end_date]가 걸친 월 중 파티션이 없는 월의 파티션을 만들고 이름 목록을 반환
+    기본 파티션에 이미 그 월의 행이 있으면 새 파티션으로 옮긴 뒤 연결합니다.
+    """
+    if not is_partitioned():
+        return []
+    existing = {start for _, start, _ in trend_partitions()}
+    month, last_month = start_date.replace(day=1), end_date.replace(day=1)
+
+    created = []
+    while month <= last_month:
+        next_month = add_months(month, 1)
+        if month not in existing:
+            if not dry_run:
+                _create_partition(month, next_month)
+            created.append(partition_name(month))
+        month = next_month
+    return created
+
+
+def _create_partition(month: date, next_month: date) -> None:
+    name = partition_name(month)
+    bounds = f"FROM ('{month.isoformat()}') TO ('{next_month.isoformat()}')"
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE reference_date >= %s AND reference_date < %s)",
+            [month, next_month],
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(f"CREATE TABLE {name} PARTITION OF {TABLE} FOR VALUES {bounds}")
+            return
+        # 기본 파티션에 해당 월 행이 남아 있으면 바로 만들 수 없으므로 별도 테이블로 옮긴 뒤 연결
+        cursor.execute(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE reference_date >= %s AND reference_date < %s "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved",
+            [month, next_month],
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES {bounds}")
+
+
+def retention_cutoff(retention_months, today: date) -> date | None:
+    """보관 기간(개월)이 지난 날짜 경계 (today가 속한 달 1일 기준, 보관 기간이 설정되지 않았으면 None)"""
+    if not retention_months or retention_months <= 0:
+        return None
+    return add_months(today, -retention_months)
+
+
+def detach_trend_partitions(retention_months, today: date, drop: bool = False, dry_run: bool = False) -> list[str]:
+    """
+    보관 기간(retention_months개월)이 지난 날짜만 담은 월 파티션을 분리하고 이름 목록을 반환
+    retention_months가 None/0이면 (기본값) 아무 것도 분리하지 않습니다.
+    drop=False면 분리된 파티션은 같은 이름의 일반 테이블로 남아 보관되고, drop=True면 삭제합니다.
+    """
+    before = retention_cutoff(retention_months, today)
+    if before is None:
+        return []
+    detached = [name for name, _, end in trend_partitions() if end <= before]
+    if dry_run:
+        return detached
+    for name in detached:
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+            if drop:
+                cursor.execute(f"DROP TABLE {name}")
+    return detached
@@ -0,0 +1,279 @@
+"""
+기술 스택별 최근 7/30/90일 언급량 합계(tech_trend_rollup) 유지
+대시보드 Top N이 요청마다 기술 스택 N개의 90일치 tech_trend를 각각 SUM 하지 않도록 기간별 합계를 미리 저장해 둡니다.
+
+기간: 기존 집계와 같이 [기준일 - N일, 기준일] (양 끝 포함)
+
+갱신 방식:
+    - 증분(update_trend_rollups): 일별 집계가 기준일 다음 날짜를 저장하면
+      합계 += 새 날짜 값 - 기간에서 빠지는 날짜 값 (tech_trend 조회 1회 + bulk_update)
+    - 전체(rebuild_trend_rollups): 과거 날짜를 채우는 백필/재계산 후, 또는 증분 조건이 맞지 않을 때
+      기간별 GROUP BY 1회로 다시 계산
+
+주/월 단위 집계(tech_trend_weekly, tech_trend_monthly)도 여기서 유지합니다.
+    - 기간 시작일: 주는 월요일, 월은 1일
+    - 값: 기간 내 일별 값의 합계와 집계된 일수, 증가율은 일 평균 기준 직전 기간 대비 증감률(%)
+      (직전 기간이 없거나 평균이 0이면 0.0)
+    - 갱신(refresh_period_rollups): 바뀐 날짜가 속한 기간과, 증가율이 그 기간에 의존하는 다음 기간만
+      GROUP BY 1회로 다시 계산해 교체 (범위를 생략하면 전체 백필)
+    - 증가율은 (기간, 기술 스택) 일 평균 행렬에 trend_math.period_change를 적용해 한 번에 계산
+"""
+from datetime import timedelta
+
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, Max, Min, Q, Sum
+from django.db.models.functions import TruncMonth, TruncWeek
+
+from .models import TechTrend, TechTrendMonthly, TechTrendRollup, TechTrendWeekly
+from .trend_math import period_change
+
+ROLLUP_WINDOWS = (7, 30, 90)
+ROLLUP_FIELDS = ('job_mention_count', 'article_mention_count')
+
+
+def _window_sums(as_of, window_days: int) -> dict:
+    """{TechStack ID: (채용공고 언급 합계, 게시글 언급 합계)} (기간 내 삭제되지 않은 tech_trend 기준)"""
+    rows = TechTrend.objects.filter(
+        reference_date__gte=as_of - timedelta(days=window_days),
+        reference_date__lte=as_of,
+        is_deleted=False,
+    ).values('tech_stack_id').annotate(
+        job_sum=Sum('job_mention_count'),
+        article_sum=Sum('article_mention_count'),
+    ).values_list('tech_stack_id', 'job_sum', 'article_sum')
+    return {tech_id: (job_sum, article_sum) for tech_id, job_sum, article_sum in rows}
+
+
+def current_as_of_date():
+    """현재 저장된 합계의 기준일 (없으면 None)"""
+    return TechTrendRollup.objects.aggregate(as_of=Max('as_of_date'))['as_of']
+
+
+def rebuild_trend_rollups(as_of=None) -> int:
+    """
+    모든 기간의 합계를 as_of 기준으로 다시 계산해 교체하고 저장한 행 수를 반환
+    as_of를 생략하면 tech_trend의 마지막 날짜를 기준일로 사용합니다.
+    """
+    if as_of is None:
+        as_of = TechTrend.objects.filter(is_deleted=False).aggregate(last=Max('reference_date'))['last']
+    if as_of is None:
+        return 0
+
+    rollups = [
+        TechTrendRollup(
+            tech_stack_id=tech_id,
+            window_days=window_days,
+            as_of_date=as_of,
+            job_mention_sum=job_sum,
+            article_mention_sum=article_sum,
+        )
+        for window_days in ROLLUP_WINDOWS
+        for tech_id, (job_sum, article_sum) in _window_sums(as_of, window_days).items()
+    ]
+    with transaction.atomic():
+        TechTrendRollup.objects.all().delete()
+        TechTrendRollup.objects.bulk_create(rollups)
+    return len(rollups)
+
+
+def update_trend_rollups(reference_date) -> int:
+    """
+    reference_date의 tech_trend가 저장된 뒤 기간별 합계와 주/월 단위 집계를 갱신하고, 갱신한 행 수를 반환
+    (주/월 단위는 reference_date가 속한 주/월만 다시 계산)
+    """
+    return _update_window_rollups(reference_date) + refresh_period_rollups(reference_date, reference_date)
+
+
+def refresh_trend_rollups(start_date=None, end_date=None) -> int:
+    """
+    여러 날짜의 tech_trend를 한꺼번에 저장한 뒤(백필/재계산) 호출: 기간별 합계는 전체 재계산,
+    주/월 단위 집계는 [start_date, end_date]에 걸친 기간만 다시 계산 (생략하면 전체)
+    """
+    return rebuild_trend_rollups() + refresh_period_rollups(start_date, end_date)
+
+
+def _update_window_rollups(reference_date) -> int:
+    """
+    reference_date의 tech_trend가 저장된 뒤 기간별 합계를 갱신하고, 갱신한 행 수를 반환
+    - 기준일 다음 날짜: 새 날짜 값을 더하고 기간에서 빠지는 날짜 값을 빼는 증분 갱신
+    - 기준일 이전 날짜(과거 재계산): 기준일은 유지하고 전체 재계산 (기간 밖의 날짜면 할 일 없음)
+    - 그 외(같은 날 재실행, 날짜 공백, 합계 없음): reference_date 기준으로 전체 재계산
+    """
+    as_of = current_as_of_date()
+    if as_of is not None and reference_date < as_of:
+        if reference_date < as_of - timedelta(days=max(ROLLUP_WINDOWS)):
+            return 0
+        return rebuild_trend_rollups(as_of)
+    if as_of is None or reference_date != as_of + timedelta(days=1):
+        return rebuild_trend_rollups(reference_date)
+
+    # 기간마다 빠지는 날짜: 새 기간 [reference_date - N, reference_date]의 바로 앞 날짜
+    expired_dates = {window_days: reference_date - timedelta(days=window_days + 1) for window_days in ROLLUP_WINDOWS}
+    values = {}
+    for tech_id, ref_date, *counts in TechTrend.objects.filter(
+        Q(reference_date=reference_date) | Q(reference_date__in=expired_dates.values()),
+        is_deleted=False,
+    ).values_list('tech_stack_id', 'reference_date', *ROLLUP_FIELDS):
+        values[(tech_id, ref_date)] = counts
+
+    existing = {
+        (rollup.tech_stack_id, rollup.window_days): rollup
+        for rollup in TechTrendRollup.objects.all()
+    }
+    tech_ids = {tech_id for tech_id, _ in existing} | {
+        tech_id for tech_id, ref_date in values if ref_date == reference_date
+    }
+
+    changed, created = [], []
+    for window_days, expired_date in expired_dates.items():
+        for tech_id in tech_ids:
+            added_job, added_article = values.get((tech_id, reference_date), (0, 0))
+            expired_job, expired_article = values.get((tech_id, expired_date), (0, 0))
+            rollup = existing.get((tech_id, window_days))
+            if rollup is None:
+                # 새 기술 스택: 이전 합계가 없으므로 새 날짜 값에서 시작
+                created.append(TechTrendRollup(
+                    tech_stack_id=tech_id,
+                    window_days=window_days,
+                    as_of_date=reference_date,
+                    job_mention_sum=added_job,
+                    article_mention_sum=added_article,
+                ))
+                continue
+            rollup.job_mention_sum += added_job - expired_job
+            rollup.article_mention_sum += added_article - expired_article
+            rollup.as_of_date = reference_date
+            changed.append(rollup)
+
+    with transaction.atomic():
+        TechTrendRollup.objects.bulk_update(
+            changed, ['job_mention_sum', 'article_mention_sum', 'as_of_date', 'updated_at'], batch_size=1000
+        )
+        TechTrendRollup.objects.bulk_create(created)
+    return len(changed) + len(created)
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+# 단위별 (모델, 기간 시작일 함수, DB 절삭 함수, 직전 기간 시작일 함수, 다음 기간 시작일 함수)
+PERIOD_ROLLUPS = {
+    'week': (
+        TechTrendWeekly, week_start, TruncWeek,
+        lambda start: start - timedelta(days=7),
+        lambda start: start + timedelta(days=7),
+    ),
+    'month': (
+        TechTrendMonthly, month_start, TruncMonth,
+        lambda start: month_start(start - timedelta(days=1)),
+        lambda start: month_start(start + timedelta(days=31)),
+    ),
+}
+
+
+def _change_rates(values: dict, next_start) -> dict:
+    """
+    일 평균 기준 직전 기간 대비 증감률(%) (직전 기간 값이 없거나 0이면 0.0)
+    values: {(TechStack ID, 기간 시작일): (일수, 채용공고 합계, 게시글 합계)}
+    반환: {(TechStack ID, 기간 시작일): (채용공고 증감률, 게시글 증감률)}
+    """
+    if not values:
+        return {}
+    stack_ids = sorted({tech_id for tech_id, _ in values})
+    periods = [min(period for _, period in values)]
+    last = max(period for _, period in values)
+    while periods[-1] < last:
+        periods.append(next_start(periods[-1]))
+    row_of = {period: i for i, period in enumerate(periods)}
+    col_of = {tech_id: i for i, tech_id in enumerate(stack_ids)}
+
+    # (지표, 기간, 기술 스택) 일 평균 행렬, 값이 없는 칸은 0
+    averages = np.zeros((2, len(periods), len(stack_ids)))
+    for (tech_id, period), (day_count, job_sum, article_sum) in values.items():
+        averages[:, row_of[period], col_of[tech_id]] = (job_sum / day_count, article_sum / day_count)
+    job_rates, article_rates = (period_change(metric, periods=1).tolist() for metric in averages)
+
+    return {
+        (tech_id, period): (job_rates[row_of[period]][col_of[tech_id]], article_rates[row_of[period]][col_of[tech_id]])
+        for tech_id, period in values
+    }
+
+
+def refresh_period_rollups(start_date=None, end_date=None) -> int:
+    """
+    [start_date, end_date]가 걸친 주/월과 그 다음 주/월의 집계를 다시 계산해 교체하고 저장한 행 수를 반환
+    start_date를 생략하면 tech_trend에 남아 있는 모든 기간을 다시 계산합니다. (백필)
+    보관 기간이 지나 tech_trend에서 분리된 날짜(partitions.py)가 걸친 기간은 저장돼 있던 집계를 유지하고,
+    첫 기간의 직전 기간 값이 tech_trend에 없으면 저장돼 있던 집계로 증가율을 계산합니다.
+    """
+    if start_date is None:
+        first_date = TechTrend.objects.aggregate(first=Min('reference_date'))['first']
+        if first_date is None:
+            return 0
+
+    saved_count = 0
+    for model, period_start, trunc, previous_start, next_start in PERIOD_ROLLUPS.values():
+        trends = TechTrend.objects.filter(is_deleted=False)
+        if start_date is not None:
+            first = period_start(start_date)
+            last = next_start(period_start(end_date or start_date))
+            # 첫 기간의 증가율 계산용으로 직전 기간도 함께 집계
+            trends = trends.filter(reference_date__gte=previous_start(first), reference_date__lt=next_start(last))
+            targets = model.objects.filter(period_start__gte=first, period_start__lte=last)
+        else:
+            first = period_start(first_date)
+            targets = model.objects.filter(period_start__gte=first)
+        stored = {
+            (rollup.tech_stack_id, rollup.period_start): (
+                rollup.day_count, rollup.job_mention_count, rollup.article_mention_count
+            )
+            for rollup in model.objects.filter(period_start__in=[previous_start(first), first], day_count__gt=0)
+        }
+
+        sums = {
+            (tech_id, period): (day_count, job_sum, article_sum)
+            for tech_id, period, day_count, job_sum, article_sum in trends.annotate(
+                period=trunc('reference_date')
+            ).values('tech_stack_id', 'period').annotate(
+                day_count=Count('id'),
+                job_sum=Sum('job_mention_count'),
+                article_sum=Sum('article_mention_count'),
+            ).values_list('tech_stack_id', 'period', 'day_count', 'job_sum', 'article_sum')
+        }
+
+        # 전체 백필: 첫 기간의 일부 날짜가 분리돼 저장된 집계보다 일수가 적으면 저장된 집계를 유지
+        kept = set()
+        if start_date is None:
+            for (tech_id, period), values in stored.items():
+                if period == first and values[0] > sums.get((tech_id, period), (0,))[0]:
+                    kept.add(tech_id)
+                    sums[(tech_id, period)] = values
+
+        # 직전 기간 값은 다시 집계한 값 우선, 없으면 저장돼 있던 집계 사용
+        rates = _change_rates({**stored, **sums}, next_start)
+
+        rows = []
+        for (tech_id, period), current in sums.items():
+            if period < first or (period == first and tech_id in kept):
+                continue
+            rows.append(model(
+                tech_stack_id=tech_id,
+                period_start=period,
+                day_count=current[0],
+                job_mention_count=current[1],
+                article_mention_count=current[2],
+                job_change_rate=rates[(tech_id, period)][0],
+                article_change_rate=rates[(tech_id, period)][1],
+            ))
+
+        with transaction.atomic():
+            targets.exclude(period_start=first, tech_stack_id__in=kept).delete()
+            model.objects.bulk_create(rows, batch_size=1000)
+        saved_count += len(rows)
+    return saved_count
@@ -0,0 +1,57 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save
+from django.dispatch import receiver
+from apps.common.cache import bump_generation, NS_CATEGORIES, NS_TECHSTACK
+from .membership import mark_articles_dirty, mark_categories_dirty, mark_tech_stacks_dirty
+from .models import Article, ArticleStack, Category, CategoryTech, TechStack
+
+@receiver(pre_save, sender=TechStack)
+def remember_techstack_deleted_state(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    저장 전 DB의 is_deleted 값을 기억해 두었다가 post_save에서 삭제/복구 여부를 판단
+    (설명/로고/문서 URL만 바뀐 저장은 카테고리 소속을 다시 계산하지 않도록)
+    """
+    instance._previous_is_deleted = None
+    if raw or instance.pk is None or (update_fields is not None and 'is_deleted' not in update_fields):
+        return
+    instance._previous_is_deleted = sender.objects.filter(pk=instance.pk).values_list('is_deleted', flat=True).first()
+
+
+@receiver([post_save, post_delete], sender=TechStack)
+def invalidate_techstack_cache(sender, instance, **kwargs):
+    """
+    관리자 페이지 등에서 기술 스택(이름, 로고, 문서 URL 등)이 바뀌면
+    기술 스택 목록/상세/Top 5 캐시를 무효화합니다. (커밋 후 세대 번호 INCR 1회)
+    """
+    transaction.on_commit(lambda: bump_generation(NS_TECHSTACK))
+    # 삭제/복구(또는 행 삭제)되면 이 기술 스택으로 카테고리에 속한 공고/게시글이 바뀔 수 있음
+    previous = getattr(instance, '_previous_is_deleted', None)
+    if kwargs['signal'] is post_delete or (previous is not None and previous != instance.is_deleted):
+        mark_tech_stacks_dirty([instance.id])
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=CategoryTech)
+def invalidate_category_cache(sender, instance, **kwargs):
+    """
+    카테고리 또는 카테고리-기술 연결이 추가/수정/삭제되면
+    카테고리 목록과 카테고리별 공고/게시글 목록 캐시를 무효화합니다.
+    """
+    transaction.on_commit(lambda: bump_generation(NS_CATEGORIES))
+
+
+@receiver([post_save, post_delete], sender=CategoryTech)
+def update_category_memberships(sender, instance, **kwargs):
+    """카테고리-기술 연결이 바뀌면 해당 카테고리의 공고/게시글 소속 전체를 커밋 시점에 다시 계산합니다."""
+    mark_categories_dirty([instance.category_id])
+
+
+@receiver(post_save, sender=Article)
+@receiver([post_save, post_delete], sender=ArticleStack)
+def update_article_memberships(sender, instance, **kwargs):
+    """게시글 삭제/복구나 게시글-기술 연결 변경 시 해당 게시글의 카테고리 소속을 커밋 시점에 다시 계산합니다."""
+    if sender is Article:
+        if not kwargs.get('created'):
+            mark_articles_dirty([instance.id])
+    else:
+        mark_articles_dirty([instance.article_id])
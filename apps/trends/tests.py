@@ -0,0 +1,162 @@
+from datetime import date
+from io import StringIO
+from unittest import mock, skipUnless
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from apps.trends.models import TechStack, TechTrendWeekly
+from apps.trends.partitions import detach_trend_partitions, ensure_trend_partitions, trend_partitions
+from apps.trends.rollups import PERIOD_ROLLUPS, _change_rates, week_start
+from apps.trends.trend_math import moving_average
+
+
+class TechStackMembershipSignalTests(TestCase):
+    """기술 스택 저장 시 카테고리 소속 재계산은 삭제/복구(is_deleted 변경)나 행 삭제일 때만 예약"""
+
+    def setUp(self):
+        self.stack = TechStack.objects.create(name='Python')
+        patcher = mock.patch('apps.trends.signals.mark_tech_stacks_dirty')
+        self.mark_dirty = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_detail_edit_does_not_mark_dirty(self):
+        self.stack.description = '설명 수정'
+        self.stack.docs_url = 'https://docs.python.org'
+        self.stack.save()
+        TechStack.objects.update_or_create(name='Python', defaults={'logo': 'logos/Python.png', 'is_deleted': False})
+        self.mark_dirty.assert_not_called()
+
+    def test_create_does_not_mark_dirty(self):
+        TechStack.objects.create(name='Django')
+        self.mark_dirty.assert_not_called()
+
+    def test_soft_delete_and_restore_mark_dirty(self):
+        self.stack.is_deleted = True
+        self.stack.save()
+        self.mark_dirty.assert_called_once_with([self.stack.id])
+
+        self.mark_dirty.reset_mock()
+        TechStack.objects.update_or_create(name='Python', defaults={'is_deleted': False})
+        self.mark_dirty.assert_called_once_with([self.stack.id])
+
+    def test_update_fields_without_is_deleted_does_not_mark_dirty(self):
+        self.stack.is_deleted = True
+        self.stack.save(update_fields=['description'])
+        self.mark_dirty.assert_not_called()
+
+    def test_delete_marks_dirty(self):
+        stack_id = self.stack.id
+        self.stack.delete()
+        self.mark_dirty.assert_called_once_with([stack_id])
+
+
+@skipUnless(connection.vendor == 'postgresql', 'tech_trend 파티션은 PostgreSQL 전용')
+class TrendPartitionRetentionTests(TestCase):
+    """보관 기간을 명시적으로 설정하지 않으면 파티션을 분리하지 않음"""
+
+    today = date(2026, 10, 17)
+
+    def setUp(self):
+        ensure_trend_partitions(date(2020, 1, 1), date(2020, 2, 28))
+
+    def partition_names(self):
+        return {name for name, _, _ in trend_partitions()}
+
+    def test_unset_retention_detaches_nothing(self):
+        for retention in (None, 0):
+            self.assertEqual(detach_trend_partitions(retention, self.today), [])
+        self.assertIn('tech_trend_202001', self.partition_names())
+
+    @override_settings(TECH_TREND_RETENTION_MONTHS=0)
+    def test_default_maintenance_keeps_old_partitions(self):
+        call_command('manage_trend_partitions', stdout=StringIO())
+        self.assertTrue({'tech_trend_202001', 'tech_trend_202002'} <= self.partition_names())
+
+    def test_explicit_retention_detaches_old_partitions(self):
+        detached = detach_trend_partitions(24, self.today)
+        self.assertIn('tech_trend_202001', detached)
+        self.assertNotIn('tech_trend_202001', self.partition_names())
+
+
+class PeriodChangeRateTests(SimpleTestCase):
+    """주/월 집계 증감률: 일 평균 기준 직전 기간 대비 (직전 기간이 없거나 0이면 0.0)"""
+
+    def test_change_rates_use_daily_average_of_previous_period(self):
+        first, second, third = date(2026, 9, 28), date(2026, 10, 5), date(2026, 10, 12)
+        rates = _change_rates({
+            (1, first): (7, 70, 0),      # 일 평균 10, 0
+            (1, second): (7, 105, 14),   # 일 평균 15, 2
+            (1, third): (3, 30, 3),      # 진행 중인 주 (일 평균 10, 1)
+            (2, third): (3, 6, 0),       # 직전 주 값 없음
+        }, PERIOD_ROLLUPS['week'][4])
+
+        self.assertEqual(rates[(1, first)], (0.0, 0.0))
+        self.assertEqual(rates[(1, second)], (50.0, 0.0))
+        self.assertEqual(rates[(1, third)], (-33.33, -50.0))
+        self.assertEqual(rates[(2, third)], (0.0, 0.0))
+
+
+class MovingAverageTests(SimpleTestCase):
+    """이동 평균: 해당 행 포함 직전 window행 평균, window행이 안 되는 앞쪽 행은 있는 행만 평균"""
+
+    def test_short_leading_window_averages_available_rows(self):
+        averages = moving_average([[2, 10], [4, 20], [6, 30]], window=7)
+        self.assertEqual(averages.tolist(), [[2.0, 10.0], [3.0, 15.0], [4.0, 20.0]])
+
+    def test_full_window_drops_oldest_row(self):
+        averages = moving_average([[1], [2], [3], [4], [5]], window=3)
+        self.assertEqual(averages.ravel().tolist(), [1.0, 1.5, 2.0, 3.0, 4.0])
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class TechTrendSeriesViewTests(TestCase):
+    """그래프용 시계열: 요청한 순서대로 기술 스택별 배열, 존재하지 않거나 삭제된 기술 스택은 400"""
+
+    url = '/api/v1/trends/series/'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.python = TechStack.objects.create(name='Python')
+        cls.django = TechStack.objects.create(name='Django')
+        cls.deleted = TechStack.objects.create(name='Deleted', is_deleted=True)
+        this_week = week_start(timezone.now().date())
+        for stack in (cls.python, cls.deleted):
+            TechTrendWeekly.objects.create(
+                tech_stack=stack, period_start=this_week, day_count=1, job_mention_count=3,
+            )
+        cls.this_week = this_week
+
+    def get(self, ids, **params):
+        return self.client.get(self.url, {'ids': ids, 'days': 365, 'resolution': 'week', **params})
+
+    def test_stack_without_rows_keeps_its_name(self):
+        response = self.get(f'{self.django.id},{self.python.id}')
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['dates'], [self.this_week.isoformat()])
+        self.assertEqual(
+            [(row['id'], row['name'], row['job_mention_count']) for row in data['series']],
+            [(self.django.id, 'Django', [None]), (self.python.id, 'Python', [3])],
+        )
+
+    def test_unknown_or_deleted_stack_is_rejected(self):
+        for ids in (f'{self.python.id},{self.deleted.id}', f'{self.python.id},999999'):
+            response = self.get(ids)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('ids', response.json())
+
+    def test_share_and_change_rate_use_different_keys(self):
+        daily = self.get(self.python.id, days=30, resolution='auto').json()
+        weekly = self.get(self.python.id, days=365, resolution='auto').json()
+
+        self.assertEqual(daily['resolution'], 'day')
+        self.assertEqual(daily['fields'], ['job_mention_count', 'job_share', 'article_mention_count', 'article_share'])
+        self.assertEqual(weekly['resolution'], 'week')
+        self.assertEqual(
+            weekly['fields'], ['job_mention_count', 'job_change_rate', 'article_mention_count', 'article_change_rate'],
+        )
+        for data in (daily, weekly):
+            self.assertEqual(set(data['series'][0]) - {'id', 'name'}, set(data['fields']))
@@ -0,0 +1,118 @@
+"""
+트렌드 지표 벡터 계산
+언급 수를 (날짜, 기술 스택) 2차원 NumPy 배열로 받아 날짜/기술 스택 루프 없이 한 번에 계산합니다.
+행 = 날짜 (오름차순, 빈 날짜 없이 연속), 열 = 기술 스택
+
+- share_of_total: 날짜별 전체 언급량 대비 비율(%) (tech_trend의 *_change_rate에 저장되는 값)
+- period_change: periods행 전 대비 증감률(%) (rollups에서 주/월 일 평균 행렬의 직전 기간 대비 증감률 계산에 사용)
+- moving_average: 해당 행을 포함한 직전 window행 이동 평균 (앞쪽 행은 있는 만큼만 평균)
+- zscore_flags: 직전 window행 평균/표준편차 대비 z-score와 급증/급감 여부
+
+tech_trend에 저장은 writers.save_trend_matrix()에서 합니다.
+"""
+from datetime import timedelta
+
+import numpy as np
+
+from .models import TechTrend
+
+
+def as_matrix(counts) -> np.ndarray:
+    """float64 (날짜, 기술 스택) 행렬 (하루치 1차원 배열은 1행 행렬로 변환)"""
+    return np.atleast_2d(np.asarray(counts, dtype=np.float64))
+
+
+def share_of_total(counts) -> np.ndarray:
+    """날짜별 전체 대비 비율(%) (소수점 둘째 자리 반올림, 전체가 0인 날짜는 0.0)"""
+    counts = as_matrix(counts)
+    totals = counts.sum(axis=1, keepdims=True)
+    shares = np.divide(counts * 100, totals, out=np.zeros_like(counts), where=totals > 0)
+    return np.round(shares, 2)
+
+
+def period_change(counts, periods: int = 1) -> np.ndarray:
+    """periods행 전 대비 증감률(%) (소수점 둘째 자리 반올림, 이전 값이 없거나 0이면 0.0)"""
+    counts = as_matrix(counts)
+    change = np.zeros_like(counts)
+    if 0 < periods < len(counts):
+        previous = counts[:-periods]
+        np.divide(
+            (counts[periods:] - previous) * 100, previous,
+            out=change[periods:], where=previous != 0,
+        )
+    return np.round(change, 2)
+
+
+def _trailing_window(values: np.ndarray, window: int, include_current: bool):
+    """각 행 기준 직전 window행의 (합계, 제곱합, 행 수) (include_current=False면 해당 행 제외)"""
+    zero_row = np.zeros((1, values.shape[1]))
+    sums = np.vstack([zero_row, np.cumsum(values, axis=0)])
+    squares = np.vstack([zero_row, np.cumsum(values * values, axis=0)])
+
+    end = np.arange(len(values)) + (1 if include_current else 0)
+    start = np.maximum(end - window, 0)
+    return sums[end] - sums[start], squares[end] - squares[start], (end - start)[:, None]
+
+
+def moving_average(counts, window: int = 7) -> np.ndarray:
+    """해당 행을 포함한 직전 window행 평균 (window행이 안 되는 앞쪽 행은 있는 행만 평균)"""
+    counts = as_matrix(counts)
+    sums, _, sizes = _trailing_window(counts, window, include_current=True)
+    return sums / sizes
+
+
+def zscore_flags(counts, window: int = 28, threshold: float = 3.0, min_periods: int = 7):
+    """
+    (z-score 행렬, 급변 여부 행렬)
+    각 행을 그 이전 window행(해당 행 제외)의 평균/표준편차와 비교하며,
+    이전 행이 min_periods 미만이거나 표준편차가 0이면 z-score 0, 급변 아님으로 봅니다.
+    """
+    counts = as_matrix(counts)
+    sums, squares, sizes = _trailing_window(counts, window, include_current=False)
+    sizes = np.broadcast_to(sizes, counts.shape)
+
+    valid = sizes >= max(min_periods, 1)
+    safe_sizes = np.where(valid, sizes, 1)
+    mean = sums / safe_sizes
+    std = np.sqrt(np.clip(squares / safe_sizes - mean * mean, 0, None))
+
+    scores = np.divide(counts - mean, std, out=np.zeros_like(counts), where=valid & (std > 0))
+    return scores, np.abs(scores) >= threshold
+
+
+def trend_matrix(metric: str, stack_ids: list[int], start_date, end_date) -> np.ndarray:
+    """
+    tech_trend의 {metric}_mention_count를 (날짜, 기술 스택) 행렬로 조회 (쿼리 1회)
+    행 0 = start_date, 저장되지 않은 칸은 0
+    """
+    num_days = (end_date - start_date).days + 1
+    counts = np.zeros((num_days, len(stack_ids)), dtype=np.int64)
+    col_of = {stack_id: i for i, stack_id in enumerate(stack_ids)}
+
+    rows = TechTrend.objects.filter(
+        tech_stack_id__in=stack_ids,
+        reference_date__range=(start_date, end_date),
+        is_deleted=False,
+    ).values_list('reference_date', 'tech_stack_id', f'{metric}_mention_count')
+    for reference_date, stack_id, count in rows:
+        counts[(reference_date - start_date).days, col_of[stack_id]] = count
+    return counts
+
+
+def trend_anomalies(metric: str, reference_date, stack_ids: list[int], window: int = 28,
+                    threshold: float = 3.0) -> list[tuple[int, int, float]]:
+    """
+    기준일 언급 수가 이전 window일 대비 급증/급감한 기술 스택 [(TechStack ID, 언급 수, z-score)]
+    (|z-score| 큰 순)
+    """
+    if not stack_ids:
+        return []
+    counts = trend_matrix(metric, stack_ids, reference_date - timedelta(days=window), reference_date)
+    scores, flags = zscore_flags(counts, window=window, threshold=threshold)
+
+    last_counts, last_scores = counts[-1].tolist(), scores[-1].tolist()
+    anomalies = [
+        (stack_ids[col], last_counts[col], round(last_scores[col], 2))
+        for col in np.flatnonzero(flags[-1]).tolist()
+    ]
+    return sorted(anomalies, key=lambda anomaly: -abs(anomaly[2]))
@@ -19,9 +19,11 @@ urlpatterns = [
     path('categories/<int:category_id>/', views.CategoryTechStackListView.as_view(), name='category_tech_stack_list'),
     path('categories/<int:category_id>/job-posting/', views.CategoryJobPostingListView.as_view(), name='category_job_posting_list'),
     path('categories/<int:category_id>/articles/', views.CategoryArticleListView.as_view(), name='category_article_list'),
+    path('categories/<int:category_id>/stats/', views.CategoryStatsView.as_view(), name='category_stats'),
 
     # 트렌드
     path('', views.TechTrendListView.as_view(), name='trend_list'),
+    path('series/', views.TechTrendSeriesView.as_view(), name='trend_series'),  # 그래프용 열 단위 시계열
     path('ranking/', views.TrendRankingView.as_view(), name='trend_ranking'),
 
     # 즐겨찾기
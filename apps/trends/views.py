@@ -5,6 +5,7 @@
 from datetime import timedelta
 from rest_framework import generics, status, filters
 from rest_framework.views import APIView
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.pagination import PageNumberPagination
@@ -12,10 +13,15 @@ from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.core.cache import cache
+from django.db.models import Count
+from apps.common.cache import cache_key, cached_computation, NS_CATEGORIES, NS_TECHSTACK, NS_TRENDS
+from apps.common.pagination import CachedCountPagination
 from .models import TechStack, Category, TechTrend, TechBookmark
-from .models import Article
+from .models import Article, CategoryArticle, CategoryJobPosting, TechTrendMonthly, TechTrendRollup, TechTrendWeekly
+from .rollups import ROLLUP_WINDOWS, month_start, week_start
 from rest_framework import generics, filters
 from django_filters.rest_framework import DjangoFilterBackend
+from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from .serializers import (
     TechStackSerializer, CategorySerializer,
@@ -29,13 +35,18 @@ from .serializers import (
 from apps.jobs.models import JobPosting
 from apps.jobs.serializers import JobPostingSerializer
 
+# 카테고리별 공고/게시글 목록/통계 캐시: 카테고리 소속 갱신(categories)이나 크롤링/기술 스택 변경(techstack) 시 무효화
+CATEGORY_LIST_NAMESPACES = (NS_CATEGORIES, NS_TECHSTACK)
+
+
 class CategoryJobPostingListView(generics.ListAPIView):
     """
-    특정 카테고리에 포함된 기술 스택을 가진 채용 공고 목록 조회
+    특정 카테고리에 포함된 기술 스택을 가진 채용 공고 목록 조회 (캐시 적용: 10분)
     """
     permission_classes = [AllowAny]
     # apps/jobs/serializers.py에 있는 시리얼라이저를 사용합니다.
     serializer_class = JobPostingSerializer 
+    pagination_class = CachedCountPagination
 
     def get_queryset(self):
         category_id = self.kwargs['category_id']
@@ -43,29 +54,40 @@ class CategoryJobPostingListView(generics.ListAPIView):
         # 1. 카테고리 존재 및 삭제 여부 확인
         get_object_or_404(Category, id=category_id, is_deleted=False)
 
-        # 2. 해당 카테고리에 속한 기술 스택(TechStack)들을 먼저 찾습니다.
-        stacks_in_category = TechStack.objects.filter(
-            category_relations__category_id=category_id, 
-            is_deleted=False
-        )
-
-        # 3. [핵심 수정] 위에서 찾은 스택을 가진 공고를 찾습니다.
-        # tech_stacks (중간테이블) -> tech_stack (진짜 기술스택) -> in 필터링
+        # 2. 미리 계산된 카테고리 소속(category_job_posting)을 (category, job_posting) 인덱스 역순으로 읽고 공고/기업은 PK 조인
+        # (job_posting_id 내림차순 = 공고 최신순(-id))
         return JobPosting.objects.select_related('corp').filter(
-            tech_stacks__tech_stack__in=stacks_in_category, # 여기에 __tech_stack을 추가했습니다!
+            category_memberships__category_id=category_id,
             is_deleted=False
-        ).distinct().order_by('-id')
+        ).order_by('-category_memberships__job_posting_id')
+
+    def get_count_cache_key(self):
+        return cache_key(CATEGORY_LIST_NAMESPACES, 'jobs', self.kwargs['category_id'], 'count')
+
+    def get_count_queryset(self):
+        # 소속 테이블에는 삭제되지 않은 공고만 있으므로 공고 조인 없이 (category, job_posting) 인덱스만으로 개수 계산
+        return CategoryJobPosting.objects.filter(category_id=self.kwargs['category_id'])
+
+    def list(self, request, *args, **kwargs):
+        page = request.query_params.get('page', '1')
+        data = cached_computation(
+            'category_job_postings', CATEGORY_LIST_NAMESPACES, ('jobs', self.kwargs['category_id'], page),
+            lambda: super(CategoryJobPostingListView, self).list(request, *args, **kwargs).data,
+            timeout=60 * 10,
+        )
+        return Response(data)
     
 
 class CategoryArticleListView(generics.ListAPIView):
     """
-    특정 카테고리에 포함된 기술 스택을 가진 게시글 목록 조회
+    특정 카테고리에 포함된 기술 스택을 가진 게시글 목록 조회 (캐시 적용: 10분)
     """
     permission_classes = [AllowAny]
     serializer_class = ArticleSerializer
+    pagination_class = CachedCountPagination
     filter_backends = [filters.OrderingFilter]
     ordering_fields = ['created_at', 'view_count', 'id'] # 허용할 정렬 필드
-    ordering = ['-id'] # 기본: 최신순
+    ordering = None # 기본: 최신순 (get_queryset에서 소속 테이블 인덱스 순서로 정렬)
 
     def get_queryset(self):
         category_id = self.kwargs['category_id']
@@ -73,18 +95,68 @@ class CategoryArticleListView(generics.ListAPIView):
         # 1. 카테고리 존재 확인
         get_object_or_404(Category, id=category_id, is_deleted=False)
 
-        # 2. 카테고리에 속한 기술스택들
-        stacks_in_category = TechStack.objects.filter(
-            category_relations__category_id = category_id,
+        # 2. 미리 계산된 카테고리 소속(category_article)으로 게시글 조회 (article_id 내림차순 = 최신순(-id))
+        return Article.objects.filter(
+            category_memberships__category_id=category_id,
             is_deleted = False
+        ).order_by('-category_memberships__article_id')
+
+    def get_count_cache_key(self):
+        # 정렬과 무관하게 개수는 같으므로 페이지/정렬 조합이 모두 공유
+        return cache_key(CATEGORY_LIST_NAMESPACES, 'articles', self.kwargs['category_id'], 'count')
+
+    def get_count_queryset(self):
+        return CategoryArticle.objects.filter(category_id=self.kwargs['category_id'])
+
+    def list(self, request, *args, **kwargs):
+        params = request.query_params
+        parts = ('articles', self.kwargs['category_id'], params.get('page', '1'), params.get('ordering', ''))
+        data = cached_computation(
+            'category_articles', CATEGORY_LIST_NAMESPACES, parts,
+            lambda: super(CategoryArticleListView, self).list(request, *args, **kwargs).data,
+            timeout=60 * 10,
         )
+        return Response(data)
 
-        # 3. 그 기술스택을 가진 게시글 조회
-        return Article.objects.filter(
-            tech_stacks__tech_stack__in=stacks_in_category,
-            is_deleted = False
-        ).distinct()
-        
+
+class CategoryStatsView(APIView):
+    """
+    카테고리 일별 통계 (캐시 적용: 10분)
+    요청 예시: GET /api/v1/trends/categories/1/stats/?days=7|30|90 (기본 30일)
+    - 날짜별 카테고리 소속 공고 수(등록일 기준), 게시글 수(작성일 기준)
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, category_id):
+        get_object_or_404(Category, id=category_id, is_deleted=False)
+        days = request.query_params.get('days')
+        days = int(days) if days in ('7', '30', '90') else 30
+        start_date = timezone.localdate() - timedelta(days=days - 1)
+
+        result = cached_computation(
+            'category_stats', CATEGORY_LIST_NAMESPACES, ('stats', category_id, start_date, days),
+            lambda: self.get_stats(category_id, start_date, days),
+            timeout=60 * 10,
+        )
+        return Response(result)
+
+    def get_stats(self, category_id, start_date, days):
+        # (category, posted_on) 인덱스 범위 스캔으로 날짜별 개수만 집계
+        daily = {start_date + timedelta(days=i): {'job_posting_count': 0, 'article_count': 0} for i in range(days)}
+        for model, field in ((CategoryJobPosting, 'job_posting_count'), (CategoryArticle, 'article_count')):
+            for posted_on, count in model.objects.filter(
+                category_id=category_id, posted_on__gte=start_date
+            ).values('posted_on').annotate(count=Count('*')).values_list('posted_on', 'count'):
+                if posted_on in daily:
+                    daily[posted_on][field] = count
+
+        return {
+            'category_id': category_id,
+            'days': days,
+            'job_posting_count': sum(day['job_posting_count'] for day in daily.values()),
+            'article_count': sum(day['article_count'] for day in daily.values()),
+            'daily': [{'date': date.isoformat(), **counts} for date, counts in daily.items()],
+        }
 
 
 class CategoryTechStackListView(generics.ListAPIView):
@@ -143,19 +215,14 @@ class TechStackListView(generics.ListAPIView):
         ordering = request.query_params.get('ordering', '-job_stack_count')
         page = request.query_params.get('page', '1')
 
-        cache_key = f'trends:techstack:list:{search}:{name}:{ordering}:{page}'
-        cached_data = cache.get(cache_key)
-
-        if cached_data is not None:
-            return Response(cached_data)
-
-        # 캐시 미스 - DB 조회 (페이지네이션 포함)
-        response = super().list(request, *args, **kwargs)
-
+        # 캐시 미스/만료 시 워커 하나만 DB 조회 (페이지네이션 포함), 나머지는 이전 값 응답
         # 캐시 저장 (30분) - 페이지네이션된 응답 전체를 캐시
-        cache.set(cache_key, response.data, 60 * 30)
-
-        return response
+        data = cached_computation(
+            'techstack_list', NS_TECHSTACK, ('list', search, name, ordering, page),
+            lambda: super(TechStackListView, self).list(request, *args, **kwargs).data,
+            timeout=60 * 30,
+        )
+        return Response(data)
 
 
 class TechStackDetailView(generics.RetrieveAPIView):
@@ -167,8 +234,8 @@ class TechStackDetailView(generics.RetrieveAPIView):
     def retrieve(self, request, *args, **kwargs):
         """기술 스택 상세를 캐시에서 조회하거나 DB에서 가져옴"""
         tech_stack_id = kwargs.get('pk')
-        cache_key = f'trends:techstack:{tech_stack_id}'
-        cached_data = cache.get(cache_key)
+        key = cache_key(NS_TECHSTACK, 'detail', tech_stack_id)
+        cached_data = cache.get(key)
 
         if cached_data is not None:
             return Response(cached_data)
@@ -178,7 +245,7 @@ class TechStackDetailView(generics.RetrieveAPIView):
         serializer = self.get_serializer(instance)
 
         # 캐시 저장 (1시간)
-        cache.set(cache_key, serializer.data, 60 * 60)
+        cache.set(key, serializer.data, 60 * 60)
 
         return Response(serializer.data)
 
@@ -187,55 +254,62 @@ class TopTechStacksView(APIView):
     """
     대시보드용: TechStack 테이블의 job_stack_count 기준 Top 5
     전체 언급량은 최근 90일간 TechTrend의 job_mention_count 합계로 표시
+    요청 예시: GET /api/v1/trends/top-stacks/?days=7|30|90&limit=5&sort=job_stack_count|mentions
+    - 기본값: 90일, 5개, job_stack_count 순
+    - sort=mentions: 기간 내 채용공고 언급량 합계 순
+    언급량 합계는 미리 계산된 기간별 합계(tech_trend_rollup)를 한 번에 읽음 (기준일: 마지막으로 집계된 날짜)
     캐시 적용: 30분
     """
     permission_classes = [AllowAny]
+    max_limit = 50
 
     def get(self, request):
-        from django.db.models import Sum
-        
-        # 캐시 확인
-        cache_key = 'trends:top5:90days'
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return Response(cached_data)
-        
-        # 최근 90일 기준 날짜 계산
-        today = timezone.now().date()
-        start_date = today - timedelta(days=90)
-        
-        # 1. TechStack 테이블에서 job_stack_count 기준 Top 5 조회
-        top_stacks = TechStack.objects.filter(
-            is_deleted=False
-        ).order_by('-job_stack_count')[:5]
-        
-        # 2. 각 기술 스택의 90일간 job_mention_count 합계 계산
-        result = []
-        for stack in top_stacks:
-            # TechTrend에서 해당 기술 스택의 90일간 job_mention_count 합계
-            trend_sum = TechTrend.objects.filter(
-                tech_stack=stack,
-                reference_date__gte=start_date,
-                reference_date__lte=today,
-                is_deleted=False
-            ).aggregate(
-                total_job_mentions=Sum('job_mention_count')
-            )
-            
-            result.append({
-                'id': stack.id,
-                'name': stack.name,
-                'logo': stack.logo,
-                'docs_url': stack.docs_url,
-                'job_stack_count': stack.job_stack_count,  # 정렬 기준값
-                'total_mentions': trend_sum['total_job_mentions'] or 0,  # 표시될 언급량
-            })
-        
-        # 캐시 저장 (30분)
-        cache.set(cache_key, result, 60 * 30)
-        
+        days = request.query_params.get('days')
+        days = int(days) if days in [str(window_days) for window_days in ROLLUP_WINDOWS] else 90
+        try:
+            limit = min(max(int(request.query_params.get('limit', 5)), 1), self.max_limit)
+        except ValueError:
+            limit = 5
+        sort = 'mentions' if request.query_params.get('sort') == 'mentions' else 'job_stack_count'
+
+        # 캐시 확인 (30분)
+        # job_stack_count(techstack)와 tech_trend 합계(trends) 중 하나만 바뀌어도 새로 계산
+        result = cached_computation(
+            'top_techstacks', (NS_TECHSTACK, NS_TRENDS), (f'top{limit}', f'{days}days', sort),
+            lambda: self.get_top_stacks(days, limit, sort), timeout=60 * 30,
+        )
         return Response(result)
 
+    def get_top_stacks(self, days=90, limit=5, sort='job_stack_count'):
+        if sort == 'mentions':
+            # (window_days, -job_mention_sum) 인덱스를 그대로 읽는 Top N
+            rollups = TechTrendRollup.objects.select_related('tech_stack').filter(
+                window_days=days, tech_stack__is_deleted=False
+            ).order_by('-job_mention_sum', 'tech_stack_id')[:limit]
+            return [self._serialize(rollup.tech_stack, rollup.job_mention_sum) for rollup in rollups]
+
+        # 1. TechStack 테이블에서 job_stack_count 기준 Top N 조회
+        top_stacks = list(TechStack.objects.filter(
+            is_deleted=False
+        ).order_by('-job_stack_count')[:limit])
+
+        # 2. 기간별 job_mention_count 합계를 한 번의 쿼리로 조회
+        mention_sums = dict(TechTrendRollup.objects.filter(
+            tech_stack_id__in=[stack.id for stack in top_stacks], window_days=days
+        ).values_list('tech_stack_id', 'job_mention_sum'))
+        return [self._serialize(stack, mention_sums.get(stack.id, 0)) for stack in top_stacks]
+
+    @staticmethod
+    def _serialize(stack, total_mentions):
+        return {
+            'id': stack.id,
+            'name': stack.name,
+            'logo': stack.logo,
+            'docs_url': stack.docs_url,
+            'job_stack_count': stack.job_stack_count,  # 정렬 기준값
+            'total_mentions': total_mentions,  # 표시될 언급량
+        }
+
 
 class TechDocsURLView(APIView):
     """기술 스택 공식 문서 URL 조회"""
@@ -256,8 +330,8 @@ class CategoryListView(generics.ListAPIView):
 
     def list(self, request, *args, **kwargs):
         """카테고리 목록을 캐시에서 조회하거나 DB에서 가져옴"""
-        cache_key = 'trends:category:list'
-        cached_data = cache.get(cache_key)
+        key = cache_key(NS_CATEGORIES, 'list')
+        cached_data = cache.get(key)
 
         if cached_data is not None:
             return Response(cached_data)
@@ -267,7 +341,7 @@ class CategoryListView(generics.ListAPIView):
         serializer = self.get_serializer(queryset, many=True)
 
         # 캐시 저장 (1시간)
-        cache.set(cache_key, serializer.data, 60 * 60)
+        cache.set(key, serializer.data, 60 * 60)
 
         return Response(serializer.data)
 
@@ -327,6 +401,143 @@ class TechTrendListView(generics.ListAPIView):
             queryset = queryset.filter(reference_date__gte=start)
 
         return queryset
+
+    def list(self, request, *args, **kwargs):
+        """트렌드 목록을 캐시에서 조회하거나 DB에서 가져옴 (캐시 30분)"""
+        # 결과에 영향을 주는 쿼리 파라미터를 캐시 키에 포함 (tech_stack 중첩 데이터에 job_stack_count 포함)
+        params = request.query_params
+        parts = ('list', *(params.get(name, '') for name in ('tech_stack', 'reference_date', 'days', 'ordering')))
+        data = cached_computation(
+            'trend_list', (NS_TECHSTACK, NS_TRENDS), parts,
+            lambda: super(TechTrendListView, self).list(request, *args, **kwargs).data,
+            timeout=60 * 30,
+        )
+        return Response(data)
+
+
+class TechTrendSeriesView(APIView):
+    """
+    그래프용 트렌드 시계열 (열 단위 응답, 캐시 적용: 30분)
+    요청 예시: GET /api/v1/trends/series/?ids=1,2,3&days=7|30|90|180|365|730&resolution=auto|day|week|month
+    - days: 최근 N일 (기본 30일)
+    - resolution: 기본 auto = 포인트 수가 max_points 이하인 가장 촘촘한 단위 (90일까지 일, 1년까지 주, 그 이상 월)
+      주/월 단위는 미리 집계된 tech_trend_weekly/monthly를 읽으며, 언급 수는 기간 합계
+    - fields: 단위별 지표 키 (series 항목에 id, name과 함께 포함)
+      일: *_mention_count, *_share (해당 날짜 전체 언급량 대비 비율 %)
+      주/월: *_mention_count, *_change_rate (일 평균 기준 직전 주/월 대비 증감률 %)
+    - dates: 선택한 기술 스택 중 하나라도 데이터가 있는 날짜/기간 시작일 (오름차순)
+    - series: 요청한 순서대로 기술 스택별 지표 배열 (dates와 같은 길이, 데이터가 없는 날짜는 null)
+    - 존재하지 않거나 삭제된 기술 스택 ID가 있으면 400
+    행마다 기술 스택 정보를 중첩하는 트렌드 목록(TechTrendListView)과 달리 지표 값만 배열로 반환합니다.
+    """
+    permission_classes = [AllowAny]
+    max_ids = 20
+    max_points = 100
+    DAYS = (7, 30, 90, 180, 365, 730)
+    # 단위별 {응답 키: 컬럼} (tech_trend의 *_change_rate는 전체 대비 비율이라 증감률과 다른 키로 응답)
+    DAILY_FIELDS = {
+        'job_mention_count': 'job_mention_count', 'job_share': 'job_change_rate',
+        'article_mention_count': 'article_mention_count', 'article_share': 'article_change_rate',
+    }
+    PERIOD_FIELDS = {
+        'job_mention_count': 'job_mention_count', 'job_change_rate': 'job_change_rate',
+        'article_mention_count': 'article_mention_count', 'article_change_rate': 'article_change_rate',
+    }
+    # 단위별 (모델, 날짜 필드, 기간 일수, 지표)
+    RESOLUTIONS = {
+        'day': (TechTrend, 'reference_date', 1, DAILY_FIELDS),
+        'week': (TechTrendWeekly, 'period_start', 7, PERIOD_FIELDS),
+        'month': (TechTrendMonthly, 'period_start', 30, PERIOD_FIELDS),
+    }
+
+    @swagger_auto_schema(
+        operation_summary='트렌드 시계열 조회 (그래프용)',
+        manual_parameters=[
+            openapi.Parameter('ids', openapi.IN_QUERY, type=openapi.TYPE_STRING, required=True,
+                              description=f'기술 스택 ID 목록 (쉼표 구분, 최대 {max_ids}개)'),
+            openapi.Parameter('days', openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                              description='최근 N일 (7, 30, 90, 180, 365, 730 / 기본 30)'),
+            openapi.Parameter('resolution', openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                              description='auto(기본), day, week, month'),
+        ],
+    )
+    def get(self, request):
+        try:
+            ids = [int(value) for value in request.query_params.get('ids', '').split(',') if value.strip()]
+        except ValueError:
+            raise ValidationError({'ids': 'ids=1,2,3 형식이어야 합니다.'})
+        ids = list(dict.fromkeys(ids))  # 순서를 유지하며 중복 제거
+        if not ids:
+            raise ValidationError({'ids': '기술 스택 ID를 하나 이상 입력해주세요.'})
+        if len(ids) > self.max_ids:
+            raise ValidationError({'ids': f'기술 스택은 최대 {self.max_ids}개까지 조회할 수 있습니다.'})
+
+        days = request.query_params.get('days')
+        days = int(days) if days in [str(value) for value in self.DAYS] else 30
+        resolution = request.query_params.get('resolution')
+        if resolution not in self.RESOLUTIONS:
+            resolution = self.pick_resolution(days)
+        start_date = timezone.now().date() - timedelta(days=days)
+
+        result = cached_computation(
+            'trend_series', (NS_TECHSTACK, NS_TRENDS),
+            ('series', ','.join(map(str, ids)), start_date, days, resolution),
+            lambda: self.get_series(ids, start_date, days, resolution), timeout=60 * 30,
+        )
+        return Response(result)
+
+    def pick_resolution(self, days):
+        """포인트 수가 max_points 이하가 되는 가장 촘촘한 단위 (없으면 월)"""
+        for resolution, (_, _, period_days, _) in self.RESOLUTIONS.items():
+            if days // period_days + 1 <= self.max_points:
+                return resolution
+        return 'month'
+
+    def get_series(self, ids, start_date, days, resolution='day'):
+        # 기간 내 데이터가 없는 기술 스택도 이름을 돌려주도록 이름은 기술 스택에서 직접 조회
+        names = dict(TechStack.objects.filter(id__in=ids, is_deleted=False).values_list('id', 'name'))
+        unknown = [tech_id for tech_id in ids if tech_id not in names]
+        if unknown:
+            raise ValidationError({'ids': f"존재하지 않는 기술 스택입니다: {', '.join(map(str, unknown))}"})
+
+        model, date_field, _, fields = self.RESOLUTIONS[resolution]
+        queryset = model.objects.filter(tech_stack_id__in=ids)
+        if resolution == 'day':
+            queryset = queryset.filter(reference_date__gte=start_date, is_deleted=False)
+        else:
+            # 시작일이 속한 주/월부터 (첫 기간은 범위 밖 날짜도 포함된 합계)
+            period_start = week_start if resolution == 'week' else month_start
+            queryset = queryset.filter(period_start__gte=period_start(start_date))
+
+        # (tech_stack, 날짜) 유니크 인덱스 범위를 한 번에 읽음
+        rows = queryset.order_by(date_field).values_list('tech_stack_id', date_field, *fields.values())
+
+        dates, values = [], {}
+        for tech_id, reference_date, *metrics in rows:
+            if not dates or dates[-1] != reference_date:
+                dates.append(reference_date)
+            values[(tech_id, reference_date)] = metrics
+
+        series = []
+        for tech_id in ids:
+            points = [values.get((tech_id, date)) for date in dates]
+            series.append({
+                'id': tech_id,
+                'name': names[tech_id],
+                **{
+                    field: [point[i] if point else None for point in points]
+                    for i, field in enumerate(fields)
+                },
+            })
+        return {
+            'days': days,
+            'resolution': resolution,
+            'fields': list(fields),
+            'dates': [date.isoformat() for date in dates],
+            'series': series,
+        }
+
+
 class TrendRankingView(APIView):
     """
     실시간 트렌드 랭킹 조회 (TOP 10)
@@ -0,0 +1,294 @@
+"""
+기술 트렌드 일괄 저장
+StackOverflow 수집 명령(ingest_stackoverflow, analyze_stackoverflow, generate_article_trends)과
+일별 채용공고 트렌드 집계(calculate_daily_trends)의 결과를 행 단위 get_or_create/update_or_create 대신 몇 개의 집합 연산 쿼리로 저장합니다.
+
+- TechTrend: (tech_stack, reference_date) 기준 upsert (unique_daily_trend_per_stack), 지표 종류별로 해당 필드만 갱신
+  (날짜, 기술 스택) 언급 수 행렬을 받아 비율을 trend_math로 한 번에 계산 (save_trend_matrix)
+  월 파티션을 먼저 만들고 월 단위로 나눠 저장 (각 INSERT가 한 파티션에만 들어감)
+- Article: url 기준 upsert, ArticleStack: 새 연결만 bulk insert
+- TechStack.article_stack_count: flush마다 기술별 증가분을 모아 UPDATE 1회
+- CategoryArticle: 새 연결이 생긴 게시글만 커밋 시점에 카테고리 소속 재계산
+"""
+from collections import Counter
+from itertools import groupby
+
+import numpy as np
+from django.db import connection, transaction
+from django.db.models import Case, F, Value, When
+
+from .membership import mark_articles_dirty
+from .models import Article, ArticleStack, TechStack, TechTrend
+from .partitions import ensure_trend_partitions
+from .rollups import refresh_trend_rollups
+from .trend_math import share_of_total
+
+
+ARTICLE_TREND_UPDATE_FIELDS = ['article_mention_count', 'article_change_rate', 'is_deleted', 'updated_at']
+JOB_TREND_UPDATE_FIELDS = ['job_mention_count', 'job_change_rate', 'is_deleted', 'updated_at']
+TREND_UPDATE_FIELDS = {'job': JOB_TREND_UPDATE_FIELDS, 'article': ARTICLE_TREND_UPDATE_FIELDS}
+ARTICLE_SOURCE = 'stackoverflow'
+
+
+def stackoverflow_url(post_id: str) -> str:
+    return f"https://stackoverflow.com/questions/{post_id}"
+
+
+def upsert_tech_trends(trends: list[TechTrend], update_fields: list[str], batch_size: int = 1000) -> int:
+    """
+    TechTrend 목록을 INSERT ... ON CONFLICT (tech_stack_id, reference_date) DO UPDATE로 저장
+    update_fields에 없는 지표(예: 게시글 저장 시 job_*)는 기존 값을 유지합니다.
+    tech_trend가 파티션 테이블이면 저장할 월의 파티션을 먼저 만들고, 월별로 나눠 해당 파티션에 바로 저장합니다.
+    """
+    if not trends:
+        return 0
+    trends = sorted(trends, key=lambda trend: trend.reference_date)
+    ensure_trend_partitions(trends[0].reference_date, trends[-1].reference_date)
+    with transaction.atomic():
+        for _, month_trends in groupby(trends, key=lambda trend: trend.reference_date.replace(day=1)):
+            TechTrend.objects.bulk_create(
+                list(month_trends),
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['tech_stack', 'reference_date'],
+                update_fields=update_fields,
+            )
+    return len(trends)
+
+
+def save_trend_matrix(metric: str, dates: list, stack_ids: list[int], counts, mask=None,
+                      batch_size: int = 1000) -> tuple[int, int]:
+    """
+    (날짜, 기술 스택) 언급 수 행렬을 tech_trend의 {metric}_mention_count, {metric}_change_rate로 저장
+    metric: 'job' | 'article', counts: len(dates) x len(stack_ids) 행렬
+    {metric}_change_rate는 날짜별 전체 언급량 대비 비율(%)이며 (trend_math.share_of_total), 다른 지표는 건드리지 않습니다.
+    mask가 있으면 True인 칸만 저장합니다 (비율의 분모에는 mask 밖의 칸도 포함).
+    (생성 수, 업데이트 수)를 반환합니다.
+    """
+    counts = np.asarray(counts, dtype=np.int64).reshape(len(dates), len(stack_ids))
+    if mask is None:
+        mask = np.ones(counts.shape, dtype=bool)
+    rows, cols = np.nonzero(mask)
+    if not len(rows):
+        return 0, 0
+
+    count_rows, share_rows = counts.tolist(), share_of_total(counts).tolist()
+    trends = [
+        TechTrend(
+            tech_stack_id=stack_ids[col],
+            reference_date=dates[row],
+            is_deleted=False,
+            **{
+                f'{metric}_mention_count': count_rows[row][col],
+                f'{metric}_change_rate': share_rows[row][col],
+            },
+        )
+        for row, col in zip(rows.tolist(), cols.tolist())
+    ]
+
+    existing = set(
+        TechTrend.objects.filter(
+            reference_date__range=(min(dates), max(dates)),
+            tech_stack_id__in=stack_ids,
+        ).values_list('tech_stack_id', 'reference_date')
+    )
+    created_count = sum(1 for t in trends if (t.tech_stack_id, t.reference_date) not in existing)
+
+    upsert_tech_trends(trends, TREND_UPDATE_FIELDS[metric], batch_size)
+    return created_count, len(trends) - created_count
+
+
+def save_job_trends(reference_date, job_counts: dict) -> int:
+    """
+    기준일의 기술별 채용공고 수를 tech_trend의 job_mention_count, job_change_rate로 저장
+    job_counts: {TechStack ID: 채용공고 수} (0건인 기술도 포함)
+    job_change_rate는 전체 기술 언급량 대비 비율(%)이며, 게시글 지표(article_*)는 건드리지 않습니다.
+    """
+    created_count, updated_count = save_trend_matrix(
+        'job', [reference_date], list(job_counts), [list(job_counts.values())]
+    )
+    return created_count + updated_count
+
+
+def save_article_trends(daily_counts: dict, batch_size: int = 1000) -> tuple[int, int]:
+    """
+    날짜별 기술 언급량을 tech_trend의 article_mention_count, article_change_rate로 저장
+    daily_counts: {날짜: {TechStack ID: 언급 게시글 수}}
+    article_change_rate는 해당 날짜 전체 언급량 대비 비율(%)이며, 채용공고 지표(job_*)는 건드리지 않습니다.
+    (생성 수, 업데이트 수)를 반환합니다.
+    """
+    stack_ids = sorted({tech_id for counts in daily_counts.values() for tech_id in counts})
+    if not stack_ids:
+        return 0, 0
+    dates = sorted(daily_counts)
+
+    # 언급이 있던 칸만 저장하고, 삭제된 기술 스택은 저장하지 않음 (비율의 분모에는 포함)
+    active_ids = set(
+        TechStack.objects.filter(id__in=stack_ids, is_deleted=False).values_list('id', flat=True)
+    )
+    counts = np.zeros((len(dates), len(stack_ids)), dtype=np.int64)
+    mask = np.zeros(counts.shape, dtype=bool)
+    col_of = {tech_id: i for i, tech_id in enumerate(stack_ids)}
+    for row, ref_date in enumerate(dates):
+        for tech_id, mention_count in daily_counts[ref_date].items():
+            counts[row, col_of[tech_id]] = mention_count
+            mask[row, col_of[tech_id]] = tech_id in active_ids
+
+    result = save_trend_matrix('article', dates, stack_ids, counts, mask, batch_size)
+    # 여러 날짜가 한꺼번에 바뀌므로 기간별 언급량 합계는 전체, 주/월 단위 집계는 해당 기간만 재계산
+    refresh_trend_rollups(dates[0], dates[-1])
+    return result
+
+
+def add_article_stack_counts(deltas: Counter) -> None:
+    """기술별 article_stack_count 증가분을 UPDATE 1회로 반영"""
+    deltas = {tech_id: n for tech_id, n in deltas.items() if n}
+    if not deltas:
+        return
+    TechStack.objects.filter(id__in=deltas).update(
+        article_stack_count=F('article_stack_count') + Case(
+            *[When(id=tech_id, then=Value(n)) for tech_id, n in deltas.items()],
+            default=Value(0),
+        )
+    )
+
+
+class ArticleWriter:
+    """
+    StackOverflow 게시글(Article/ArticleStack) 버퍼링 writer
+    add()로 쌓다가 batch_size 건마다 flush하며, 마지막에 close()(또는 with 블록 종료)로 남은 건을 저장합니다.
+
+    flush 1회당:
+        - Article: url 기준 upsert (조회수 갱신, 작성일은 값이 있을 때만 갱신)
+        - ArticleStack: 새 연결만 insert (기존 연결은 삭제 여부와 무관하게 유지)
+        - TechStack.article_stack_count: 새로 연결된 기술별 증가분을 UPDATE 1회로 반영
+        - CategoryArticle: 새로 연결된 게시글의 카테고리 소속을 커밋 시점에 재계산
+
+    use_copy=True이고 PostgreSQL이면 psycopg3 COPY로 임시 스테이징 테이블에 적재한 뒤
+    INSERT ... SELECT ... ON CONFLICT로 옮깁니다 (다른 DB에서는 ORM bulk 경로 사용).
+    """
+
+    def __init__(self, batch_size: int = 1000, use_copy: bool = False):
+        self.batch_size = max(1, batch_size)
+        self.use_copy = use_copy and connection.vendor == 'postgresql'
+        self._buffer: dict[str, tuple] = {}
+        self.saved_count = 0
+        self.linked_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+    def add(self, post_id: str, view_count: int, created_at, tech_stack_ids) -> None:
+        # 같은 게시글이 다시 들어오면 마지막 값 우선 (기존 순차 저장과 동일)
+        self._buffer[stackoverflow_url(post_id)] = (view_count, created_at, tuple(tech_stack_ids))
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def close(self) -> None:
+        self.flush()
+
+    def flush(self) -> int:
+        """버퍼의 게시글을 저장하고 저장한 게시글 수를 반환"""
+        if not self._buffer:
+            return 0
+        buffer, self._buffer = self._buffer, {}
+
+        with transaction.atomic():
+            if self.use_copy:
+                new_links = self._flush_copy(buffer)
+            else:
+                new_links = self._flush_orm(buffer)
+            add_article_stack_counts(Counter(tech_id for _, tech_id in new_links))
+            # 새 연결이 생긴 게시글만 커밋 시점에 카테고리 소속(category_article)을 다시 계산
+            mark_articles_dirty({article_id for article_id, _ in new_links})
+
+        self.saved_count += len(buffer)
+        self.linked_count += len(new_links)
+        return len(buffer)
+
+    def _flush_orm(self, buffer: dict) -> list[tuple[int, int]]:
+        # 작성일이 없는 게시글은 기존 external_created_at을 덮어쓰지 않도록 따로 upsert
+        with_date, without_date = [], []
+        for url, (view_count, created_at, _) in buffer.items():
+            article = Article(url=url, source=ARTICLE_SOURCE, view_count=view_count, external_created_at=created_at)
+            (with_date if created_at is not None else without_date).append(article)
+
+        for articles, update_fields in (
+            (with_date, ['view_count', 'external_created_at', 'updated_at']),
+            (without_date, ['view_count', 'updated_at']),
+        ):
+            if articles:
+                Article.objects.bulk_create(
+                    articles,
+                    update_conflicts=True,
+                    unique_fields=['url'],
+                    update_fields=update_fields,
+                )
+
+        article_ids = dict(Article.objects.filter(url__in=buffer).values_list('url', 'id'))
+
+        desired = set()
+        for url, (_, _, tech_stack_ids) in buffer.items():
+            for tech_id in tech_stack_ids:
+                desired.add((article_ids[url], tech_id))
+
+        existing = set(
+            ArticleStack.objects.filter(article_id__in=article_ids.values()).values_list('article_id', 'tech_stack_id')
+        )
+        new_links = sorted(desired - existing)
+        if new_links:
+            ArticleStack.objects.bulk_create(
+                [ArticleStack(article_id=a, tech_stack_id=t) for a, t in new_links],
+                ignore_conflicts=True,
+            )
+        return new_links
+
+    def _flush_copy(self, buffer: dict) -> list[tuple[int, int]]:
+        article_table = Article._meta.db_table
+        link_table = ArticleStack._meta.db_table
+        with connection.cursor() as cursor:
+            # 세션 임시 테이블을 재사용 (트랜잭션이 끝나면 행은 비워짐)
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _article_stage "
+                "(url text, view_count bigint, external_created_at timestamptz) ON COMMIT DELETE ROWS"
+            )
+            cursor.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _article_stack_stage "
+                "(url text, tech_stack_id bigint) ON COMMIT DELETE ROWS"
+            )
+            cursor.execute("TRUNCATE _article_stage, _article_stack_stage")
+
+            with cursor.copy("COPY _article_stage (url, view_count, external_created_at) FROM STDIN") as copy:
+                for url, (view_count, created_at, _) in buffer.items():
+                    copy.write_row((url, view_count, created_at))
+            with cursor.copy("COPY _article_stack_stage (url, tech_stack_id) FROM STDIN") as copy:
+                for url, (_, _, tech_stack_ids) in buffer.items():
+                    for tech_id in tech_stack_ids:
+                        copy.write_row((url, tech_id))
+
+            cursor.execute(
+                f"""
+                INSERT INTO {article_table} (url, source, view_count, external_created_at, created_at, updated_at, is_deleted)
+                SELECT url, %s, view_count, external_created_at, now(), now(), false FROM _article_stage
+                ON CONFLICT (url) DO UPDATE SET
+                    view_count = EXCLUDED.view_count,
+                    external_created_at = COALESCE(EXCLUDED.external_created_at, {article_table}.external_created_at),
+                    updated_at = EXCLUDED.updated_at
+                """,
+                [ARTICLE_SOURCE],
+            )
+            # ON CONFLICT DO NOTHING의 RETURNING은 실제로 insert된 연결만 반환
+            cursor.execute(
+                f"""
+                INSERT INTO {link_table} (article_id, tech_stack_id, created_at, updated_at, is_deleted)
+                SELECT a.id, s.tech_stack_id, now(), now(), false
+                FROM _article_stack_stage s JOIN {article_table} a ON a.url = s.url
+                ON CONFLICT (article_id, tech_stack_id) DO NOTHING
+                RETURNING article_id, tech_stack_id
+                """
+            )
+            return cursor.fetchall()
@@ -62,6 +62,7 @@ INSTALLED_APPS = [
     'storages',
 
     # 프로젝트 앱
+    'apps.common',
     'apps.users',
     'apps.trends',
     'apps.jobs',
@@ -216,8 +217,18 @@ CELERY_BEAT_SCHEDULE = {
         'task': 'apps.jobs.tasks.calculate_daily_trends',
         'schedule': crontab(hour=23, minute=50),
     },
+
+    # 3. tech_trend 파티션 관리 (매월 1일 새벽 3:00) - 다음 달 파티션 생성, 보관 기간 지난 파티션 분리
+    'monthly-trend-partitions': {
+        'task': 'apps.jobs.tasks.maintain_trend_partitions',
+        'schedule': crontab(day_of_month=1, hour=3, minute=0),
+    },
 }
 
+# tech_trend 파티션 보관 기간 (개월), 설정하면 지난 파티션을 분리해 별도 테이블로 보관
+# 분리된 기간은 API/백필 조회에서 빠지므로 기본값은 0 (분리 안 함), 필요할 때만 명시적으로 설정
+TECH_TREND_RETENTION_MONTHS = config('TECH_TREND_RETENTION_MONTHS', default=0, cast=int)
+
 # 캐시 설정 (Redis)
 CACHES = {
     'default': {